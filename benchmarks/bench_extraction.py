@@ -0,0 +1,187 @@
+"""
+기사 본문 추출 CPU 벤치마크
+
+기존 soup.find 연쇄 방식(html.parser)과 단일 순회 추출 엔진의 기사당 CPU 시간을 비교합니다.
+네트워크 없이 합성 기사 페이지를 사용하며, 두 방식의 추출 결과가 같은지도 함께 확인합니다.
+
+    python benchmarks/bench_extraction.py [--rounds 20]
+"""
+import argparse
+import random
+import re
+import time
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlparse
+
+from mcp_naver_news.utils.extraction_engine import default_engine
+
+
+def legacy_parse(html: str, url: str) -> Dict[str, str]:
+    """단일 순회 엔진 도입 전의 parse_article_html (비교 기준)"""
+    # 비교 기준에만 필요하므로 개발 의존성(pip install -e .[dev])으로 설치되며, 다른 벤치마크가 이 모듈을 불러올 때는 필요 없음
+    from bs4 import BeautifulSoup
+
+    domain = urlparse(url).netloc
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('title').text.strip() if soup.find('title') else ''
+    content = ''
+    if 'news.naver.com' in domain:
+        article = soup.find('div', id='newsct_article') or soup.find('div', id='articeBody')
+        if article:
+            for element in article.find_all(['script', 'style', 'iframe', 'ins']):
+                element.decompose()
+            content = article.get_text(strip=True)
+    elif 'nspna.com' in domain:
+        article = (
+            soup.find('div', id='articleBody') or
+            soup.find('div', class_='article-body') or
+            soup.find('div', class_='article-content') or
+            soup.find('article')
+        )
+        if article:
+            for element in article.find_all(['script', 'style', 'iframe', 'ins', 'div', 'class']):
+                element.decompose()
+            content = article.get_text(strip=True)
+    elif 'yna.co.kr' in domain:
+        article = soup.find('article', class_='story-news')
+        if article:
+            content = article.get_text(strip=True)
+    elif 'hankyung.com' in domain:
+        article = soup.find('div', id='articletxt')
+        if article:
+            content = article.get_text(strip=True)
+    else:
+        article = soup.find('article') or soup.find('div', class_=re.compile('article|content|body'))
+        if article:
+            content = article.get_text(strip=True)
+    if not content:
+        article = soup.find('div', id='articleBody', class_=lambda x: x and 'view_con' in x)
+        if article:
+            for element in article.find_all(['script', 'style', 'iframe', 'ins']):
+                element.decompose()
+            content = article.get_text(strip=True)
+        if not content:
+            candidate_selectors = [
+                {'id': 'articleBody'}, {'class_': 'article-body'}, {'class_': 'article-content'},
+                {'class_': 'view_con'}, {'id': 'news_content'}, {'id': 'content'}, {'id': 'textBody'},
+                {'id': 'article_content'}, {'id': 'article'}, {'class_': 'article'},
+                {'id': 'article-view-content-div'}, {'name': 'article'}, {'name': 'section', 'class_': 'article'},
+            ]
+            for sel in candidate_selectors:
+                if 'id' in sel and 'class_' in sel:
+                    article = soup.find(sel.get('name', 'div'), id=sel['id'], class_=sel['class_'])
+                elif 'id' in sel:
+                    article = soup.find(id=sel['id'])
+                elif 'class_' in sel:
+                    article = soup.find(class_=sel['class_'])
+                elif 'name' in sel and 'class_' in sel:
+                    article = soup.find(sel['name'], class_=sel['class_'])
+                elif 'name' in sel:
+                    article = soup.find(sel['name'])
+                else:
+                    article = None
+                if article:
+                    for element in article.find_all(['script', 'style', 'iframe', 'ins']):
+                        element.decompose()
+                    content = article.get_text(strip=True)
+                    if content:
+                        break
+    if content and len(content) < 100:
+        content = ''
+    if not content:
+        error_msg = '본문 내용을 찾을 수 없습니다.'
+        return {
+            'title': title,
+            'content': '',
+            'error': error_msg
+        }
+    return {
+        'title': title,
+        'content': content,
+        'error': ''
+    }
+
+WORDS = ["정부", "발표", "시장", "기업", "투자", "반도체", "수출", "금리", "전망", "분석", "경제", "증가", "감소", "지난해"]
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    return "".join(
+        f"<p>{' '.join(rng.choice(WORDS) for _ in range(40))}.</p><script>var ad{i}=1;</script>"
+        for i in range(count)
+    )
+
+
+def _chrome(rng: random.Random) -> Tuple[str, str]:
+    """실제 언론사 페이지처럼 본문 앞뒤에 붙는 메뉴/광고/관련기사 영역"""
+    nav = "".join(
+        f'<li class="menu-item item-{i}"><a href="/section/{i}">{rng.choice(WORDS)}</a></li>'
+        for i in range(120)
+    )
+    related = "".join(
+        f'<div class="related-box"><span class="tit">{rng.choice(WORDS)}</span><img src="/{i}.jpg"></div>'
+        for i in range(80)
+    )
+    header = f'<header><ul class="gnb">{nav}</ul></header><div class="ad"><ins>광고</ins></div>'
+    footer = f'<aside>{related}</aside><footer><p>Copyright</p></footer>'
+    return header, footer
+
+
+# 도메인 규칙, 기본 규칙, 대체 선택자 경로를 모두 거치는 기사 URL과 본문 영역 템플릿
+ARTICLE_TEMPLATES = [
+    ("https://n.news.naver.com/mnews/article/001/0001", '<div id="newsct_article">{}</div>'),
+    ("https://www.nspna.com/news/?mode=view&newsid=1", '<div class="article-body">{}</div>'),
+    ("https://www.yna.co.kr/view/AKR1", '<article class="story-news">{}</article>'),
+    ("https://www.hankyung.com/article/1", '<div id="articletxt">{}</div>'),
+    ("https://www.example-daily.co.kr/news/1", '<div class="article_txt">{}</div>'),
+    ("https://www.example-times.com/news/2", '<section><div id="article-view-content-div">{}</div></section>'),
+    ("https://www.example-post.kr/3", '<div id="textBody">{}</div>'),
+]
+
+
+def build_page(rng: random.Random, template: str, paragraphs: Callable[[random.Random], str]) -> str:
+    """메뉴/광고 영역과 template 본문 영역으로 이루어진 기사 페이지"""
+    header, footer = _chrome(rng)
+    return (
+        f"<html><head><title>{rng.choice(WORDS)} 기사 제목</title>"
+        f"<style>body{{margin:0}}</style></head><body>{header}"
+        f"{template.format(paragraphs(rng))}{footer}</body></html>"
+    )
+
+
+def build_corpus(seed: int = 7) -> List[Tuple[str, str]]:
+    """도메인 규칙, 기본 규칙, 대체 선택자 경로를 모두 거치는 합성 기사 목록"""
+    rng = random.Random(seed)
+    return [(url, build_page(rng, template, lambda rng: _paragraphs(rng, 25))) for url, template in ARTICLE_TEMPLATES]
+
+
+def measure(parse: Callable[[str, str], Dict[str, str]], corpus: List[Tuple[str, str]], rounds: int) -> float:
+    """기사 한 건당 평균 CPU 시간(ms)을 반환합니다."""
+    start = time.process_time()
+    for _ in range(rounds):
+        for url, html in corpus:
+            parse(html, url)
+    return (time.process_time() - start) * 1000 / (rounds * len(corpus))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    for url, html in corpus:
+        before, after = legacy_parse(html, url), default_engine.extract(html, url)
+        if before != after:
+            raise SystemExit(f"추출 결과 불일치: {url}")
+
+    before_ms = measure(legacy_parse, corpus, args.rounds)
+    after_ms = measure(default_engine.extract, corpus, args.rounds)
+    size_kb = sum(len(html.encode()) for _, html in corpus) / len(corpus) / 1024
+    print(f"기사 {len(corpus)}건 x {args.rounds}회, 평균 {size_kb:.0f}KB")
+    print(f"기존 soup.find 연쇄 (html.parser): {before_ms:8.2f} ms/기사")
+    print(f"단일 순회 엔진 (lxml):                {after_ms:8.2f} ms/기사")
+    print(f"개선: {before_ms / after_ms:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
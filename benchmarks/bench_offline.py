@@ -0,0 +1,269 @@
+"""
+오프라인 종단 간 벤치마크
+
+로컬 가짜 네이버 API/언론사 서버(fake_naver.py)를 별도 프로세스로 실행하고, 실제 서버와 같은
+컨텍스트(속도 제한기, 캐시, 기사 수집 풀)로 search_news, search_news_detail 도구와
+기사 본문 추출(다운로드 + 파싱)의 처리량, p50/p99 지연 시간, 메모리 사용량을 측정합니다.
+검색 캐시가 적중하지 않도록 요청마다 다른 검색어를 사용하고, 기사 캐시와 API 한도는 끕니다.
+--json으로 결과를 저장하면 변경 전후를 비교할 수 있습니다.
+
+    python benchmarks/bench_offline.py [--requests 200] [--concurrency 10] [--json result.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+from fake_naver import HostRewriteTransport, PageCorpus
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_server(port: int, args: argparse.Namespace) -> subprocess.Popen:
+    """가짜 서버를 별도 프로세스로 실행하고 준비될 때까지 기다립니다. (측정 대상과 CPU를 나눠 쓰지 않도록)"""
+    command = [
+        sys.executable, os.path.join(HERE, "fake_naver.py"),
+        "--port", str(port),
+        "--api-latency-ms", str(args.api_latency_ms),
+        "--page-latency-ms", str(args.page_latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--duplicate-ratio", str(args.duplicate_ratio),
+        "--dead-hosts", str(args.dead_hosts),
+    ]
+    if args.recorded:
+        command += ["--recorded", args.recorded]
+    if args.pages:
+        command += ["--pages", args.pages]
+    process = subprocess.Popen(command)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("가짜 서버가 시작되지 않았습니다.")
+
+
+def configure_env(base_url: str, directory: str, prefetch_top_k: int = 0) -> None:
+    """
+    가짜 서버를 사용하고 캐시/한도가 측정에 끼어들지 않도록 환경 변수를 설정합니다.
+
+    미리 받기(prefetch_top_k)는 기사 캐시로 결과를 전달하므로 이때만 임시 기사 캐시를 사용합니다.
+    """
+    os.environ.update({
+        "X_NAVER_CLIENT_ID": os.environ.get("X_NAVER_CLIENT_ID", "bench"),
+        "X_NAVER_CLIENT_SECRET": os.environ.get("X_NAVER_CLIENT_SECRET", "bench"),
+        "NAVER_NEWS_BASE_URL": f"{base_url}/v1/search/news.json",
+        "NAVER_NEWS_ARTICLE_CACHE_PATH": os.path.join(directory, "articles.sqlite3") if prefetch_top_k else "",
+        "NAVER_NEWS_PREFETCH_TOP_K": str(prefetch_top_k),
+        "NAVER_NEWS_ARCHIVE_PATH": os.path.join(directory, "archive.sqlite3"),
+        "NAVER_NEWS_API_QUOTA_STATE_PATH": os.path.join(directory, "quota.json"),
+        "NAVER_NEWS_API_DAILY_QUOTA": str(10 ** 9),
+        "NAVER_NEWS_API_RATE_PER_SECOND": str(10 ** 6),
+        "NAVER_NEWS_API_BURST": str(10 ** 6),
+        "NAVER_NEWS_STATE_STORE": "",
+    })
+
+
+def build_context(base_url: str):
+    """기사 요청을 가짜 서버로 보내는 공용 NaverNewsContext를 생성하여 도구가 사용하도록 등록합니다."""
+    from mcp_naver_news import server
+    from mcp_naver_news.config import NaverNewsConfig
+    from mcp_naver_news.utils.http import ARTICLE_HEADERS
+
+    config = NaverNewsConfig.from_env()
+    # build_async_client와 같은 풀 설정
+    limits = httpx.Limits(
+        max_connections=max(config.fetch_concurrency, config.http_pool_maxsize),
+        max_keepalive_connections=config.http_pool_connections
+    )
+    article_client = httpx.AsyncClient(
+        headers=ARTICLE_HEADERS,
+        transport=HostRewriteTransport(base_url, httpx.AsyncHTTPTransport(retries=config.http_max_retries, limits=limits)),
+        follow_redirects=True,
+        timeout=10
+    )
+    # 도구의 fallback 경로(get_naver_news_context)가 이 컨텍스트를 사용
+    server._context = server.NaverNewsContext(article_client=article_client)
+    return server._context
+
+
+async def run_scenario(
+    name: str,
+    operation: Callable[[int], Awaitable[bool]],
+    total: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """
+    작업을 total번(동시에 concurrency개씩) 실행하고 처리량, 지연 시간, 메모리를 반환합니다.
+
+    operation(i)는 성공 여부를 반환하며, 예외도 실패로 셉니다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def one(index: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ok = await operation(index)
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            failures += 0 if ok else 1
+
+    # 연결 수립/지연 로딩은 측정에서 제외
+    await asyncio.gather(*(one(-1 - i) for i in range(min(concurrency, total))))
+    latencies.clear()
+    failures = 0
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+    measured = list(latencies)
+
+    # 메모리는 일부 작업만 tracemalloc으로 따로 측정 (추적 비용이 처리량에 섞이지 않도록)
+    tracemalloc.start()
+    await asyncio.gather(*(one(total + i) for i in range(min(concurrency * 2, total))))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(measured, n=100, method="inclusive") if len(measured) > 1 else measured * 99
+    return {
+        "scenario": name,
+        "ops": total,
+        "concurrency": concurrency,
+        "ops_per_second": round(total / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 1),
+        "p99_ms": round(quantiles[98] * 1000, 1),
+        "errors": failures,
+        "traced_peak_mb": round(peak / 2 ** 20, 2),
+    }
+
+
+def max_rss_mb() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    return round(usage / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1)
+
+
+async def run(args: argparse.Namespace, base_url: str) -> List[Dict[str, Any]]:
+    from mcp_naver_news.tools.news_tools import search_news, search_news_detail
+    from mcp_naver_news.utils.article_extractor import aextract_article_content
+
+    context = build_context(base_url)
+    corpus = PageCorpus.from_directory(args.pages) if args.pages else PageCorpus.synthetic()
+    hosts = list(corpus.pages)
+
+    async def search(index: int) -> bool:
+        result = await search_news(query=f"bench {index}", display=args.display)
+        return len(json.loads(result.text)) == args.display
+
+    async def detail(index: int, query: str = "detail") -> bool:
+        result = await search_news_detail(query=f"{query} {index}", display=args.detail_display, dedupe=not args.no_dedupe)
+        items = json.loads(result.text)
+        return bool(items) and not any(item["본문"].startswith("본문 추출 실패") for item in items)
+
+    async def research(index: int) -> bool:
+        # 모델이 search_news 결과를 읽고 search_news_detail을 호출하기까지의 시간을 think_ms로 흉내
+        await search_news(query=f"research {index}", display=args.detail_display)
+        await asyncio.sleep(args.think_ms / 1000)
+        return await detail(index, "research")
+
+    async def extract(index: int) -> bool:
+        url = f"https://{hosts[index % len(hosts)]}/article/bench-{index}"
+        result = await aextract_article_content(url, client=context.article_client, engine=context.extraction_engine)
+        return not result["error"]
+
+    results = []
+    try:
+        for name, operation, total, concurrency in [
+            ("search_news", search, args.requests, args.concurrency),
+            ("search_news_detail", detail, max(1, args.requests // 10), max(1, args.concurrency // 2)),
+            ("search_then_detail", research, max(1, args.requests // 10), max(1, args.concurrency // 2)),
+            ("extraction", extract, args.requests, args.concurrency),
+        ]:
+            if args.only and name not in args.only:
+                continue
+            result = await run_scenario(name, operation, total, concurrency)
+            result["max_rss_mb"] = max_rss_mb()
+            results.append(result)
+    finally:
+        await context.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수 (search_news_detail, search_then_detail은 1/10)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--display", type=int, default=10, help="search_news 결과 수")
+    parser.add_argument("--detail-display", type=int, default=10, help="search_news_detail 결과 수")
+    parser.add_argument("--api-latency-ms", type=float, default=30)
+    parser.add_argument("--page-latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.3, help="합성 검색 결과 중 중복 기사 비율")
+    parser.add_argument("--dead-hosts", type=int, default=0, help="기사 페이지에 응답하지 않는 언론사 호스트 수 (꼬리 지연 측정용)")
+    parser.add_argument("--no-dedupe", action="store_true", help="search_news_detail의 중복 기사 묶기를 끔 (비교용)")
+    parser.add_argument("--prefetch-top-k", type=int, default=0, help="search_news 뒤 본문을 미리 받을 상위 기사 수 (0이면 끔)")
+    parser.add_argument("--think-ms", type=float, default=1000, help="search_then_detail에서 두 도구 호출 사이의 간격")
+    parser.add_argument("--recorded", help="녹화한 news.json 응답 파일")
+    parser.add_argument("--pages", help="{호스트}/*.html 형식으로 저장한 기사 페이지 디렉터리")
+    parser.add_argument("--only", nargs="*", choices=["search_news", "search_news_detail", "search_then_detail", "extraction"])
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+    # 도구 호출마다 출력되는 컨텍스트 경고는 숨김
+    logging.getLogger("mcp-naver-news").setLevel(logging.ERROR)
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = start_fake_server(port, args)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            configure_env(base_url, directory, args.prefetch_top_k)
+            results = asyncio.run(run(args, base_url))
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            # 응답하지 않는 호스트(--dead-hosts)의 요청이 남아 있으면 정상 종료를 기다리지 않음
+            process.kill()
+            process.wait()
+
+    print(f"{'scenario':<20}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'traced MB':>11}{'max RSS MB':>12}")
+    for r in results:
+        print(
+            f"{r['scenario']:<20}{r['ops_per_second']:>10}{r['p50_ms']:>10}{r['p99_ms']:>10}"
+            f"{r['errors']:>8}{r['traced_peak_mb']:>11}{r['max_rss_mb']:>12}"
+        )
+    if args.json:
+        settings = {key: value for key, value in vars(args).items() if key != "json"}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"settings": settings, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
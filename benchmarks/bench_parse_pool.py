@@ -0,0 +1,59 @@
+"""
+HTML 파싱 처리량 벤치마크
+
+같은 기사 묶음을 이벤트 루프 스레드 파싱(기본값)과 파싱 작업자 풀로 각각 처리하여
+초당 기사 수를 비교합니다. 작업자 수를 늘리면 사용 가능한 CPU 코어 수까지 처리량이 늘어야 합니다.
+
+    python benchmarks/bench_parse_pool.py [--articles 400] [--workers 4] [--mode auto]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from bench_extraction import build_corpus
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.extraction_engine import default_engine
+from mcp_naver_news.utils.parse_pool import ParsePool, parse_document
+
+
+async def run_threads(jobs) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(asyncio.to_thread(parse_document, default_engine, data, url, None) for url, data in jobs))
+    return time.perf_counter() - started
+
+
+async def run_pool(pool: ParsePool, jobs) -> float:
+    # 작업자 시작 시간은 제외
+    await asyncio.gather(*(pool.parse(data, url) for url, data in jobs[:pool.workers]))
+    started = time.perf_counter()
+    await asyncio.gather(*(pool.parse(data, url) for url, data in jobs))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--mode", default="auto", choices=["auto", "process", "thread"])
+    args = parser.parse_args()
+
+    corpus = [(url, html.encode()) for url, html in build_corpus()]
+    jobs = [corpus[i % len(corpus)] for i in range(args.articles)]
+    config = NaverNewsConfig(client_id="bench", client_secret="bench")
+
+    baseline = asyncio.run(run_threads(jobs))
+    pool = ParsePool(config, args.workers, args.mode)
+    try:
+        pooled = asyncio.run(run_pool(pool, jobs))
+    finally:
+        pool.close()
+
+    print(f"기사 {len(jobs)}건, CPU {os.cpu_count()}개")
+    print(f"기본 (asyncio.to_thread):       {len(jobs) / baseline:8.1f} 기사/초")
+    print(f"작업자 풀 ({pool.mode} x {args.workers}):{' ' * max(0, 12 - len(pool.mode) - len(str(args.workers)))}{len(jobs) / pooled:8.1f} 기사/초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+서버 시작 시간 벤치마크
+
+stdio MCP 서버는 클라이언트 세션마다 새 프로세스로 실행되므로, 새 파이썬 프로세스에서
+모듈 import 시간과 initialize / tools/list 응답까지 걸린 시간을 각각 측정합니다.
+네트워크에 접속하지 않으며, 캐시 파일은 임시 디렉터리에 만듭니다.
+
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import mcp_naver_news.server; "
+    "print(time.perf_counter() - started)"
+)
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "bench", "version": "0"}}
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+LIST_TOOLS = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def bench_env(directory: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "X_NAVER_CLIENT_ID": env.get("X_NAVER_CLIENT_ID", "bench"),
+        "X_NAVER_CLIENT_SECRET": env.get("X_NAVER_CLIENT_SECRET", "bench"),
+        "TRANSPORT": "stdio",
+        "NAVER_NEWS_ARTICLE_CACHE_PATH": os.path.join(directory, "articles.sqlite3"),
+        "NAVER_NEWS_API_QUOTA_STATE_PATH": os.path.join(directory, "quota.json"),
+    })
+    return env
+
+
+def measure_import(env: dict) -> float:
+    output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def measure_handshake(env: dict) -> tuple:
+    """프로세스 시작부터 initialize 응답, tools/list 응답까지의 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from mcp_naver_news.server import main; main()"],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE) + "\n")
+        process.stdin.flush()
+        json.loads(process.stdout.readline())
+        initialized = time.perf_counter() - started
+        process.stdin.write(json.dumps(INITIALIZED) + "\n" + json.dumps(LIST_TOOLS) + "\n")
+        process.stdin.flush()
+        tools = json.loads(process.stdout.readline())["result"]["tools"]
+        listed = time.perf_counter() - started
+    finally:
+        # stdio 서버는 입력이 닫혀도 바로 종료되지 않으므로 측정 후 종료
+        process.kill()
+        process.wait()
+    return initialized, listed, len(tools)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = bench_env(directory)
+        # 바이트코드 캐시 생성은 측정에서 제외
+        measure_import(env)
+        imports = [measure_import(env) for _ in range(args.runs)]
+        handshakes = [measure_handshake(env) for _ in range(args.runs)]
+
+    print(f"server import: median {statistics.median(imports) * 1000:.0f} ms")
+    print(f"initialize 응답: median {statistics.median(h[0] for h in handshakes) * 1000:.0f} ms")
+    print(f"tools/list 응답: median {statistics.median(h[1] for h in handshakes) * 1000:.0f} ms ({handshakes[0][2]} tools)")
+
+
+if __name__ == "__main__":
+    main()
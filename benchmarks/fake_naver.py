@@ -0,0 +1,270 @@
+"""
+네이버 검색 API와 언론사 기사 페이지를 흉내 내는 로컬 서버 (오프라인 벤치마크용)
+
+- GET /v1/search/news.json: 녹화한 news.json 응답(--recorded) 또는 합성 검색 결과
+- GET /pages/{호스트}/{경로}: 저장한 기사 HTML(--pages) 또는 합성 기사 페이지 (본문은 경로마다 다르고, 경로가
+  같으면 호스트가 달라도 같은 본문이므로 통신사 기사를 옮겨 실은 중복 기사처럼 동작)
+- GET /health: 준비 확인
+
+응답마다 지정한 지연 시간과 무작위 편차를 적용합니다. 클라이언트는 NAVER_NEWS_BASE_URL을
+http://127.0.0.1:{포트}/v1/search/news.json으로 지정하고, 기사 요청은 HostRewriteTransport로
+/pages/{호스트}{경로}에 보냅니다.
+
+    python benchmarks/fake_naver.py [--port 8900] [--api-latency-ms 30] [--page-latency-ms 80] [--jitter-ms 20] [--dead-hosts 0]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+from bench_extraction import ARTICLE_TEMPLATES, build_page
+
+# 합성 검색 결과에서 네이버 뉴스 링크를 함께 제공하는 비율 (나머지는 언론사 링크만)
+NAVER_LINK_EVERY = 2
+
+# 합성 검색 결과 중 앞 기사를 다른 언론사가 옮겨 실은 중복 기사의 비율 (제목, 요약, 본문이 같음)
+DUPLICATE_RATIO = 0.3
+
+# 합성 페이지에서 경로별 본문으로 바꿀 자리
+BODY_MARKER = "\x00"
+
+# 합성 기사 제목/요약 단어
+TOPIC_WORDS = [
+    "정부", "발표", "시장", "기업", "투자", "반도체", "수출", "금리", "전망", "분석", "경제", "증가", "감소", "지난해",
+    "배터리", "부동산", "환율", "증시", "코스피", "물가", "고용", "무역", "협상", "규제", "예산", "국회", "인공지능",
+    "자동차", "조선", "철강", "항공", "유통", "게임", "바이오", "신약", "플랫폼", "통신", "원전", "태양광", "수소",
+]
+
+
+def story_paragraphs(key: str, count: int = 25) -> str:
+    """경로(key)로 결정되는 기사 본문 문단 (기사마다 단어 구성이 달라 본문 지문이 겹치지 않음)"""
+    rng = random.Random(zlib.crc32(key.encode()))
+    vocabulary = ["".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 3))) for _ in range(400)]
+    return "".join(
+        f"<p>{' '.join(rng.choice(vocabulary) for _ in range(40))}.</p><script>var ad{i}=1;</script>"
+        for i in range(count)
+    )
+
+
+class PageCorpus:
+    """호스트별 기사 HTML 모음. 같은 호스트의 다른 경로는 파일을 돌아가며 사용합니다."""
+
+    def __init__(self, pages: Dict[str, List[str]]):
+        self.pages = pages
+        # 알 수 없는 호스트는 대체 선택자 경로를 거치는 마지막 합성 페이지로 응답
+        self.default = next(reversed(pages.values()))[0]
+
+    @classmethod
+    def synthetic(cls, seed: int = 7) -> "PageCorpus":
+        """bench_extraction의 언론사별 페이지 구조에 경로별 본문을 채워 넣는 합성 페이지"""
+        rng = random.Random(seed)
+        pages: Dict[str, List[str]] = {}
+        for url, template in ARTICLE_TEMPLATES:
+            pages.setdefault(httpx.URL(url).host, []).append(build_page(rng, template, lambda rng: BODY_MARKER))
+        return cls(pages)
+
+    @classmethod
+    def from_directory(cls, directory: str) -> "PageCorpus":
+        """{directory}/{호스트}/*.html 형식으로 저장한 기사 페이지를 불러옵니다."""
+        pages: Dict[str, List[str]] = {}
+        for host in sorted(os.listdir(directory)):
+            folder = os.path.join(directory, host)
+            if not os.path.isdir(folder):
+                continue
+            for name in sorted(os.listdir(folder)):
+                if name.endswith(".html"):
+                    with open(os.path.join(folder, name), encoding="utf-8", errors="replace") as f:
+                        pages.setdefault(host.lower(), []).append(f.read())
+        if not pages:
+            raise ValueError(f"{directory}에 {{호스트}}/*.html 기사 페이지가 없습니다.")
+        return cls(pages)
+
+    @property
+    def publisher_hosts(self) -> List[str]:
+        return [host for host in self.pages if not host.endswith("naver.com")] or list(self.pages)
+
+    def lookup(self, host: str, path: str) -> str:
+        """호스트(없으면 같은 상위 도메인, 예: m.hankyung.com → www.hankyung.com)의 페이지를 반환합니다."""
+        host = host.lower()
+        pages = self.pages.get(host)
+        if pages is None:
+            parent = host.split(".", 1)[-1]
+            pages = next((p for h, p in self.pages.items() if h.split(".", 1)[-1] == parent), None)
+        page = self.default if pages is None else pages[zlib.crc32(path.encode()) % len(pages)]
+        # 합성 페이지 본문은 기사 ID(경로 마지막 부분)로 결정되어 언론사 원문과 네이버 뉴스 페이지가 같음
+        return page.replace(BODY_MARKER, story_paragraphs(path.rsplit("/", 1)[-1])) if BODY_MARKER in page else page
+
+
+def synthetic_items(
+    corpus: PageCorpus,
+    query: str,
+    start: int,
+    display: int,
+    duplicate_ratio: float = DUPLICATE_RATIO
+) -> List[Dict[str, str]]:
+    """
+    검색어와 순위로 결정되는 합성 검색 결과 항목 (같은 요청이면 같은 결과)
+
+    duplicate_ratio 비율의 항목은 앞 기사를 다른 언론사가 옮겨 실은 중복 기사로,
+    제목/요약/기사 ID가 원래 기사와 같습니다.
+    """
+    key = zlib.crc32(query.encode())
+    hosts = corpus.publisher_hosts
+
+    def story(rank: int) -> int:
+        while rank > 1 and random.Random(key * 1000 + rank).random() < duplicate_ratio:
+            rank -= 1
+        return rank
+
+    items = []
+    for rank in range(start, start + display):
+        number = story(rank)
+        words = random.Random(key * 1000 + number).sample(TOPIC_WORDS, 10)
+        host = hosts[rank % len(hosts)]
+        article_id = f"{key % 10**7:07d}{number:03d}"
+        original = f"https://{host}/article/{article_id}"
+        link = f"https://n.news.naver.com/mnews/article/{rank % 1000:03d}/{article_id}" if rank % NAVER_LINK_EVERY == 0 else original
+        items.append({
+            "title": f"{query} {' '.join(words[:4])}",
+            "originallink": original,
+            "link": link,
+            "description": f"{' '.join(words[4:])} <b>{query}</b> 관련 소식이 전해졌다.",
+            "pubDate": "Mon, 13 Oct 2025 09:00:00 +0900"
+        })
+    return items
+
+
+def build_app(
+    corpus: PageCorpus,
+    api_latency: float = 0.03,
+    page_latency: float = 0.08,
+    jitter: float = 0.02,
+    recorded: Optional[Dict] = None,
+    seed: int = 7,
+    duplicate_ratio: float = DUPLICATE_RATIO,
+    dead_hosts: Sequence[str] = ()
+) -> Starlette:
+    """
+    가짜 네이버 API/언론사 서버 앱을 생성합니다.
+
+    Args:
+        corpus (PageCorpus): 기사 페이지 모음
+        api_latency (float): 검색 API 응답 지연(초)
+        page_latency (float): 기사 페이지 응답 지연(초)
+        jitter (float): 지연 시간의 무작위 편차(±초)
+        recorded (Dict, optional): 녹화한 news.json 응답 (항목을 start/display에 맞게 잘라 반환)
+        seed (int): 지연 편차 난수 시드
+        duplicate_ratio (float): 합성 검색 결과 중 중복 기사 비율
+        dead_hosts (Sequence[str]): 기사 페이지 요청에 응답하지 않는 언론사 호스트 (하위 호스트 포함)
+    """
+    rng = random.Random(seed)
+    # 모바일/인쇄용 호스트로 바꾼 요청도 같은 언론사로 봄
+    dead = tuple(host.removeprefix("www.") for host in dead_hosts)
+
+    async def delay(latency: float) -> None:
+        await asyncio.sleep(max(0.0, latency + rng.uniform(-jitter, jitter)))
+
+    async def news(request: Request) -> Response:
+        await delay(api_latency)
+        query = request.query_params.get("query", "")
+        start = int(request.query_params.get("start", "1"))
+        display = int(request.query_params.get("display", "10"))
+        if recorded is not None:
+            items = recorded.get("items", [])[start - 1:start - 1 + display]
+            total = recorded.get("total", len(recorded.get("items", [])))
+        else:
+            total = 1000
+            items = synthetic_items(corpus, query, start, min(display, max(0, total - start + 1)), duplicate_ratio)
+        return JSONResponse({
+            "lastBuildDate": "Mon, 13 Oct 2025 09:00:00 +0900",
+            "total": total,
+            "start": start,
+            "display": len(items),
+            "items": items
+        })
+
+    async def page(request: Request) -> Response:
+        host = request.path_params["host"]
+        if any(host == domain or host.endswith(f".{domain}") for domain in dead):
+            # 연결은 받지만 응답하지 않는 언론사 서버
+            await asyncio.sleep(3600)
+        await delay(page_latency)
+        html = corpus.lookup(request.path_params["host"], request.path_params["path"])
+        return Response(html.encode("utf-8"), media_type="text/html; charset=utf-8")
+
+    async def health(request: Request) -> Response:
+        return PlainTextResponse("ok")
+
+    return Starlette(routes=[
+        Route("/v1/search/news.json", news),
+        Route("/pages/{host}/{path:path}", page),
+        Route("/health", health),
+    ])
+
+
+class HostRewriteTransport(httpx.AsyncBaseTransport):
+    """모든 요청을 가짜 서버의 /pages/{호스트}{경로}로 보내는 전송 계층 (언론사 규칙은 원래 URL 기준으로 적용됨)"""
+
+    def __init__(self, base_url: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = httpx.URL(base_url)
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = self.base_url.copy_with(
+            path=f"/pages/{request.url.host}{request.url.path}",
+            query=request.url.query or None
+        )
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--api-latency-ms", type=float, default=30)
+    parser.add_argument("--page-latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--recorded", help="녹화한 news.json 응답 파일")
+    parser.add_argument("--pages", help="{호스트}/*.html 형식으로 저장한 기사 페이지 디렉터리")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--duplicate-ratio", type=float, default=DUPLICATE_RATIO, help="합성 검색 결과 중 중복 기사 비율")
+    parser.add_argument("--dead-hosts", type=int, default=0, help="기사 페이지에 응답하지 않는 언론사 호스트 수")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = parse_args()
+    corpus = PageCorpus.from_directory(args.pages) if args.pages else PageCorpus.synthetic()
+    recorded = None
+    if args.recorded:
+        with open(args.recorded, encoding="utf-8") as f:
+            recorded = json.load(f)
+    app = build_app(
+        corpus,
+        api_latency=args.api_latency_ms / 1000,
+        page_latency=args.page_latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        recorded=recorded,
+        seed=args.seed,
+        duplicate_ratio=args.duplicate_ratio,
+        # 검색 순위 1위 기사의 언론사부터 (합성 결과는 순위 r에 publisher_hosts[r % 호스트 수]를 씀)
+        dead_hosts=(corpus.publisher_hosts[1:] + corpus.publisher_hosts[:1])[:args.dead_hosts]
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
 # Naver News MCP Python 패키지 초기화
-import importlib
+# 설정이나 파싱 작업자처럼 하위 모듈만 사용할 때 서버(fastmcp)와 도구를 불러오지 않도록
+# 서버는 처음 접근할 때 로드합니다. (도구 등록은 서버 lifespan/main에서 수행)
+from typing import Any
+
 import click
-from mcp_naver_news.server import mcp
 
-# 도구 모듈 등록 (모든 @mcp.tool decorator)
-for module_name in [
-    "news_tools",
-]:
-    importlib.import_module(f"mcp_naver_news.tools.{module_name}")
+
+def __getattr__(name: str) -> Any:
+    if name == "mcp":
+        from mcp_naver_news.server import mcp
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 @click.command()
 def main():
     """Naver News MCP 서버를 실행합니다."""
+    from mcp_naver_news.server import mcp, register_tools
+    register_tools()
     mcp.run()
 
 if __name__ == "__main__":
@@ -1,12 +1,19 @@
-import requests
+import asyncio
+import httpx
 from urllib.parse import urljoin
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 import zipfile
 import io
 
-from ..config import naver_news_config, NaverNewsConfig
+from ..config import NaverNewsConfig
+from ..utils.http import build_api_session, build_async_client
+from ..utils.metrics import API_SECONDS, RATE_LIMIT_WAIT_SECONDS, current_tool, metrics
+from ..utils.rate_limiter import PRIORITY_INTERACTIVE, RateLimiter
+
+if TYPE_CHECKING:
+    import requests
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -14,13 +21,28 @@ logger = logging.getLogger(__name__)
 class NaverNewsClient:
     """네이버 뉴스 API 클라이언트"""
     
-    def __init__(self, config: NaverNewsConfig):
+    def __init__(
+        self,
+        config: NaverNewsConfig,
+        session: Optional["requests.Session"] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         self.config = config
-        self.base_url = "https://openapi.naver.com/v1/search"
+        self.rate_limiter = rate_limiter
+        # NAVER_NEWS_BASE_URL로 로컬 가짜 서버 등 다른 주소를 사용할 수 있음
+        self.base_url = config.search_base_url
         self.headers = {
             "X-Naver-Client-Id": config.client_id,
             "X-Naver-Client-Secret": config.client_secret
         }
+        self._session = session
+
+    @property
+    def session(self) -> "requests.Session":
+        """keep-alive 커넥션 풀을 재사용하여 매 요청의 TCP/TLS 핸드셰이크를 피하는 세션 (처음 사용할 때 생성)"""
+        if self._session is None:
+            self._session = build_api_session(self.config)
+        return self._session
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -34,16 +56,27 @@ class NaverNewsClient:
             Dict[str, Any]: API 응답
         """
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        if self.rate_limiter is not None:
+            with metrics.span(RATE_LIMIT_WAIT_SECONDS, tool=current_tool()):
+                self.rate_limiter.acquire_blocking()
+        with metrics.span(API_SECONDS, tool=current_tool()):
+            response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
+    def close(self) -> None:
+        """커넥션 풀을 정리합니다."""
+        if self._session is not None:
+            self._session.close()
+
     def post(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """POST 요청을 수행합니다."""
         return self._make_request(endpoint, params, "POST")
 
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None, method: str = "GET") -> Dict[str, Any]:
         """API 요청을 보내고 응답을 반환합니다."""
+        import requests
+
         if params is None:
             params = {}
         
@@ -63,12 +96,17 @@ class NaverNewsClient:
         }
         
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, params=params, headers=headers)
-            elif method.upper() == "POST":
-                response = requests.post(url, data=params, headers=headers)
-            else:
+            if method.upper() not in ("GET", "POST"):
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+            # get()과 같은 속도 제한과 일일 한도를 적용
+            if self.rate_limiter is not None:
+                with metrics.span(RATE_LIMIT_WAIT_SECONDS, tool=current_tool()):
+                    self.rate_limiter.acquire_blocking()
+            with metrics.span(API_SECONDS, tool=current_tool()):
+                if method.upper() == "GET":
+                    response = self.session.get(url, params=params, headers=headers)
+                else:
+                    response = self.session.post(url, data=params, headers=headers)
             
             # 응답 로깅 추가
             logger.debug(f"\n=== API 응답 정보 ===")
@@ -94,4 +132,72 @@ class NaverNewsClient:
         
         except requests.RequestException as e:
             logger.error(f"API 요청 실패: {str(e)}")
-            return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
\ No newline at end of file
+            return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
+
+
+class AsyncNaverNewsClient:
+    """네이버 뉴스 API 비동기 클라이언트"""
+
+    # urllib3 Retry 설정과 동일하게 재시도할 응답 코드
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        config: NaverNewsConfig,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        self.config = config
+        self.rate_limiter = rate_limiter
+        # NAVER_NEWS_BASE_URL로 로컬 가짜 서버 등 다른 주소를 사용할 수 있음
+        self.base_url = config.search_base_url
+        self.headers = {
+            "X-Naver-Client-Id": config.client_id,
+            "X-Naver-Client-Secret": config.client_secret
+        }
+        self.client = client or build_async_client(config, headers=self.headers)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> Dict[str, Any]:
+        """
+        GET 요청을 보내고 응답을 반환합니다.
+
+        Args:
+            endpoint (str): API 엔드포인트
+            params (Dict[str, Any], optional): 쿼리 파라미터
+            priority (int): 속도 제한 대기 우선순위 (낮을수록 먼저 처리)
+
+        Returns:
+            Dict[str, Any]: API 응답
+        """
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.config.http_max_retries + 1):
+            if self.rate_limiter is not None:
+                with metrics.span(RATE_LIMIT_WAIT_SECONDS, tool=current_tool()):
+                    await self.rate_limiter.acquire(priority)
+            with metrics.span(API_SECONDS, tool=current_tool()):
+                response = await self.client.get(url, headers=self.headers, params=params)
+            if response.status_code not in self.RETRY_STATUS or attempt == self.config.http_max_retries:
+                break
+            # Retry-After가 없으면 지수 백오프
+            delay = self.config.http_backoff_factor * (2 ** attempt)
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            logger.debug(f"API 재시도 ({response.status_code}): {delay:.2f}s 후 재요청")
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # 개별 재시도 대신 전체 요청 흐름을 늦춰 재시도 폭주를 막음
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+        response.raise_for_status()
+        data: Dict[str, Any] = response.json()
+        return data
+
+    async def aclose(self) -> None:
+        """커넥션 풀을 정리합니다."""
+        await self.client.aclose()
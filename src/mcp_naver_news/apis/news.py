@@ -1,16 +1,65 @@
-from typing import Dict, Any, Optional, List
-from ..apis.client import NaverNewsClient
-import requests
-from bs4 import BeautifulSoup
-import re
-from urllib.parse import urlparse
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Set, TYPE_CHECKING
+from ..apis.client import NaverNewsClient, AsyncNaverNewsClient
+import asyncio
+import httpx
+import logging
+
+from ..utils.article_cache import ArticleCache
+from ..utils.article_extractor import aextract_article_content, extract_article_content
+from ..utils.extraction_engine import ExtractionEngine
+from ..utils.cache import TTLCache, normalize_query
+from ..utils.rate_limiter import PRIORITY_BATCH, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from ..utils.http import build_article_session
+from ..utils.link_resolver import HostStats
+from ..utils.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import requests
+
+# 네이버 뉴스 검색 API의 페이지 크기 및 시작 위치 상한
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+logger = logging.getLogger("mcp-naver-news")
 
 
 class NewsAPI:
     """네이버 뉴스 검색 API"""
     
-    def __init__(self, client: NaverNewsClient):
+    def __init__(
+        self,
+        client: NaverNewsClient,
+        article_session: Optional["requests.Session"] = None,
+        async_client: Optional[AsyncNaverNewsClient] = None,
+        article_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[TTLCache] = None,
+        article_cache: Optional[ArticleCache] = None,
+        engine: Optional[ExtractionEngine] = None,
+        host_stats: Optional[HostStats] = None
+    ):
         self.client = client
+        self._article_session = article_session
+        self.async_client = async_client
+        self.article_client = article_client
+        self.cache = cache
+        self.article_cache = article_cache
+        self.engine = engine
+        # 기사 추출 풀과 같은 호스트 통계를 쓰면 요청 제한 시간과 차단 상태를 공유
+        self.host_stats = host_stats
+        # 동시에 들어온 동일 검색은 하나의 API 호출로 병합
+        self.flights = SingleFlight()
+
+    @property
+    def article_session(self) -> "requests.Session":
+        """동기 기사 추출용 세션 (처음 사용할 때 생성)"""
+        if self._article_session is None:
+            self._article_session = build_article_session(self.client.config)
+        return self._article_session
+
+    def close(self) -> None:
+        """생성한 동기 기사 세션을 정리합니다."""
+        if self._article_session is not None:
+            self._article_session.close()
     
     def search_news(
         self,
@@ -32,7 +81,136 @@ class NewsAPI:
         Returns:
             Dict[str, Any]: 검색 결과
         """
-        endpoint = "news.json"
+        key = self._cache_key(query, display, start, sort)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        result = self.client.get("news.json", self._build_params(query, display, start, sort))
+        self._store(key, sort, result)
+        return result
+
+    async def asearch_news(
+        self,
+        query: str,
+        display: Optional[int] = 10,
+        start: Optional[int] = 1,
+        sort: Optional[str] = "sim",
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> Dict[str, Any]:
+        """
+        네이버 뉴스 검색 (비동기)
+        
+        비동기 클라이언트가 없으면 동기 클라이언트를 작업 스레드에서 실행합니다.
+        priority는 속도 제한 대기열의 우선순위이며, 나머지 인자와 반환값은 search_news와 같습니다.
+        """
+        key = self._cache_key(query, display, start, sort)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        params = self._build_params(query, display, start, sort)
+
+        async def fetch() -> Dict[str, Any]:
+            if self.async_client is None:
+                result = await asyncio.to_thread(self.client.get, "news.json", params)
+            else:
+                result = await self.async_client.get("news.json", params, priority=priority)
+            self._store(key, sort, result)
+            return result
+
+        # 병합된 대기자들이 같은 항목 객체를 수정하지 않도록 각자 복사본을 받음
+        return _copy_result(await self.flights.do(key, fetch))
+
+    async def asearch_many(
+        self,
+        queries: List[Dict[str, Any]],
+        priority: int = PRIORITY_BATCH
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 검색을 동시에 실행합니다.
+        
+        모든 검색은 같은 속도 제한기, 캐시, 요청 병합을 공유하며,
+        실패한 검색은 전체를 중단하지 않고 'error' 키로 결과에 표시됩니다.
+        
+        Args:
+            queries (List[Dict[str, Any]]): query, display, start, sort 키를 가진 검색 목록
+            priority (int): 속도 제한 대기 우선순위
+            
+        Returns:
+            List[Dict[str, Any]]: queries와 같은 순서의 검색 결과 목록
+        """
+        async def run(spec: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await self.asearch_news(
+                    spec['query'],
+                    spec.get('display', 10),
+                    spec.get('start', 1),
+                    spec.get('sort', 'sim'),
+                    priority=priority
+                )
+            except Exception as e:
+                logger.warning(f"배치 검색 실패: {spec.get('query')} - {e}")
+                return {'items': [], 'error': str(e)}
+
+        return list(await asyncio.gather(*(run(spec) for spec in queries)))
+
+    async def aiter_news_pages(
+        self,
+        query: str,
+        max_results: int = MAX_START,
+        sort: Optional[str] = "sim",
+        display: int = MAX_DISPLAY
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        검색 결과 전체 구간을 여러 페이지로 나눠 병렬 요청하고, 완료되는 순서대로 내보냅니다.
+        
+        첫 페이지로 전체 건수를 확인한 뒤 나머지 시작 위치를 동시에 요청합니다.
+        요청은 대량 우선순위로 속도 제한을 받으며, 링크 기준으로 중복을 제거합니다.
+        
+        Args:
+            query (str): 검색어
+            max_results (int): 수집할 최대 기사 수 (최대 1000)
+            sort (str, optional): 정렬 옵션 (sim: 정확도순, date: 날짜순)
+            display (int): 페이지당 기사 수 (최대 100)
+            
+        Yields:
+            Tuple[int, List[Dict[str, Any]]]: (페이지 시작 위치, 새로 수집된 항목 목록)
+        """
+        max_results = max(1, min(max_results, MAX_START))
+        display = max(1, min(display, MAX_DISPLAY, max_results))
+        seen: Set[str] = set()
+
+        first = await self.asearch_news(query, display, 1, sort, priority=PRIORITY_BULK)
+        yield 1, _unique_items(first, seen)
+
+        last = min(int(first.get('total', 0)), max_results)
+        starts = range(1 + display, last + 1, display)
+
+        async def fetch_page(start: int) -> Tuple[int, Dict[str, Any]]:
+            page_size = min(display, last - start + 1)
+            return start, await self.asearch_news(query, page_size, start, sort, priority=PRIORITY_BULK)
+
+        tasks = [asyncio.ensure_future(fetch_page(start)) for start in starts]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                try:
+                    start, page = await next_page
+                except Exception as e:
+                    logger.warning(f"페이지 수집 실패: {query} - {e}")
+                    continue
+                yield start, _unique_items(page, seen)
+        finally:
+            # 소비자가 중간에 멈추면 남은 페이지 요청을 취소
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _build_params(
+        query: str,
+        display: Optional[int],
+        start: Optional[int],
+        sort: Optional[str]
+    ) -> Dict[str, Any]:
+        """검색 요청 파라미터를 생성합니다."""
         params = {
             "query": query,
             "display": display,
@@ -40,9 +218,56 @@ class NewsAPI:
             "sort": sort
         }
         # None 값 제거
-        params = {k: v for k, v in params.items() if v is not None}
+        return {k: v for k, v in params.items() if v is not None}
+
+    @staticmethod
+    def _cache_key(
+        query: str,
+        display: Optional[int],
+        start: Optional[int],
+        sort: Optional[str]
+    ) -> Tuple[str, Optional[int], Optional[int], Optional[str]]:
+        """정규화된 검색어 기준의 캐시 키를 생성합니다."""
+        return (normalize_query(query), display, start, sort)
+
+    def _cached(self, key: Tuple[str, Optional[int], Optional[int], Optional[str]]) -> Optional[Dict[str, Any]]:
+        """캐시된 검색 결과의 복사본을 반환합니다."""
+        if self.cache is None:
+            return None
+        result = self.cache.get(key)
+        return _copy_result(result) if result is not None else None
+
+    def _store(
+        self,
+        key: Tuple[str, Optional[int], Optional[int], Optional[str]],
+        sort: Optional[str],
+        result: Dict[str, Any]
+    ) -> None:
+        """정상 응답만 정렬 옵션별 TTL로 캐시에 저장합니다."""
+        if self.cache is None or 'items' not in result:
+            return
+        config = self.client.config
+        # 날짜순 결과는 새 기사가 빠르게 추가되므로 더 짧게 유지
+        ttl = config.search_cache_ttl_date if sort == "date" else config.search_cache_ttl_sim
+        self.cache.set(key, _copy_result(result), ttl)
+
+    async def aextract_article_content(self, url: str) -> Dict[str, str]:
+        """
+        뉴스 기사 URL에서 본문 내용을 비동기로 추출합니다.
         
-        return self.client.get(endpoint, params)
+        Args:
+            url (str): 뉴스 기사 URL
+            
+        Returns:
+            Dict[str, str]: title, content, error 키를 가진 추출 결과
+        """
+        return await aextract_article_content(
+            url,
+            client=self.article_client,
+            cache=self.article_cache,
+            engine=self.engine,
+            stats=self.host_stats
+        )
 
     def extract_article_content(self, url: str) -> Dict[str, str]:
         """
@@ -58,90 +283,27 @@ class NewsAPI:
                 'error': 에러 메시지 (에러 발생 시)
             }
         """
-        try:
-            # User-Agent 설정
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache',
-            }
-            
-            # URL에서 도메인 추출
-            domain = urlparse(url).netloc
-            
-            # 요청 및 응답
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 제목 추출
-            title = soup.find('title').text.strip() if soup.find('title') else ''
-            
-            # 본문 추출 (도메인별 다른 선택자 적용)
-            content = ''
-            if 'news.naver.com' in domain:
-                # 네이버 뉴스의 본문
-                article = soup.find('div', id='newsct_article') or soup.find('div', id='articeBody')
-                if article:
-                    # 불필요한 요소 제거
-                    for element in article.find_all(['script', 'style', 'iframe', 'ins']):
-                        element.decompose()
-                    content = article.get_text(strip=True)
-            elif 'nspna.com' in domain:
-                # 여러 선택자 시도
-                article = (
-                    soup.find('div', id='articleBody') or
-                    soup.find('div', class_='article-body') or
-                    soup.find('div', class_='article-content') or
-                    soup.find('article')
-                )
-                if article:
-                    # 불필요한 요소 제거
-                    for element in article.find_all(['script', 'style', 'iframe', 'ins', 'div', 'class']):
-                        element.decompose()
-                    content = article.get_text(strip=True)
-            elif 'yna.co.kr' in domain:
-                article = soup.find('article', class_='story-news')
-                if article:
-                    content = article.get_text(strip=True)
-            elif 'hankyung.com' in domain:
-                article = soup.find('div', id='articletxt')
-                if article:
-                    content = article.get_text(strip=True)
-            else:
-                # 일반적인 뉴스 사이트 패턴
-                article = soup.find('article') or soup.find('div', class_=re.compile('article|content|body'))
-                if article:
-                    content = article.get_text(strip=True)
-            
-            # 본문이 없으면 에러 반환
-            if not content:
-                return {
-                    'title': title,
-                    'content': '',
-                    'error': '본문 내용을 찾을 수 없습니다.'
-                }
-            
-            # 결과 반환
-            return {
-                'title': title,
-                'content': content,
-                'error': ''
-            }
-            
-        except requests.exceptions.RequestException as e:
-            return {
-                'title': '',
-                'content': '',
-                'error': f'기사 접근 중 오류 발생: {str(e)}'
-            }
-        except Exception as e:
-            return {
-                'title': '',
-                'content': '',
-                'error': f'기사 파싱 중 오류 발생: {str(e)}'
-            } 
\ No newline at end of file
+        return extract_article_content(
+            url,
+            session=self.article_session,
+            cache=self.article_cache,
+            engine=self.engine,
+            stats=self.host_stats
+        )
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """호출자가 항목을 수정해도 캐시가 오염되지 않도록 항목 단위로 복사합니다."""
+    return {**result, 'items': [dict(item) for item in result.get('items', [])]}
+
+
+def _unique_items(result: Dict[str, Any], seen: Set[str]) -> List[Dict[str, Any]]:
+    """이미 수집한 링크를 제외한 항목만 반환합니다."""
+    items = []
+    for item in result.get('items', []):
+        key = item.get('link') or item.get('originallink', '')
+        if key in seen:
+            continue
+        seen.add(key)
+        items.append(item)
+    return items
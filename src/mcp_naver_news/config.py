@@ -1,15 +1,21 @@
 import os
 import logging
-from typing import Literal, cast
+from typing import Any, Literal, cast
 from dataclasses import dataclass
-from dotenv import load_dotenv
-
-# .env 파일 로드
-load_dotenv()
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+_env_loaded = False
+
+def load_env() -> None:
+    """.env 파일을 처음 설정을 읽을 때 한 번만 로드합니다."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
 @dataclass
 class NaverNewsConfig:
     """Naver News API configuration."""
@@ -18,6 +24,53 @@ class NaverNewsConfig:
     client_secret: str
     base_url: str = "https://openapi.naver.com/v1/search/news.json"
     log_file: str = "naver_news.log"
+    fetch_concurrency: int = 10
+    fetch_per_host: int = 4
+    fetch_per_host_naver: int = 10
+    fetch_timeout: float = 15.0
+    fetch_queue_timeout: float = 60.0
+    fetch_max_bytes: int = 3 * 1024 * 1024
+    fetch_timeout_multiple: float = 3.0
+    fetch_breaker_failures: int = 5
+    fetch_breaker_cooldown: float = 30.0
+    fetch_hedge: bool = True
+    parse_workers: int = 0
+    parse_executor: str = "auto"
+    http_pool_connections: int = 20
+    http_pool_maxsize: int = 10
+    http_max_retries: int = 2
+    http_backoff_factor: float = 0.3
+    search_cache_size: int = 1024
+    search_cache_ttl_sim: float = 600.0
+    search_cache_ttl_date: float = 60.0
+    article_cache_path: str = os.path.join(os.path.expanduser("~"), ".cache", "mcp-naver-news", "articles.sqlite3")
+    article_cache_max_entries: int = 5000
+    article_cache_fresh_seconds: float = 600.0
+    api_rate_per_second: float = 10.0
+    api_burst: int = 10
+    api_daily_quota: int = 25000
+    api_quota_state_path: str = os.path.join(os.path.expanduser("~"), ".cache", "mcp-naver-news", "quota.json")
+    publisher_rules_path: str = ""
+    state_store: str = ""
+    state_store_path: str = os.path.join(os.path.expanduser("~"), ".cache", "mcp-naver-news", "state.sqlite3")
+    output_compact: bool = False
+    archive_path: str = os.path.join(os.path.expanduser("~"), ".cache", "mcp-naver-news", "archive.sqlite3")
+    archive_max_entries: int = 50000
+    archive_max_days: float = 365.0
+    dedupe_min_similarity: float = 0.6
+    dedupe_max_distance: int = 8
+    watchlist_path: str = os.path.join(os.path.expanduser("~"), ".cache", "mcp-naver-news", "watchlist.json")
+    watchlist_min_interval: float = 300.0
+    watchlist_max_interval: float = 21600.0
+    prefetch_top_k: int = 0
+    prefetch_concurrency: int = 2
+    prefetch_max_bytes: int = 2 * 1024 * 1024
+
+    @property
+    def search_base_url(self) -> str:
+        """검색 API 엔드포인트(news.json 등)의 기준 주소 (base_url에서 마지막 경로를 뺀 주소)"""
+        base_url = self.base_url.rstrip("/")
+        return base_url.rsplit("/", 1)[0] if base_url.endswith(".json") else base_url
     
     @classmethod
     def from_env(cls) -> "NaverNewsConfig":
@@ -26,6 +79,7 @@ class NaverNewsConfig:
         Returns:
             NaverNewsConfig: Configuration object with values from environment variables
         """
+        load_env()
         client_id = os.getenv("X_NAVER_CLIENT_ID")
         client_secret = os.getenv("X_NAVER_CLIENT_SECRET")
         
@@ -36,7 +90,48 @@ class NaverNewsConfig:
             client_id=client_id,
             client_secret=client_secret,
             base_url=os.getenv("NAVER_NEWS_BASE_URL", "https://openapi.naver.com/v1/search/news.json"),
-            log_file=os.getenv("LOG_FILE", "naver_news.log")
+            log_file=os.getenv("LOG_FILE", "naver_news.log"),
+            fetch_concurrency=int(os.getenv("NAVER_NEWS_FETCH_CONCURRENCY", "10")),
+            fetch_per_host=int(os.getenv("NAVER_NEWS_FETCH_PER_HOST", "4")),
+            fetch_per_host_naver=int(os.getenv("NAVER_NEWS_FETCH_PER_HOST_NAVER", "10")),
+            fetch_timeout=float(os.getenv("NAVER_NEWS_FETCH_TIMEOUT", "15")),
+            fetch_queue_timeout=float(os.getenv("NAVER_NEWS_FETCH_QUEUE_TIMEOUT", "60")),
+            fetch_max_bytes=int(os.getenv("NAVER_NEWS_FETCH_MAX_BYTES", str(3 * 1024 * 1024))),
+            fetch_timeout_multiple=float(os.getenv("NAVER_NEWS_FETCH_TIMEOUT_MULTIPLE", "3")),
+            fetch_breaker_failures=int(os.getenv("NAVER_NEWS_FETCH_BREAKER_FAILURES", "5")),
+            fetch_breaker_cooldown=float(os.getenv("NAVER_NEWS_FETCH_BREAKER_COOLDOWN", "30")),
+            fetch_hedge=os.getenv("NAVER_NEWS_FETCH_HEDGE", "true").lower() in ("1", "true", "yes"),
+            parse_workers=int(os.getenv("NAVER_NEWS_PARSE_WORKERS", "0")),
+            parse_executor=os.getenv("NAVER_NEWS_PARSE_EXECUTOR", "auto"),
+            http_pool_connections=int(os.getenv("NAVER_NEWS_HTTP_POOL_CONNECTIONS", "20")),
+            http_pool_maxsize=int(os.getenv("NAVER_NEWS_HTTP_POOL_MAXSIZE", "10")),
+            http_max_retries=int(os.getenv("NAVER_NEWS_HTTP_MAX_RETRIES", "2")),
+            http_backoff_factor=float(os.getenv("NAVER_NEWS_HTTP_BACKOFF_FACTOR", "0.3")),
+            search_cache_size=int(os.getenv("NAVER_NEWS_SEARCH_CACHE_SIZE", "1024")),
+            search_cache_ttl_sim=float(os.getenv("NAVER_NEWS_SEARCH_CACHE_TTL_SIM", "600")),
+            search_cache_ttl_date=float(os.getenv("NAVER_NEWS_SEARCH_CACHE_TTL_DATE", "60")),
+            article_cache_path=os.getenv("NAVER_NEWS_ARTICLE_CACHE_PATH", cls.article_cache_path),
+            article_cache_max_entries=int(os.getenv("NAVER_NEWS_ARTICLE_CACHE_MAX_ENTRIES", "5000")),
+            article_cache_fresh_seconds=float(os.getenv("NAVER_NEWS_ARTICLE_CACHE_FRESH_SECONDS", "600")),
+            api_rate_per_second=float(os.getenv("NAVER_NEWS_API_RATE_PER_SECOND", "10")),
+            api_burst=int(os.getenv("NAVER_NEWS_API_BURST", "10")),
+            api_daily_quota=int(os.getenv("NAVER_NEWS_API_DAILY_QUOTA", "25000")),
+            api_quota_state_path=os.getenv("NAVER_NEWS_API_QUOTA_STATE_PATH", cls.api_quota_state_path),
+            publisher_rules_path=os.getenv("NAVER_NEWS_PUBLISHER_RULES_PATH", ""),
+            state_store=os.getenv("NAVER_NEWS_STATE_STORE", ""),
+            state_store_path=os.getenv("NAVER_NEWS_STATE_STORE_PATH", cls.state_store_path),
+            output_compact=os.getenv("NAVER_NEWS_OUTPUT_COMPACT", "false").lower() in ("1", "true", "yes"),
+            archive_path=os.getenv("NAVER_NEWS_ARCHIVE_PATH", cls.archive_path),
+            archive_max_entries=int(os.getenv("NAVER_NEWS_ARCHIVE_MAX_ENTRIES", "50000")),
+            archive_max_days=float(os.getenv("NAVER_NEWS_ARCHIVE_MAX_DAYS", "365")),
+            dedupe_min_similarity=float(os.getenv("NAVER_NEWS_DEDUPE_MIN_SIMILARITY", "0.6")),
+            dedupe_max_distance=int(os.getenv("NAVER_NEWS_DEDUPE_MAX_DISTANCE", "8")),
+            watchlist_path=os.getenv("NAVER_NEWS_WATCHLIST_PATH", cls.watchlist_path),
+            watchlist_min_interval=float(os.getenv("NAVER_NEWS_WATCHLIST_MIN_INTERVAL", "300")),
+            watchlist_max_interval=float(os.getenv("NAVER_NEWS_WATCHLIST_MAX_INTERVAL", "21600")),
+            prefetch_top_k=int(os.getenv("NAVER_NEWS_PREFETCH_TOP_K", "0")),
+            prefetch_concurrency=int(os.getenv("NAVER_NEWS_PREFETCH_CONCURRENCY", "2")),
+            prefetch_max_bytes=int(os.getenv("NAVER_NEWS_PREFETCH_MAX_BYTES", str(2 * 1024 * 1024)))
         )
  
 @dataclass
@@ -48,17 +143,25 @@ class MCPConfig:
     port: int = 8000
     log_level: str = "INFO"
     transport: Literal["stdio", "sse"] = "stdio"
+    workers: int = 1
     @classmethod
     def from_env(cls) -> "MCPConfig":
         """Create a MCPConfig with values from environment variables"""
+        load_env()
         return cls(
             server_name=os.getenv("MCP_SERVER_NAME", "naver-news-mcp"),
             host=os.getenv("MCP_HOST", "localhost"),
             port=int(os.getenv("MCP_PORT", "8000")),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
-            transport=cast(Literal["stdio", "sse"], os.getenv("TRANSPORT", "stdio"))
+            transport=cast(Literal["stdio", "sse"], os.getenv("TRANSPORT", "stdio")),
+            workers=int(os.getenv("MCP_WORKERS", "1"))
         )
 
-# 설정 인스턴스 생성
-naver_news_config = NaverNewsConfig.from_env()
-mcp_config = MCPConfig.from_env()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """기존 모듈 속성(naver_news_config, mcp_config)은 처음 접근할 때 환경 변수에서 생성합니다."""
+    factories = {"naver_news_config": NaverNewsConfig.from_env, "mcp_config": MCPConfig.from_env}
+    if name not in factories:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factories[name]()
+    globals()[name] = value
+    return value
\ No newline at end of file
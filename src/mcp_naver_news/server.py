@@ -1,11 +1,14 @@
 import logging
 import sys
 import asyncio
+import importlib
+import threading
+import httpx
 from starlette.requests import Request
 from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated, Any, Literal, Optional
+from typing import Annotated, Any, Literal, Optional, Union, TYPE_CHECKING
 
 from fastmcp import FastMCP
 from mcp.types import TextContent
@@ -13,29 +16,196 @@ from mcp.server.session import ServerSession
 from pydantic import Field
 
 from .config import NaverNewsConfig, MCPConfig
-from .apis.client import NaverNewsClient
-from .apis.news import NewsAPI
+
+# 무거운 모듈(requests, lxml 등)은 컨텍스트를 처음 생성할 때 로드
+if TYPE_CHECKING:
+    import requests
+    from .apis.client import NaverNewsClient, AsyncNaverNewsClient
+    from .utils.fetch_pool import ArticleFetchPool
+    from .utils.article_archive import ArticleArchive
+    from .utils.article_cache import ArticleCache
+    from .utils.cache import SharedTTLCache, TTLCache
+    from .utils.extraction_engine import ExtractionEngine
+    from .utils.link_resolver import LinkResolver
+    from .utils.parse_pool import ParsePool
+    from .utils.prefetch import ArticlePrefetcher
+    from .utils.rate_limiter import RateLimiter
+    from .utils.state_store import StateStore
+    from .utils.watchlist import Watchlist
 
 # 로거 설정
 logger = logging.getLogger("mcp-naver-news")
-mcp_config = MCPConfig.from_env()
 
 @dataclass
 class NaverNewsContext(ServerSession):
     """Naver News API 컨텍스트"""
     
-    client: Optional[NaverNewsClient] = None
+    client: Optional["NaverNewsClient"] = None
     news : Any = None
+    fetcher: Optional["ArticleFetchPool"] = None
+    article_session: Optional["requests.Session"] = None
+    async_client: Optional["AsyncNaverNewsClient"] = None
+    article_client: Optional[httpx.AsyncClient] = None
+    search_cache: Optional[Union["TTLCache", "SharedTTLCache"]] = None
+    article_cache: Optional["ArticleCache"] = None
+    article_archive: Optional["ArticleArchive"] = None
+    rate_limiter: Optional["RateLimiter"] = None
+    extraction_engine: Optional["ExtractionEngine"] = None
+    link_resolver: Optional["LinkResolver"] = None
+    parse_pool: Optional["ParsePool"] = None
+    state_store: Optional["StateStore"] = None
+    watchlist: Optional["Watchlist"] = None
+    prefetcher: Optional["ArticlePrefetcher"] = None
     
     def __post_init__(self):
+        import sqlite3
+        from .apis.client import NaverNewsClient, AsyncNaverNewsClient
+        from .utils.fetch_pool import ArticleFetchPool
+        from .utils.article_archive import ArticleArchive
+        from .utils.article_cache import ArticleCache
+        from .utils.cache import SharedTTLCache, TTLCache
+        from .utils.extraction_engine import build_extraction_engine
+        from .utils.http import ARTICLE_HEADERS, article_connection_limit, build_async_client
+        from .utils.link_resolver import HostStats, LinkResolver
+        from .utils.parse_pool import build_parse_pool
+        from .utils.prefetch import ArticlePrefetcher
+        from .utils.rate_limiter import build_rate_limiter
+        from .utils.state_store import load_state_store
+        from .utils.watchlist import Watchlist
+
         if self.client is None:
-            from .config import NaverNewsConfig, MCPConfig
             config = NaverNewsConfig.from_env()
             self.client = NaverNewsClient(config=config)
 
+        # 여러 작업자 프로세스가 검색 캐시와 일일 한도를 공유 (설정하지 않으면 None)
+        if self.state_store is None:
+            self.state_store = load_state_store(self.client.config)
+
+        # 동기/비동기 클라이언트가 하나의 속도 제한기와 일일 한도를 공유
+        if self.rate_limiter is None:
+            self.rate_limiter = self.client.rate_limiter or build_rate_limiter(self.client.config, self.state_store)
+        self.client.rate_limiter = self.rate_limiter
+
+        if self.async_client is None:
+            self.async_client = AsyncNaverNewsClient(config=self.client.config, rate_limiter=self.rate_limiter)
+
+        if self.article_client is None:
+            self.article_client = build_async_client(
+                self.client.config,
+                headers=ARTICLE_HEADERS,
+                max_connections=article_connection_limit(self.client.config)
+            )
+
+        if self.search_cache is None and self.state_store is not None:
+            self.search_cache = SharedTTLCache(self.state_store, maxsize=self.client.config.search_cache_size)
+        elif self.search_cache is None:
+            self.search_cache = TTLCache(maxsize=self.client.config.search_cache_size)
+
+        if self.article_cache is None and self.client.config.article_cache_path:
+            config = self.client.config
+            self.article_cache = ArticleCache(
+                config.article_cache_path,
+                max_entries=config.article_cache_max_entries,
+                fresh_seconds=config.article_cache_fresh_seconds
+            )
+
+        # 추출한 기사 본문을 누적 저장하여 후속 검색을 API 호출 없이 처리
+        if self.article_archive is None and self.client.config.archive_path:
+            config = self.client.config
+            try:
+                self.article_archive = ArticleArchive(
+                    config.archive_path,
+                    max_entries=config.archive_max_entries,
+                    max_days=config.archive_max_days
+                )
+            except sqlite3.Error as e:
+                # FTS5를 지원하지 않는 SQLite 등에서는 보관소 없이 시작
+                logger.warning(f"기사 보관소를 사용할 수 없어 비활성화합니다: {config.archive_path} - {e}")
+                self.article_archive = None
+
+        # 관심 검색어 상태는 공유 저장소가 있으면 작업자끼리 공유
+        if self.watchlist is None:
+            config = self.client.config
+            self.watchlist = Watchlist(
+                path=config.watchlist_path or None,
+                store=self.state_store,
+                min_interval=config.watchlist_min_interval,
+                max_interval=config.watchlist_max_interval
+            )
+
+        if self.extraction_engine is None:
+            self.extraction_engine = build_extraction_engine(self.client.config)
+
+        if self.link_resolver is None:
+            config = self.client.config
+            stats = HostStats(
+                failure_threshold=config.fetch_breaker_failures,
+                cooldown=config.fetch_breaker_cooldown,
+                timeout_multiple=config.fetch_timeout_multiple
+            )
+            self.link_resolver = LinkResolver(self.extraction_engine.registry, stats)
+
+        if self.parse_pool is None:
+            self.parse_pool = build_parse_pool(self.client.config)
+
         if self.news is None:
             from .apis.news import NewsAPI
-            self.news = NewsAPI(self.client)
+            self.news = NewsAPI(
+                self.client,
+                article_session=self.article_session,
+                async_client=self.async_client,
+                article_client=self.article_client,
+                cache=self.search_cache,
+                article_cache=self.article_cache,
+                engine=self.extraction_engine,
+                host_stats=self.link_resolver.stats
+            )
+
+        if self.fetcher is None:
+            self.fetcher = ArticleFetchPool.from_config(
+                self.client.config,
+                http_client=self.article_client,
+                cache=self.article_cache,
+                engine=self.extraction_engine,
+                resolver=self.link_resolver,
+                parse_pool=self.parse_pool
+            )
+
+        # 미리 받은 본문은 기사 캐시를 통해 상세 검색에 전달되므로 캐시가 있을 때만 사용
+        if self.prefetcher is None and self.client.config.prefetch_top_k > 0:
+            config = self.client.config
+            if self.article_cache is None:
+                logger.warning("기사 캐시가 비활성화되어 있어 본문 미리 받기(NAVER_NEWS_PREFETCH_TOP_K)를 사용하지 않습니다.")
+            else:
+                self.prefetcher = ArticlePrefetcher(
+                    self.fetcher,
+                    self.article_cache,
+                    top_k=config.prefetch_top_k,
+                    concurrency=config.prefetch_concurrency,
+                    max_bytes=config.prefetch_max_bytes,
+                    min_similarity=config.dedupe_min_similarity
+                )
+
+    async def aclose(self) -> None:
+        """컨텍스트가 소유한 커넥션 풀을 정리합니다."""
+        if self.prefetcher is not None:
+            await self.prefetcher.aclose()
+        await self.article_client.aclose()
+        await self.async_client.aclose()
+        # 동기 세션은 사용한 경우에만 생성되어 있음
+        if self.article_session is not None:
+            self.article_session.close()
+        self.news.close()
+        self.client.close()
+        self.rate_limiter.close()
+        if self.article_cache is not None:
+            self.article_cache.close()
+        if self.article_archive is not None:
+            self.article_archive.close()
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+        if self.state_store is not None:
+            self.state_store.close()
     
     async def __aenter__(self):
         """컨텍스트 진입 시 호출됩니다."""
@@ -46,44 +216,60 @@ class NaverNewsContext(ServerSession):
         """컨텍스트 종료 시 호출됩니다."""
         logger.info("🔁 NaverNewsContext exited")
 
-naver_news_client = NaverNewsClient(config=NaverNewsConfig.from_env())
-naver_news_context = NaverNewsContext(
-    client=naver_news_client,
-    news=NewsAPI(naver_news_client)
-)
+# 프로세스 공용 컨텍스트 (처음 필요할 때 한 번 생성하고, 마지막 lifespan이 끝나면 정리)
+_context: Optional[NaverNewsContext] = None
+_context_users = 0
+_context_lock = threading.Lock()
 
-ctx = naver_news_context
+def get_naver_news_context() -> NaverNewsContext:
+    """
+    프로세스 공용 NaverNewsContext를 반환합니다. 아직 없으면 환경 변수 설정으로 생성합니다.
+
+    lifespan과 MCP 컨텍스트 없이 호출된 도구(with_context의 fallback)가 같은 인스턴스를 사용합니다.
+    """
+    global _context
+    with _context_lock:
+        if _context is None:
+            _context = NaverNewsContext()
+        return _context
+
+def __getattr__(name: str) -> Any:
+    # 기존 전역 변수(naver_news_context, ctx)는 접근할 때 공용 컨텍스트를 생성
+    if name in ("naver_news_context", "ctx"):
+        return get_naver_news_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 @asynccontextmanager
 async def naver_news_lifespan(app: FastMCP) -> AsyncGenerator[NaverNewsContext, None]:
     """Lifespan manager for the Naver News FastMCP server.
     
-    Creates and manages the NaverNewsClient instance and API modules.
+    Registers the tool modules and shares one NaverNewsContext (clients, caches, rate limiter)
+    across sessions. The context is built on the first session and closed when the last one ends.
     """
+    global _context, _context_users
     logger.info("Initializing Naver News FastMCP server...")
     
     try:
-        # Naver News 설정 로드
-        naver_news_config = NaverNewsConfig.from_env()
-        mcp_config = MCPConfig.from_env()
-        
-        # Naver News API 클라이언트 초기화
-        client = NaverNewsClient(config=naver_news_config)
-        
-        # API 초기화
-        ctx = NaverNewsContext(
-            client=client,
-            news=NewsAPI(client)
-        )
-        
+        register_tools()
+        ctx = get_naver_news_context()
+        with _context_lock:
+            _context_users += 1
         logger.info("Naver News client and API modules initialized successfully.")
-        yield ctx
         
     except Exception as e:
         logger.error(f"Failed to initialize Naver News client: {e}", exc_info=True)
         raise
     
+    try:
+        yield ctx
     finally:
+        with _context_lock:
+            _context_users -= 1
+            last = _context_users == 0 and _context is ctx
+            if last:
+                _context = None
+        if last:
+            await ctx.aclose()
         logger.info("Shutting down Naver News FastMCP server...")
 
 # MCP 서버 인스턴스 생성
@@ -93,26 +279,85 @@ mcp = FastMCP(
     lifespan=naver_news_lifespan
 )
 
-# 도구 모듈 동적 로드
-import importlib
-for module_name in [
+# 도구 모듈 (서버를 실행할 때 register_tools로 로드)
+TOOL_MODULES = [
     "news_tools",
-]:
-    try:
-        importlib.import_module(f"mcp_naver_news.tools.{module_name}")
-    except ImportError as e:
-        logger.warning(f"Failed to import tool module {module_name}: {e}")
+    "metrics_tools",
+    "watchlist_tools",
+]
+
+def register_tools() -> None:
+    """도구 모듈을 불러와 @mcp.tool 도구를 등록합니다. 이미 불러온 모듈은 다시 실행되지 않습니다."""
+    for module_name in TOOL_MODULES:
+        try:
+            importlib.import_module(f"mcp_naver_news.tools.{module_name}")
+        except ImportError as e:
+            logger.warning(f"Failed to import tool module {module_name}: {e}")
+
+def create_sse_app():
+    """
+    다중 작업자 SSE 서버의 작업자마다 호출되는 ASGI 앱 팩토리 (uvicorn --factory)
+
+    공유 상태 저장소에 SSE 세션 위치를 등록하여, 다른 작업자에 도착한 메시지도
+    세션을 가진 작업자에게 전달합니다.
+    """
+    from .utils.sse_workers import build_worker_app
+    from .utils.state_store import load_state_store
+
+    register_tools()
+    store = load_state_store(NaverNewsConfig.from_env())
+    if store is None:
+        raise ValueError("다중 작업자 모드에는 공유 상태 저장소가 필요합니다. NAVER_NEWS_STATE_STORE를 설정하세요.")
+    return build_worker_app(mcp, store)
 
 def main():
     logger.info("✅ Initializing Naver News FastMCP server...")
+    mcp_config = MCPConfig.from_env()
     transport = mcp_config.transport
     port = mcp_config.port
 
-    if transport == "sse":
+    if transport == "sse" and mcp_config.workers > 1:
+        run_workers(mcp_config.workers, port=port, log_level=mcp_config.log_level)
+    elif transport == "sse":
         asyncio.run(run_server(transport="sse", port=port))
     else:
+        register_tools()
         mcp.run()
 
+def run_workers(workers: int, port: int = 8000, log_level: str = "INFO") -> None:
+    """
+    하나의 포트에서 SSE 서버 작업자 프로세스 여러 개를 실행합니다.
+
+    작업자는 환경 변수로 설정을 전달받으므로, 시작 전에 공유 상태 저장소(기본값 SQLite)를 지정하고
+    API 초당 호출 한도를 작업자 수로 나눠 전체 호출 속도가 설정값을 넘지 않게 합니다.
+
+    Args:
+        workers: 작업자 프로세스 수
+        port: The port to use for the server.
+        log_level: uvicorn 로그 레벨
+    """
+    import os
+    import uvicorn
+
+    config = NaverNewsConfig.from_env()
+    if config.state_store.strip() == "memory":
+        raise ValueError("다중 작업자 모드에서는 NAVER_NEWS_STATE_STORE=memory를 사용할 수 없습니다.")
+    if not config.state_store.strip():
+        os.environ["NAVER_NEWS_STATE_STORE"] = "sqlite"
+    os.environ["NAVER_NEWS_API_RATE_PER_SECOND"] = str(config.api_rate_per_second / workers)
+    os.environ["NAVER_NEWS_API_BURST"] = str(max(1, config.api_burst // workers))
+    logger.info(f"SSE 작업자 {workers}개 시작 (포트 {port})")
+    uvicorn.run(
+        "mcp_naver_news.server:create_sse_app",
+        factory=True,
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        log_level=log_level.lower(),
+        # 열린 SSE 스트림이 작업자 종료를 무기한 막지 않도록 대기 시간을 제한
+        timeout_graceful_shutdown=5
+    )
+
 async def run_server(
     transport: Literal["stdio", "sse"] = "stdio", 
     port: int = 8000
@@ -123,9 +368,17 @@ async def run_server(
         transport: The transport to use for the server.
         port: The port to use for the server.
     """
+    register_tools()
     if transport == "stdio":
         await mcp.run_stdio_async()
     elif transport == "sse":
-        await mcp.run_sse_async(host="0.0.0.0", port=port)
+        import uvicorn
+        from .utils.metrics import metrics_route
+
+        # FastMCP SSE 앱에 Prometheus 형식 측정값 경로(/metrics) 추가
+        app = mcp.sse_app()
+        app.router.routes.append(metrics_route())
+        server = uvicorn.Server(uvicorn.Config(app, host="0.0.0.0", port=port, log_level=mcp.settings.log_level.lower()))
+        await server.serve()
     else:
         raise ValueError(f"Invalid transport: {transport}")
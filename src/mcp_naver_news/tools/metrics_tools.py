@@ -0,0 +1,24 @@
+import json
+
+from mcp_naver_news.server import get_naver_news_context, mcp
+from mcp_naver_news.utils.metrics import collect, summarize
+
+@mcp.resource(
+    "metrics://latency",
+    name="latency_metrics",
+    description="""
+    Latency summary of this server: per-tool call time, Naver API request and rate-limit wait time,
+    per-publisher-domain article download phases (connect incl. DNS, tls, ttfb, body, total) and parse time, and JSON serialization time.
+    Each row has count, avg_ms, p50_ms and p95_ms, sorted by total time spent. With several SSE workers, all workers are included.
+    """,
+    mime_type="application/json",
+    tags={"네이버뉴스", "지표", "지연시간"}
+)
+def latency_metrics() -> str:
+    """
+    도구/API/언론사별 지연 시간 요약
+    Returns:
+        str: 측정 항목별 count, avg_ms, p50_ms, p95_ms (JSON)
+    """
+    store = get_naver_news_context().state_store
+    return json.dumps(summarize(collect(store)), ensure_ascii=False, indent=2)
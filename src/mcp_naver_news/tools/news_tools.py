@@ -1,13 +1,39 @@
+import asyncio
 import logging
 from typing import Any, Optional, List, Dict
 from mcp_naver_news.server import mcp
 from mcp.types import TextContent
-from mcp_naver_news.utils.ctx_helper import with_context
-import json
-from mcp_naver_news.utils.article_extractor import extract_article_content
+from pydantic import BaseModel, Field
+from mcp_naver_news.utils.ctx_helper import ProgressReporter, with_context
+from mcp_naver_news.utils.dedup import Cluster, body_fingerprint, cluster_items, merge_by_body
+from mcp_naver_news.utils.metrics import SERIALIZE_SECONDS, current_tool, metrics, timed_tool
+from mcp_naver_news.utils.output import DETAIL_FIELDS, NewsItem, OutputOptions, dumps, render
 
 logger = logging.getLogger("mcp-naver-news")
 
+class BatchQuery(BaseModel):
+    """search_news_batch의 개별 검색 요청"""
+
+    query: str = Field(description="검색어")
+    display: Optional[int] = Field(default=None, description="결과 수 (미지정 시 공통 display 사용)")
+    sort: Optional[str] = Field(default=None, description="정렬 옵션 sim/date (미지정 시 공통 sort 사용)")
+
+# 필드 선택/compact 인자 설명 (도구 설명에 공통으로 추가)
+OUTPUT_HELP = """
+    Use 'fields' to return only some of title, link, originallink, description, pub_date (and content for 'search_news_detail'),
+    and set 'compact' to true for unindented JSON, which saves tokens on large results.
+    """
+
+def _format_item(item: Dict[str, Any], options: OutputOptions = OutputOptions()) -> Dict[str, Any]:
+    """API 응답 항목을 도구 응답 형식으로 변환합니다."""
+    return render(NewsItem.from_api(item), options)
+
+def _to_text(data: Any, compact: bool = False) -> TextContent:
+    """도구 결과를 JSON 텍스트로 변환합니다. (직렬화 시간 기록)"""
+    with metrics.span(SERIALIZE_SECONDS, tool=current_tool()):
+        text = dumps(data, compact=compact)
+    return TextContent(type="text", text=text)
+
 @mcp.tool(
     name="search_news",
     description="""
@@ -15,14 +41,17 @@ logger = logging.getLogger("mcp-naver-news")
     Quickly search news articles using the Naver News API and return only the API results (title, summary, link, etc.).
     This tool does NOT extract the full article content, making it fast and lightweight. Use this for initial exploration, filtering, and keyword-based summaries.
     Only after you have identified articles of interest should you use 'search_news_detail' for in-depth analysis.
-    """,
+    """ + OUTPUT_HELP,
     tags={"기사", "뉴스", "검색", "네이버뉴스", "요약"}
 )
-def search_news(
+@timed_tool
+async def search_news(
     query: str,
     display: Optional[int] = 10,
     start: Optional[int] = 1,
     sort: Optional[str] = "sim",
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -32,29 +61,25 @@ def search_news(
         display (Optional[int]): 결과 수 (기본값: 10)
         start (Optional[int]): 시작 위치 (기본값: 1)
         sort (Optional[str]): 정렬 옵션 (기본값: "sim")
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 외 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
     Returns:
         TextContent: 기사 요약 리스트
     """
-    result = with_context(ctx, "search_news", lambda context: context.news.search_news(
+    context = with_context(ctx, "search_news", lambda context: context)
+    options = OutputOptions.build(fields, compact, default_compact=context.client.config.output_compact)
+    result = await context.news.asearch_news(
         query=query,
         display=display,
         start=start,
         sort=sort
-    ))
-    formatted_result = []
-    for item in result.get('items', []):
-        formatted_item = {
-            '제목': item.get('title', ''),
-            '링크': item.get('link', ''),
-            '원본링크': item.get('originallink', ''),
-            '요약': item.get('description', ''),
-            '발행일': item.get('pubDate', '')
-        }
-        formatted_result.append(formatted_item)
-    return TextContent(
-        type="text",
-        text=json.dumps(formatted_result, ensure_ascii=False, indent=2)
     )
+    items = result.get('items', [])
+    if context.prefetcher is not None:
+        # 이어서 호출될 search_news_detail을 위해 상위 기사 본문을 백그라운드에서 미리 받음
+        context.prefetcher.schedule(items)
+    formatted_result = [_format_item(item, options) for item in items]
+    return _to_text(formatted_result, options.compact)
 
 @mcp.tool(
     name="search_news_detail",
@@ -63,15 +88,28 @@ def search_news(
     This tool searches news articles and robustly extracts the actual article content from the web page.
     It is slower and more resource-intensive, but provides the full, accurate article text for in-depth analysis.
     Use this tool only for articles that require deep understanding or content analysis, after initial exploration with 'search_news'.
-    """,
+    Set 'stream' to true to receive each article as a log notification as soon as its content is extracted, before the full list is returned.
+    Near-duplicate articles (e.g. the same wire story republished by several outlets) are detected from titles and summaries before fetching
+    and from bodies after extraction; only one representative per group is extracted and returned, with the other copies' links listed under '중복기사'.
+    Set 'dedupe' to false to extract and return every article separately.
+    To keep responses small, 'max_chars' truncates each article body and 'snippet_chars' keeps only that many characters
+    around each occurrence of the query terms (falling back to the beginning of the body when no term occurs).
+    """ + OUTPUT_HELP,
     tags={"기사", "뉴스", "검색", "네이버뉴스", "본문", "심층분석"}
 )
-def search_news_detail(
+@timed_tool
+async def search_news_detail(
     query: str,
     display: Optional[int] = 10,
     start: Optional[int] = 1,
     sort: Optional[str] = "sim",
     include_content: Optional[bool] = True,
+    stream: Optional[bool] = False,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    max_chars: Optional[int] = 0,
+    snippet_chars: Optional[int] = 0,
+    dedupe: Optional[bool] = True,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -82,39 +120,322 @@ def search_news_detail(
         start (Optional[int]): 시작 위치 (기본값: 1)
         sort (Optional[str]): 정렬 옵션 (기본값: "sim")
         include_content (Optional[bool]): 기사 본문 포함 여부 (기본값: True)
+        stream (Optional[bool]): 추출이 끝난 기사부터 즉시 알림으로 전송 (기본값: False)
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 포함 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
+        max_chars (Optional[int]): 기사 본문 최대 글자 수 (기본값: 0, 제한 없음)
+        snippet_chars (Optional[int]): 검색어 주변으로 남길 앞뒤 글자 수 (기본값: 0, 본문 전체)
+        dedupe (Optional[bool]): 중복 기사는 대표 기사만 추출하고 나머지는 링크로 표시 (기본값: True)
     Returns:
         TextContent: 기사 리스트 (본문 포함)
     """
-    result = with_context(ctx, "search_news_detail", lambda context: context.news.search_news(
+    context = with_context(ctx, "search_news_detail", lambda context: context)
+    config = context.client.config
+    options = OutputOptions.build(
+        fields,
+        compact,
+        default_fields=DETAIL_FIELDS,
+        default_compact=config.output_compact,
+        max_chars=max_chars,
+        snippet_chars=snippet_chars,
+        query=query
+    )
+    result = await context.news.asearch_news(
         query=query,
         display=display,
         start=start,
         sort=sort
-    ))
-    if include_content and result.get('items'):
-        for item in result['items']:
-            try:
-                content_result = extract_article_content(item['link'])
+    )
+    items = result.get('items', [])
+    news_items = [NewsItem.from_api(item) for item in items]
+    # 제목/요약이 비슷한 기사는 검색 순위가 가장 높은 기사만 추출
+    if dedupe:
+        clusters = cluster_items(items, config.dedupe_min_similarity)
+    else:
+        clusters = [Cluster([index]) for index in range(len(items))]
+    if include_content and items:
+        if context.prefetcher is not None:
+            # 아직 시작하지 않은 미리 받기는 취소하고 직접 추출 (받는 중인 기사는 같은 다운로드를 기다림)
+            context.prefetcher.claim(items)
+        progress = ProgressReporter("search_news_detail", total=len(clusters), stream=bool(stream))
+
+        def on_result_for(indexes: List[int]):
+            async def on_result(position: int, content_result: Dict[str, str]) -> None:
+                index = indexes[position]
+                news_item = news_items[index]
                 if not content_result.get('error'):
-                    item['content'] = content_result['content']
+                    news_item.content = content_result['content']
                 else:
-                    item['content'] = f"본문 추출 실패: {content_result['error']}"
-                    logger.warning(f"기사 본문 추출 실패: {item['link']} - {content_result['error']}")
-            except Exception as e:
-                item['content'] = f"본문 추출 중 오류 발생: {str(e)}"
-                logger.error(f"기사 본문 추출 중 오류: {item['link']} - {str(e)}")
-    formatted_result = []
-    for item in result.get('items', []):
-        formatted_item = {
-            '제목': item.get('title', ''),
-            '링크': item.get('link', ''),
-            '원본링크': item.get('originallink', ''),
-            '요약': item.get('description', ''),
-            '발행일': item.get('pubDate', ''),
-            '본문': item.get('content', '본문 없음')
+                    news_item.content = f"본문 추출 실패: {content_result['error']}"
+                    logger.warning(f"기사 본문 추출 실패: {news_item.link} - {content_result['error']}")
+                # 기사별 추출이 끝나는 즉시 진행률과 부분 결과 전송
+                await progress.advance(render(news_item, options), index=index)
+            return on_result
+
+        # 기사 본문을 병렬로 추출 (네이버 뉴스/경량 페이지 우선, 결과는 API 응답 순서 유지)
+        representatives = [c.representative for c in clusters]
+        await context.fetcher.extract_items([items[i] for i in representatives], on_result=on_result_for(representatives))
+        # 대표 기사 추출에 실패한 묶음은 다음 중복 기사로 한 번 더 시도
+        retry = [c for c in clusters if _extraction_failed(news_items[c.representative]) and c.aliases]
+        if retry:
+            for c in retry:
+                c.members.append(c.members.pop(0))
+            progress.total += len(retry)
+            representatives = [c.representative for c in retry]
+            await context.fetcher.extract_items([items[i] for i in representatives], on_result=on_result_for(representatives))
+        if dedupe:
+            # 제목이 달라 추출 전에는 찾지 못한 중복 기사를 본문 지문으로 정리
+            clusters = await asyncio.to_thread(_merge_by_body, clusters, news_items, config.dedupe_max_distance)
+        skipped = len(items) - len(clusters)
+        if skipped:
+            logger.info(f"🧬 {query}: 중복 기사 {skipped}건 묶음 ({len(items)}건 중 {len(clusters)}건 반환)")
+        # 색인 갱신은 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        await asyncio.to_thread(_archive, context, items, news_items)
+    return _to_text([_format_cluster(c, items, news_items, options) for c in clusters], options.compact)
+
+def _extraction_failed(news_item: NewsItem) -> bool:
+    return not news_item.content or news_item.content.startswith("본문 추출 실패")
+
+def _merge_by_body(clusters: List[Cluster], news_items: List[NewsItem], max_distance: int) -> List[Cluster]:
+    """추출에 성공한 대표 기사의 본문 지문으로 묶음을 합칩니다."""
+    for c in clusters:
+        news_item = news_items[c.representative]
+        c.body = None if _extraction_failed(news_item) else body_fingerprint(news_item.content)
+    return merge_by_body(clusters, max_distance)
+
+def _format_cluster(
+    cluster: Cluster,
+    items: List[Dict[str, Any]],
+    news_items: List[NewsItem],
+    options: OutputOptions
+) -> Dict[str, Any]:
+    """대표 기사를 응답 형식으로 변환하고, 중복 기사는 언론사 링크만 덧붙입니다."""
+    formatted_item = render(news_items[cluster.representative], options)
+    if cluster.aliases:
+        formatted_item['중복기사'] = [items[i].get('originallink') or items[i].get('link', '') for i in cluster.aliases]
+    return formatted_item
+
+def _archive(context: Any, items: List[Dict[str, Any]], news_items: List[NewsItem]) -> None:
+    """본문 추출에 성공한 기사를 보관소에 저장합니다. (보관소를 끈 경우 무시)"""
+    if context.article_archive is None:
+        return
+    extracted = [
+        {**item, 'content': news_item.content}
+        for item, news_item in zip(items, news_items)
+        if not _extraction_failed(news_item)
+    ]
+    try:
+        context.article_archive.add(extracted)
+    except Exception as e:
+        # 보관 실패가 검색 결과 반환을 막지 않도록 기록만 남김
+        logger.warning(f"기사 보관소 저장 실패: {e}")
+
+@mcp.tool(
+    name="search_news_archive",
+    description="""
+    Search the local archive of articles whose full content was already extracted by earlier 'search_news_detail' calls.
+    Answers in milliseconds without any Naver API call or page download, so use it first for follow-up questions on a topic you have already researched.
+    'query' supports space-separated words (all must match), "quoted phrases" and -excluded words, matched as substrings of the title and body
+    (suited to Korean compounds and particles). Leave it empty to list articles by date.
+    'start_date'/'end_date' (YYYY-MM-DD, inclusive, Korea time) restrict the publication date. 'sort' is 'sim' (relevance) or 'date' (newest first).
+    If nothing relevant is found, fall back to 'search_news' and 'search_news_detail'.
+    'max_chars' and 'snippet_chars' work as in 'search_news_detail'.
+    """ + OUTPUT_HELP,
+    tags={"기사", "뉴스", "검색", "보관소", "본문"}
+)
+@timed_tool
+async def search_news_archive(
+    query: str = "",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    display: Optional[int] = 10,
+    start: Optional[int] = 1,
+    sort: Optional[str] = "sim",
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    max_chars: Optional[int] = 0,
+    snippet_chars: Optional[int] = 0,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    보관한 기사 본문 검색 (네이버 API 호출 없음)
+    Args:
+        query (str): 검색어 (공백 구분 단어 모두 포함, "구문", -제외어, 기본값: 전체)
+        start_date (Optional[str]): 시작 발행일 YYYY-MM-DD (기본값: 제한 없음)
+        end_date (Optional[str]): 마지막 발행일 YYYY-MM-DD (기본값: 제한 없음)
+        display (Optional[int]): 결과 수 (기본값: 10, 최대 100)
+        start (Optional[int]): 시작 위치 (기본값: 1)
+        sort (Optional[str]): 정렬 옵션 sim/date (기본값: "sim")
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 포함 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
+        max_chars (Optional[int]): 기사 본문 최대 글자 수 (기본값: 0, 제한 없음)
+        snippet_chars (Optional[int]): 검색어 주변으로 남길 앞뒤 글자 수 (기본값: 0, 본문 전체)
+    Returns:
+        TextContent: 보관소에서 찾은 기사 리스트 (본문 포함)
+    """
+    context = with_context(ctx, "search_news_archive", lambda context: context)
+    if context.article_archive is None:
+        raise ValueError("기사 보관소가 비활성화되어 있습니다. (NAVER_NEWS_ARCHIVE_PATH)")
+    options = OutputOptions.build(
+        fields,
+        compact,
+        default_fields=DETAIL_FIELDS,
+        default_compact=context.client.config.output_compact,
+        max_chars=max_chars,
+        snippet_chars=snippet_chars,
+        query=query
+    )
+    # FTS5 검색은 이벤트 루프를 막지 않도록 스레드에서 실행
+    items = await asyncio.to_thread(
+        context.article_archive.search,
+        query=query,
+        start_date=start_date,
+        end_date=end_date,
+        display=max(1, min(display or 10, 100)),
+        start=max(1, start or 1),
+        sort=sort or "sim"
+    )
+    return _to_text([_format_item(item, options) for item in items], options.compact)
+
+@mcp.tool(
+    name="search_news_all",
+    description="""
+    Collect up to the full 1,000-article search window for a topic in a single call.
+    Pages are requested in parallel (at a lower priority than interactive searches), duplicate links are removed, and results are returned in search-rank order.
+    Like 'search_news', this returns only API results without article content. Use it instead of calling 'search_news' repeatedly with increasing 'start' values.
+    Set 'stream' to true to receive each page as a log notification as soon as it arrives.
+    """ + OUTPUT_HELP,
+    tags={"기사", "뉴스", "검색", "네이버뉴스", "대량수집"}
+)
+@timed_tool
+async def search_news_all(
+    query: str,
+    max_results: Optional[int] = 1000,
+    sort: Optional[str] = "sim",
+    stream: Optional[bool] = False,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    네이버 뉴스 전체 구간 수집 (페이지 병렬 요청, 본문 미포함)
+    Args:
+        query (str): 검색어
+        max_results (Optional[int]): 최대 수집 기사 수 (기본값: 1000, 최대 1000)
+        sort (Optional[str]): 정렬 옵션 (기본값: "sim")
+        stream (Optional[bool]): 수집된 페이지를 즉시 알림으로 전송 (기본값: False)
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 외 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
+    Returns:
+        TextContent: 검색 순위 순서의 기사 요약 리스트
+    """
+    context = with_context(ctx, "search_news_all", lambda context: context)
+    options = OutputOptions.build(fields, compact, default_compact=context.client.config.output_compact)
+    max_results = max(1, min(max_results or 1000, 1000))
+    # 페이지 수만큼 진행률을 보고 (전체 건수가 적으면 일찍 끝남)
+    progress = ProgressReporter("search_news_all", total=-(-max_results // 100), stream=bool(stream))
+    pages = []
+    async for start, items in context.news.aiter_news_pages(query, max_results=max_results, sort=sort):
+        pages.append((start, items))
+        logger.info(f"📥 {query}: start={start} 페이지 {len(items)}건 수집")
+        await progress.advance({'시작위치': start, '기사': [_format_item(item, options) for item in items]})
+    pages.sort(key=lambda page: page[0])
+    formatted_result = [_format_item(item, options) for _, items in pages for item in items]
+    return _to_text(formatted_result, options.compact)
+
+@mcp.tool(
+    name="search_news_batch",
+    description="""
+    Search many related keywords (company names, tickers, people, ...) in a single call instead of calling 'search_news' once per keyword.
+    Each entry in 'queries' may override 'display' and 'sort'. All searches run concurrently through the shared rate limiter and cache.
+    Results are grouped per query. An article found by several queries is returned in full only once (under the first query), lists every query that found it, and appears under later queries as a short reference.
+    """ + OUTPUT_HELP,
+    tags={"기사", "뉴스", "검색", "네이버뉴스", "배치"}
+)
+@timed_tool
+async def search_news_batch(
+    queries: List[BatchQuery],
+    display: Optional[int] = 10,
+    sort: Optional[str] = "sim",
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    여러 검색어 동시 검색 (본문 미포함)
+    Args:
+        queries (List[BatchQuery]): 검색 요청 목록 (검색어별 display/sort 지정 가능)
+        display (Optional[int]): 공통 결과 수 (기본값: 10)
+        sort (Optional[str]): 공통 정렬 옵션 (기본값: "sim")
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 외 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
+    Returns:
+        TextContent: 검색어별로 묶인 기사 요약 리스트 (검색어 간 중복 제거)
+    """
+    context = with_context(ctx, "search_news_batch", lambda context: context)
+    options = OutputOptions.build(fields, compact, default_compact=context.client.config.output_compact)
+    specs = [
+        {
+            'query': q.query,
+            'display': q.display or display,
+            'sort': q.sort or sort
         }
-        formatted_result.append(formatted_item)
-    return TextContent(
-        type="text",
-        text=json.dumps(formatted_result, ensure_ascii=False, indent=2)
-    ) 
\ No newline at end of file
+        for q in queries
+    ]
+    results = await context.news.asearch_many(specs)
+    return _to_text(_group_batch_results(specs, results, options), options.compact)
+
+def _group_batch_results(
+    specs: List[Dict[str, Any]],
+    results: List[Dict[str, Any]],
+    options: OutputOptions = OutputOptions()
+) -> List[Dict[str, Any]]:
+    """배치 검색 결과를 검색어별로 묶고, 여러 검색어에 걸친 기사는 한 번만 전체를 포함합니다."""
+    hits: Dict[str, List[str]] = {}
+    for spec, result in zip(specs, results):
+        for item in result.get('items', []):
+            queries_hit = hits.setdefault(item.get('link', ''), [])
+            if spec['query'] not in queries_hit:
+                queries_hit.append(spec['query'])
+
+    grouped = []
+    emitted = set()
+    for spec, result in zip(specs, results):
+        articles = []
+        for item in result.get('items', []):
+            link = item.get('link', '')
+            if link in emitted:
+                articles.append({'링크': link, '중복': hits[link][0]})
+                continue
+            emitted.add(link)
+            formatted_item = _format_item(item, options)
+            formatted_item['적중검색어'] = hits[link]
+            articles.append(formatted_item)
+        group: Dict[str, Any] = {'검색어': spec['query'], '기사': articles}
+        if result.get('error'):
+            group['오류'] = result['error']
+        grouped.append(group)
+    return grouped
+
+@mcp.tool(
+    name="get_api_quota",
+    description="""
+    Report the remaining Naver Open API budget: calls used and remaining today against the daily quota, plus the current per-second rate-limit state.
+    Also reports the search result cache hit/miss counts, i.e. how many API calls the cache has saved.
+    Use this before large collection jobs to check how many searches are still available today.
+    """,
+    tags={"네이버뉴스", "API", "한도"}
+)
+@timed_tool
+def get_api_quota(ctx: Optional[Any] = None) -> TextContent:
+    """
+    네이버 API 일일 한도 및 속도 제한 현황 조회
+    Returns:
+        TextContent: 사용량, 남은 호출 수, 대기 중인 요청 수, 검색 캐시 적중/미적중 수
+    """
+    context = with_context(ctx, "get_api_quota", lambda context: context)
+    status = context.rate_limiter.status()
+    if context.search_cache is not None:
+        # 캐시 적중 수만큼 API 호출을 아낌
+        status["search_cache"] = context.search_cache.stats()
+    return _to_text(status, context.client.config.output_compact)
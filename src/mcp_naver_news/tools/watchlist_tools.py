@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from mcp.types import TextContent
+
+from mcp_naver_news.server import mcp
+from mcp_naver_news.tools.news_tools import OUTPUT_HELP, _format_item, _to_text
+from mcp_naver_news.utils.ctx_helper import with_context
+from mcp_naver_news.utils.metrics import timed_tool
+from mcp_naver_news.utils.output import OutputOptions
+
+logger = logging.getLogger("mcp-naver-news")
+
+@mcp.tool(
+    name="watch_news",
+    description="""
+    Add keywords to (or with 'remove' true, remove them from) the news watchlist, then report the watchlist.
+    Watched keywords are checked by 'poll_watchlist', which returns only articles published since the previous check.
+    The first check of a new keyword records its latest articles as the starting point and returns nothing.
+    Call with an empty 'queries' list to just list the watched keywords with their next check time, check interval and activity.
+    """,
+    tags={"뉴스", "네이버뉴스", "관심검색어", "모니터링"}
+)
+@timed_tool
+async def watch_news(
+    queries: List[str],
+    remove: Optional[bool] = False,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    관심 검색어 추가/삭제 및 목록 조회
+    Args:
+        queries (List[str]): 추가하거나 삭제할 검색어 (비우면 목록만 조회)
+        remove (Optional[bool]): True면 삭제 (기본값: False)
+    Returns:
+        TextContent: 추가/삭제한 검색어와 관심 검색어 목록 (다음 확인 시각 순)
+    """
+    context = with_context(ctx, "watch_news", lambda context: context)
+    watchlist = context.watchlist
+    result: Dict[str, Any] = {}
+    # 상태 파일/공유 저장소 접근은 이벤트 루프를 막지 않도록 스레드에서 실행
+    if queries:
+        change = watchlist.remove if remove else watchlist.add
+        result['삭제' if remove else '추가'] = await asyncio.to_thread(change, queries)
+    result['관심검색어'] = [state.summary() for state in await asyncio.to_thread(watchlist.states)]
+    return _to_text(result, context.client.config.output_compact)
+
+@mcp.tool(
+    name="poll_watchlist",
+    description="""
+    Check the watched keywords for new articles and return only articles that were not returned before, newest first, grouped by keyword.
+    Each keyword is checked on its own adaptive schedule (often for busy keywords, rarely for quiet ones), so calling this frequently
+    only spends Naver API calls on keywords that are due; set 'force' to true to check every keyword now.
+    Results are paged by date only until already-seen articles are reached. Use 'queries' to check only some watched keywords.
+    """ + OUTPUT_HELP,
+    tags={"뉴스", "네이버뉴스", "관심검색어", "모니터링", "새기사"}
+)
+@timed_tool
+async def poll_watchlist(
+    force: Optional[bool] = False,
+    queries: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    관심 검색어 새 기사 확인 (확인할 때가 된 검색어만 API 호출)
+    Args:
+        force (Optional[bool]): 확인 시각과 관계없이 모두 확인 (기본값: False)
+        queries (Optional[List[str]]): 확인할 관심 검색어 (기본값: 전체)
+        fields (Optional[List[str]]): 포함할 필드 (기본값: 본문 외 전체)
+        compact (Optional[bool]): 들여쓰기 없는 JSON (기본값: NAVER_NEWS_OUTPUT_COMPACT)
+    Returns:
+        TextContent: 검색어별 새 기사, 확인한 검색어 수, 사용한 API 호출 수, 다음 확인 시각
+    """
+    context = with_context(ctx, "poll_watchlist", lambda context: context)
+    options = OutputOptions.build(fields, compact, default_compact=context.client.config.output_compact)
+    results = await context.watchlist.poll(context.news, force=bool(force), queries=queries)
+    new_articles = [
+        {'검색어': state.query, '기사': [_format_item(item, options) for item in items]}
+        for state, items, error in results if items
+    ]
+    errors = [{'검색어': state.query, '오류': error} for state, _, error in results if error]
+    upcoming = await asyncio.to_thread(context.watchlist.states)
+    logger.info(f"👀 관심 검색어 {len(results)}개 확인, 새 기사 {sum(len(group['기사']) for group in new_articles)}건")
+    response: Dict[str, Any] = {
+        '새기사': new_articles,
+        '확인한검색어': len(results),
+        'API호출': sum(state.last_calls for state, _, _ in results),
+        '다음확인': upcoming[0].summary()['다음확인'] if upcoming else None,
+    }
+    if errors:
+        response['오류'] = errors
+    return _to_text(response, options.compact)
@@ -0,0 +1,348 @@
+import html
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .article_cache import canonical_url
+from .query import parse_query
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 네이버 뉴스 발행일 기준 시간대 (날짜 범위 검색에 사용)
+KST = timezone(timedelta(hours=9))
+
+# 이 개수만큼 새로 저장할 때마다 보관 기간 정리와 색인 최적화를 실행
+COMPACT_EVERY = 1000
+
+# 색인 단위 글자 수. 단어를 두 글자씩 겹쳐 나눠 색인하므로 두 음절 단어(삼성, 금리)와
+# 복합어 안의 단어(기준금리의 금리)도 색인으로 찾고, 한 글자 단어만 LIKE로 확인
+GRAM_CHARS = 2
+
+_TAG_RE = re.compile(r"<[^>]+>")
+# 색인할 단어 (unicode61 토크나이저의 구분자와 같도록 밑줄도 구분자로 취급)
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _clean(text: str) -> str:
+    """API 응답의 강조 태그(<b>)와 HTML 엔티티를 제거합니다."""
+    return html.unescape(_TAG_RE.sub("", text or "")).strip()
+
+
+def pub_date_timestamp(pub_date: str) -> float:
+    """RFC 822 발행일(pubDate)을 타임스탬프로 변환합니다. (형식이 다르면 0)"""
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_date(value: Optional[str], end: bool = False) -> Optional[float]:
+    """
+    YYYY-MM-DD(또는 YYYYMMDD) 날짜를 한국 시간 기준 타임스탬프로 변환합니다.
+
+    Args:
+        value (str, optional): 날짜
+        end (bool): True면 그 날의 끝(다음 날 0시 직전)까지 포함
+
+    Raises:
+        ValueError: 날짜 형식이 잘못된 경우
+    """
+    if not value:
+        return None
+    text = value.strip().replace("-", "").replace(".", "")
+    try:
+        day = datetime.strptime(text, "%Y%m%d").replace(tzinfo=KST)
+    except ValueError:
+        raise ValueError(f"날짜는 YYYY-MM-DD 형식이어야 합니다: {value}") from None
+    return (day + timedelta(days=1)).timestamp() - 1e-6 if end else day.timestamp()
+
+
+def bigrams(text: str) -> str:
+    """
+    텍스트를 단어마다 두 글자씩 겹쳐 나눈 조각을 공백으로 이은 문자열로 바꿉니다. (두 글자 이하 단어는 그대로)
+
+    "기준금리 동결" → "기준 준금 금리 동결". 검색어도 같은 방식으로 나눠 연속된 조각(구문)으로 찾으면
+    단어 안의 부분 문자열 검색이 됩니다.
+    """
+    grams: List[str] = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if len(word) <= GRAM_CHARS:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + GRAM_CHARS] for i in range(len(word) - GRAM_CHARS + 1))
+    return " ".join(grams)
+
+
+def _match(term: str) -> Optional[str]:
+    """검색어를 FTS 구문 검색식으로 바꿉니다. 한 글자 단어가 있어 색인으로 찾을 수 없으면 None"""
+    words = _WORD_RE.findall(term.lower())
+    if not words or any(len(word) < GRAM_CHARS for word in words):
+        return None
+    return '"' + bigrams(term) + '"'
+
+
+def _like(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class ArticleArchive:
+    """SQLite FTS5 기반 기사 본문 보관소
+
+    search_news_detail로 추출한 기사를 정규화된 URL 기준으로 누적 저장하고, 제목/본문을
+    두 글자 조각(bigram) 색인으로 검색합니다. 조각은 저장할 때 bigrams()로 만들어 unicode61
+    토크나이저로 색인하므로, 한국어처럼 조사가 붙고 복합어가 많은 텍스트도 두 글자 이상의
+    부분 문자열을 색인으로 찾습니다. 한 글자 검색어만 있는 검색은 색인 없이 LIKE로 확인합니다. 본문이 바뀌지 않은 기사는 다시 색인하지 않으며, 보관 기간과 최대 항목 수를
+    넘는 기사는 정리(compact) 단계에서 삭제합니다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 50000, max_days: float = 365.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_days = max_days
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._since_compact = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        # 색인 조각은 트리거에서 만들므로 연결마다 함수를 등록
+        self._conn.create_function("bigrams", 1, bigrams, deterministic=True)
+        try:
+            self._create_schema()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def _create_schema(self) -> None:
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        indexed = self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'archive_grams'").fetchone() is not None
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS archive (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                link TEXT NOT NULL,
+                originallink TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                content TEXT NOT NULL,
+                pub_date TEXT NOT NULL,
+                published_at REAL NOT NULL,
+                archived_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_archive_published ON archive(published_at);
+            DROP TRIGGER IF EXISTS archive_ai;
+            DROP TRIGGER IF EXISTS archive_ad;
+            DROP TRIGGER IF EXISTS archive_au;
+            CREATE VIRTUAL TABLE IF NOT EXISTS archive_grams USING fts5(
+                title, content, content='', tokenize='unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS archive_grams_ai AFTER INSERT ON archive BEGIN
+                INSERT INTO archive_grams(rowid, title, content) VALUES (new.id, bigrams(new.title), bigrams(new.content));
+            END;
+            CREATE TRIGGER IF NOT EXISTS archive_grams_ad AFTER DELETE ON archive BEGIN
+                INSERT INTO archive_grams(archive_grams, rowid, title, content)
+                VALUES ('delete', old.id, bigrams(old.title), bigrams(old.content));
+            END;
+            CREATE TRIGGER IF NOT EXISTS archive_grams_au AFTER UPDATE OF title, content ON archive BEGIN
+                INSERT INTO archive_grams(archive_grams, rowid, title, content)
+                VALUES ('delete', old.id, bigrams(old.title), bigrams(old.content));
+                INSERT INTO archive_grams(rowid, title, content) VALUES (new.id, bigrams(new.title), bigrams(new.content));
+            END;
+            """
+        )
+        if not indexed:
+            # 트라이그램 색인을 쓰던 이전 보관소는 저장된 기사로 새 색인을 만듦
+            self._conn.execute(
+                "INSERT INTO archive_grams(rowid, title, content) SELECT id, bigrams(title), bigrams(content) FROM archive"
+            )
+            try:
+                self._conn.execute("DROP TABLE IF EXISTS archive_fts")
+            except sqlite3.OperationalError as e:
+                # trigram 토크나이저가 없는 SQLite에서는 이전 색인을 지우지 못해도 사용하지 않으므로 무시
+                logger.debug(f"이전 기사 보관소 색인을 삭제하지 못했습니다: {e}")
+        self._conn.commit()
+
+    def add(self, items: Iterable[Mapping[str, Any]]) -> int:
+        """
+        본문을 추출한 기사를 저장합니다. 이미 있는 기사는 내용이 바뀐 경우에만 다시 색인합니다.
+
+        Args:
+            items (Iterable[Mapping[str, Any]]): 네이버 API 응답 항목에 추출한 content를 더한 기사
+
+        Returns:
+            int: 새로 저장하거나 갱신한 기사 수
+        """
+        now = time.time()
+        rows = []
+        for item in items:
+            content = item.get("content") or ""
+            url = item.get("originallink") or item.get("link") or ""
+            if not content or not url:
+                continue
+            pub_date = item.get("pubDate", "")
+            rows.append((
+                canonical_url(url),
+                item.get("link", ""),
+                item.get("originallink", ""),
+                _clean(item.get("title", "")),
+                _clean(item.get("description", "")),
+                content,
+                pub_date,
+                pub_date_timestamp(pub_date),
+                now
+            ))
+        if not rows:
+            return 0
+        with self._lock:
+            cursor = self._conn.executemany(
+                """
+                INSERT INTO archive
+                    (url, link, originallink, title, description, content, pub_date, published_at, archived_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    description = excluded.description,
+                    content = excluded.content,
+                    archived_at = excluded.archived_at
+                WHERE archive.content != excluded.content OR archive.title != excluded.title
+                """,
+                rows
+            )
+            self._conn.commit()
+            # 내용이 같아 갱신하지 않은 기사는 rowcount에 포함되지 않음
+            changed = max(0, cursor.rowcount)
+            self._since_compact += changed
+            due = self._since_compact >= COMPACT_EVERY
+        if due:
+            self.compact()
+        return changed
+
+    def search(
+        self,
+        query: str = "",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim"
+    ) -> List[Dict[str, Any]]:
+        """
+        보관한 기사를 검색어와 발행일 범위로 검색합니다.
+
+        Args:
+            query (str): 검색어 (공백 구분 단어는 모두 포함, "구문", -제외어). 비우면 날짜 범위 전체
+            start_date (str, optional): 시작 발행일 (YYYY-MM-DD, 포함)
+            end_date (str, optional): 마지막 발행일 (YYYY-MM-DD, 포함)
+            display (int): 결과 수
+            start (int): 시작 위치 (1부터)
+            sort (str): "sim"이면 관련도순(BM25), "date"면 최신순
+
+        Returns:
+            List[Dict[str, Any]]: 네이버 API 응답 항목 형식의 기사 (content 포함)
+
+        Raises:
+            ValueError: 날짜 형식이 잘못된 경우
+        """
+        include, exclude = parse_query(query)
+        # 한 글자 단어가 있는 검색어는 색인으로 찾을 수 없으므로 색인 결과 안에서 LIKE로 확인
+        indexed = [match for match in map(_match, include) if match]
+        conditions: List[str] = []
+        params: List[Any] = []
+        if indexed:
+            conditions.append("archive_grams MATCH ?")
+            params.append(" AND ".join(indexed))
+        for term in include:
+            if _match(term) is None:
+                conditions.append("(a.title LIKE ? ESCAPE '\\' OR a.content LIKE ? ESCAPE '\\')")
+                params += [_like(term), _like(term)]
+        for term in exclude:
+            match = _match(term)
+            if match is not None:
+                conditions.append("a.id NOT IN (SELECT rowid FROM archive_grams WHERE archive_grams MATCH ?)")
+                params.append(match)
+            else:
+                conditions.append("NOT (a.title LIKE ? ESCAPE '\\' OR a.content LIKE ? ESCAPE '\\')")
+                params += [_like(term), _like(term)]
+        since = parse_date(start_date)
+        until = parse_date(end_date, end=True)
+        if since is not None:
+            conditions.append("a.published_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("a.published_at <= ?")
+            params.append(until)
+
+        if indexed:
+            source = "archive_grams JOIN archive AS a ON a.id = archive_grams.rowid"
+            order = "bm25(archive_grams), a.published_at DESC" if sort != "date" else "a.published_at DESC"
+        else:
+            source = "archive AS a"
+            order = "a.published_at DESC"
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            "SELECT a.title, a.link, a.originallink, a.description, a.pub_date, a.content "
+            f"FROM {source} {where} ORDER BY {order} LIMIT ? OFFSET ?"
+        )
+        params += [max(1, display), max(0, start - 1)]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "title": row[0],
+                "link": row[1],
+                "originallink": row[2],
+                "description": row[3],
+                "pubDate": row[4],
+                "content": row[5],
+            }
+            for row in rows
+        ]
+
+    def compact(self) -> Dict[str, int]:
+        """
+        보관 기간이 지났거나 최대 항목 수를 넘는 기사를 삭제하고 FTS 색인 세그먼트를 병합합니다.
+
+        Returns:
+            Dict[str, int]: 삭제한 기사 수(removed)와 남은 기사 수(entries)
+        """
+        started = time.perf_counter()
+        with self._lock:
+            removed = 0
+            if self.max_days > 0:
+                # 발행일을 알 수 없는 기사는 저장 시각 기준
+                cutoff = time.time() - self.max_days * 86400
+                removed += self._conn.execute(
+                    "DELETE FROM archive WHERE (CASE WHEN published_at > 0 THEN published_at ELSE archived_at END) < ?",
+                    (cutoff,)
+                ).rowcount
+            if self.max_entries > 0:
+                removed += self._conn.execute(
+                    "DELETE FROM archive WHERE id IN "
+                    "(SELECT id FROM archive ORDER BY published_at DESC, id DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+            self._conn.execute("INSERT INTO archive_grams(archive_grams) VALUES ('optimize')")
+            self._conn.commit()
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM archive").fetchone()
+            self._since_compact = 0
+        logger.info(f"🗜️ 기사 보관소 정리: {removed}건 삭제, {entries}건 보관 ({time.perf_counter() - started:.2f}s)")
+        return {"removed": removed, "entries": int(entries)}
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM archive").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,198 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 정규화 시 제거할 추적용 쿼리 파라미터 접두어
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+# 조회 시각(accessed_at)은 이만큼 모아서 한 번에 기록 (조회할 때마다 커밋하지 않음)
+TOUCH_BATCH = 32
+
+# 기본 용량 정리 주기(저장 건수). 최대 항목 수를 잠시 이만큼 넘을 수 있음
+EVICT_EVERY = 50
+
+
+def canonical_url(url: str) -> str:
+    """
+    캐시 키로 사용할 정규화된 URL을 반환합니다.
+
+    스킴/호스트 소문자화, 프래그먼트 및 추적용 파라미터 제거를 수행합니다.
+    """
+    parsed = urlparse(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        urlencode(query),
+        ""
+    ))
+
+
+@dataclass
+class CachedArticle:
+    """캐시된 기사 추출 결과"""
+
+    url: str
+    title: str
+    content: str
+    etag: str = ""
+    last_modified: str = ""
+    fetched_at: float = 0.0
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재검증 요청에 사용할 조건부 헤더를 반환합니다."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_result(self) -> Dict[str, str]:
+        """extract_article_content 결과 형식으로 변환합니다."""
+        return {'title': self.title, 'content': self.content, 'error': ''}
+
+
+class ArticleCache:
+    """SQLite 기반 영구 기사 본문 캐시
+
+    정규화된 URL을 키로 추출된 제목/본문과 ETag/Last-Modified를 저장하며,
+    최대 항목 수를 넘으면 가장 오래 조회되지 않은 항목부터 삭제합니다.
+    조회 시각 갱신과 용량 정리는 TOUCH_BATCH건, evict_every건 단위로 모아서 실행합니다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000, fresh_seconds: float = 600.0, evict_every: int = EVICT_EVERY):
+        self.path = path
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.evict_every = max(1, evict_every)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._since_evict = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                etag TEXT NOT NULL DEFAULT '',
+                last_modified TEXT NOT NULL DEFAULT '',
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles(accessed_at)")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedArticle]:
+        """
+        캐시된 기사를 조회합니다.
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            Optional[CachedArticle]: 캐시된 기사 (없으면 None)
+        """
+        key = canonical_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, content, etag, last_modified, fetched_at FROM articles WHERE url = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touched()
+                self._conn.commit()
+        return CachedArticle(key, row[0], row[1], row[2], row[3], row[4])
+
+    def is_fresh(self, entry: CachedArticle) -> bool:
+        """재검증 없이 바로 사용할 수 있을 만큼 최근에 받은 항목인지 확인합니다."""
+        return time.time() - entry.fetched_at < self.fresh_seconds
+
+    def put(self, url: str, title: str, content: str, etag: str = "", last_modified: str = "") -> None:
+        """
+        추출 결과를 저장하고 용량을 넘는 항목을 정리합니다.
+
+        Args:
+            url (str): 기사 URL
+            title (str): 기사 제목
+            content (str): 기사 본문
+            etag (str): 응답 ETag 헤더
+            last_modified (str): 응답 Last-Modified 헤더
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (canonical_url(url), title, content, etag or "", last_modified or "", now, now)
+            )
+            self._since_evict += 1
+            if self._since_evict >= self.evict_every:
+                self._evict()
+            self._conn.commit()
+
+    def revalidated(self, entry: CachedArticle) -> Dict[str, str]:
+        """304 응답으로 확인된 항목의 수신 시각을 갱신하고 결과를 반환합니다."""
+        with self._lock:
+            self._conn.execute("UPDATE articles SET fetched_at = ? WHERE url = ?", (time.time(), entry.url))
+            self._conn.commit()
+        return entry.to_result()
+
+    def _flush_touched(self) -> None:
+        """모아 둔 조회 시각을 기록합니다. (커밋은 호출한 쪽에서)"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE articles SET accessed_at = ? WHERE url = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """최대 항목 수를 넘는 만큼 오래 조회되지 않은 항목을 삭제합니다."""
+        self._since_evict = 0
+        if self.max_entries <= 0:
+            return
+        # 최근 조회한 항목이 삭제되지 않도록 조회 시각을 먼저 기록
+        self._flush_touched()
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM articles WHERE url IN "
+                "(SELECT url FROM articles ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """모아 둔 조회 시각을 기록하고 데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
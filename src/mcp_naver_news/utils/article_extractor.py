@@ -1,114 +1,285 @@
 import os
 import re
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+import asyncio
+import contextlib
+import itertools
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, Mapping, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse
+
+from mcp_naver_news.utils.article_cache import ArticleCache, CachedArticle
+from mcp_naver_news.utils.extraction_engine import ExtractionEngine, default_engine
+from mcp_naver_news.utils.http import ARTICLE_HEADERS, get_shared_article_session
+from mcp_naver_news.utils.link_resolver import HostStats
+from mcp_naver_news.utils.metrics import PARSE_SECONDS, FetchTrace, metrics
+
+if TYPE_CHECKING:
+    import requests
+    from mcp_naver_news.utils.parse_pool import ParsePool
 
 logger = logging.getLogger("mcp-naver-news")
 
-def extract_article_content(url: str, output_dir: Optional[str] = None, retry_mode: bool = False) -> Dict[str, str]:
+# 스트리밍 추출 시 한 번에 읽어 파서에 넣는 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 호스트 통계가 없을 때의 요청 제한 시간(초). 통계가 있으면 호스트별 응답 시간에 맞춰 줄임
+REQUEST_TIMEOUT = 10.0
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# 증분 파싱 스레드 수. lxml 파서는 한 스레드에서만 안전하게 사용할 수 있으므로 문서마다
+# 단일 스레드 실행기 하나를 골라 끝까지 그 스레드에서 파싱하고, 여러 문서는 나눠서 동시에 파싱
+STREAM_PARSE_THREADS = min(4, os.cpu_count() or 1)
+
+# 스레드는 처음 작업을 넘길 때 생성되므로 import 시 부작용 없음
+_STREAM_PARSE_EXECUTORS = tuple(
+    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"mcp-naver-news-stream-{i}")
+    for i in range(STREAM_PARSE_THREADS)
+)
+_stream_parse_turn = itertools.count()
+
+def extract_article_content(
+    url: str,
+    output_dir: Optional[str] = None,
+    retry_mode: bool = False,
+    session: Optional["requests.Session"] = None,
+    cache: Optional[ArticleCache] = None,
+    engine: Optional[ExtractionEngine] = None,
+    stats: Optional[HostStats] = None
+) -> Dict[str, str]:
+    # 동기 경로에서만 필요한 requests는 호출 시 로드
+    import requests
+
     today = datetime.now().strftime("%Y%m%d")
+    started = time.perf_counter()
+    document = None
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            return entry.to_result()
+        if stats is not None and not stats.allow(url):
+            return _blocked(url)
+        session = session or get_shared_article_session()
+        timeout = stats.timeout(url, REQUEST_TIMEOUT) if stats is not None else REQUEST_TIMEOUT
+        with session.get(url, headers=_request_headers(entry), timeout=timeout, stream=True) as response:
+            if entry is not None and response.status_code == 304:
+                # 변경되지 않은 기사는 파싱 없이 캐시된 본문 사용
+                return cache.revalidated(entry)
+            response.raise_for_status()
+            document = (engine or default_engine).stream(url, _charset(response.headers))
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if document.feed(chunk):
+                    # 본문을 찾았거나 크기 제한에 도달하면 나머지는 받지 않음
+                    break
+        result = document.result()
+        _store(cache, url, result, response.headers)
+        _record(stats, url, not result['error'], started, document.bytes_read, document.parse_seconds)
+        return result
+    except requests.exceptions.RequestException as e:
+        status = e.response.status_code if e.response is not None else None
+        timed_out = isinstance(e, requests.exceptions.Timeout)
+        _record(stats, url, False, started, reachable=_responded(status), timed_out=timed_out)
+        return {
+            'title': '',
+            'content': '',
+            'error': f'기사 접근 중 오류 발생: {str(e)}'
+        }
+    except Exception as e:
+        if document is not None:
+            _record(stats, url, False, started, document.bytes_read, document.parse_seconds)
+        return {
+            'title': '',
+            'content': '',
+            'error': f'기사 파싱 중 오류 발생: {str(e)}'
         }
-        domain = urlparse(url).netloc
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        title = soup.find('title').text.strip() if soup.find('title') else ''
-        content = ''
-        if 'news.naver.com' in domain:
-            article = soup.find('div', id='newsct_article') or soup.find('div', id='articeBody')
-            if article:
-                for element in article.find_all(['script', 'style', 'iframe', 'ins']):
-                    element.decompose()
-                content = article.get_text(strip=True)
-        elif 'nspna.com' in domain:
-            article = (
-                soup.find('div', id='articleBody') or
-                soup.find('div', class_='article-body') or
-                soup.find('div', class_='article-content') or
-                soup.find('article')
+
+async def aextract_article_content(
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    cache: Optional[ArticleCache] = None,
+    engine: Optional[ExtractionEngine] = None,
+    stats: Optional[HostStats] = None,
+    parse_pool: Optional["ParsePool"] = None
+) -> Dict[str, str]:
+    """
+    extract_article_content의 비동기 버전. 이벤트 루프를 막지 않고 기사 본문을 추출합니다.
+
+    Args:
+        url (str): 뉴스 기사 URL
+        client (httpx.AsyncClient, optional): 공유 비동기 HTTP 클라이언트
+        cache (ArticleCache, optional): 영구 기사 캐시 (조건부 재검증에 사용)
+        engine (ExtractionEngine, optional): 본문 추출 엔진 (기본값: 내장 언론사 규칙)
+        stats (HostStats, optional): 호스트별 다운로드/파싱 통계 (요청 제한 시간과 차단 여부에도 사용)
+        parse_pool (ParsePool, optional): 파싱을 맡길 작업자 풀 (없으면 스레드에서 증분 파싱)
+
+    Returns:
+        Dict[str, str]: title, content, error 키를 가진 추출 결과
+    """
+    started = time.perf_counter()
+    bytes_read, parse_seconds = 0, 0.0
+    # 연결/TLS/첫 바이트까지의 시간 측정
+    trace = FetchTrace()
+    try:
+        # SQLite 캐시 조회/저장은 이벤트 루프를 막지 않도록 스레드에서 실행
+        entry = await asyncio.to_thread(cache.get, url) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            return entry.to_result()
+        if stats is not None and not stats.allow(url):
+            return _blocked(url)
+        timeout = stats.timeout(url, REQUEST_TIMEOUT) if stats is not None else REQUEST_TIMEOUT
+        async with contextlib.AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(headers=ARTICLE_HEADERS, follow_redirects=True)
+                )
+            response = await stack.enter_async_context(
+                client.stream("GET", url, headers=_request_headers(entry), timeout=timeout, extensions={"trace": trace})
             )
-            if article:
-                for element in article.find_all(['script', 'style', 'iframe', 'ins', 'div', 'class']):
-                    element.decompose()
-                content = article.get_text(strip=True)
-        elif 'yna.co.kr' in domain:
-            article = soup.find('article', class_='story-news')
-            if article:
-                content = article.get_text(strip=True)
-        elif 'hankyung.com' in domain:
-            article = soup.find('div', id='articletxt')
-            if article:
-                content = article.get_text(strip=True)
-        else:
-            article = soup.find('article') or soup.find('div', class_=re.compile('article|content|body'))
-            if article:
-                content = article.get_text(strip=True)
-        if not content:
-            article = soup.find('div', id='articleBody', class_=lambda x: x and 'view_con' in x)
-            if article:
-                for element in article.find_all(['script', 'style', 'iframe', 'ins']):
-                    element.decompose()
-                content = article.get_text(strip=True)
-            if not content:
-                candidate_selectors = [
-                    {'id': 'articleBody'}, {'class_': 'article-body'}, {'class_': 'article-content'},
-                    {'class_': 'view_con'}, {'id': 'news_content'}, {'id': 'content'}, {'id': 'textBody'},
-                    {'id': 'article_content'}, {'id': 'article'}, {'class_': 'article'},
-                    {'id': 'article-view-content-div'}, {'name': 'article'}, {'name': 'section', 'class_': 'article'},
-                ]
-                for sel in candidate_selectors:
-                    if 'id' in sel and 'class_' in sel:
-                        article = soup.find(sel.get('name', 'div'), id=sel['id'], class_=sel['class_'])
-                    elif 'id' in sel:
-                        article = soup.find(id=sel['id'])
-                    elif 'class_' in sel:
-                        article = soup.find(class_=sel['class_'])
-                    elif 'name' in sel and 'class_' in sel:
-                        article = soup.find(sel['name'], class_=sel['class_'])
-                    elif 'name' in sel:
-                        article = soup.find(sel['name'])
-                    else:
-                        article = None
-                    if article:
-                        for element in article.find_all(['script', 'style', 'iframe', 'ins']):
-                            element.decompose()
-                        content = article.get_text(strip=True)
-                        if content:
-                            break
-        if content and len(content) < 100:
-            content = ''
-        if not content:
-            error_msg = '본문 내용을 찾을 수 없습니다.'
-            return {
-                'title': title,
-                'content': '',
-                'error': error_msg
-            }
+            if entry is not None and response.status_code == 304:
+                # 변경되지 않은 기사는 파싱 없이 캐시된 본문 사용
+                return await asyncio.to_thread(cache.revalidated, entry)
+            response.raise_for_status()
+            if parse_pool is None:
+                result, bytes_read, parse_seconds = await _parse_streaming(response, url, engine or default_engine)
+            else:
+                data = await _read_capped(response, (engine or default_engine).stream_max_bytes)
+                bytes_read = len(data)
+                result, parse_seconds = await parse_pool.parse(data, url, _charset(response.headers))
+        if cache is not None:
+            await asyncio.to_thread(_store, cache, url, result, response.headers)
+        _record(stats, url, not result['error'], started, bytes_read, parse_seconds, trace)
+        return result
+    except httpx.PoolTimeout as e:
+        # 커넥션 풀이 부족해 요청을 보내지 못한 것이므로 호스트 통계에는 기록하지 않음
         return {
-            'title': title,
-            'content': content,
-            'error': ''
+            'title': '',
+            'content': '',
+            'error': f'기사 접근 중 오류 발생: {str(e)}'
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
+        status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+        timed_out = isinstance(e, httpx.TimeoutException)
+        _record(stats, url, False, started, bytes_read, parse_seconds, trace, reachable=_responded(status), timed_out=timed_out)
         return {
             'title': '',
             'content': '',
             'error': f'기사 접근 중 오류 발생: {str(e)}'
         }
     except Exception as e:
+        _record(stats, url, False, started, bytes_read, parse_seconds, trace)
         return {
             'title': '',
             'content': '',
             'error': f'기사 파싱 중 오류 발생: {str(e)}'
-        } 
\ No newline at end of file
+        }
+
+async def _parse_streaming(
+    response: httpx.Response,
+    url: str,
+    engine: ExtractionEngine
+) -> Tuple[Dict[str, str], int, float]:
+    """응답을 받는 대로 증분 파싱하고, 본문을 찾으면 나머지는 받지 않습니다."""
+    loop = asyncio.get_running_loop()
+    # 문서 하나의 feed/result는 모두 같은 스레드에서 실행 (문서끼리는 실행기를 돌아가며 사용)
+    executor = _STREAM_PARSE_EXECUTORS[next(_stream_parse_turn) % len(_STREAM_PARSE_EXECUTORS)]
+    document = engine.stream(url, _charset(response.headers))
+    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+        # HTML 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        if await loop.run_in_executor(executor, document.feed, chunk):
+            # 본문을 찾았거나 크기 제한에 도달하면 나머지는 받지 않음
+            break
+    result = await loop.run_in_executor(executor, document.result)
+    return result, document.bytes_read, document.parse_seconds
+
+async def _read_capped(response: httpx.Response, max_bytes: int) -> bytes:
+    """응답 본문을 최대 max_bytes까지 읽습니다. (0이면 제한 없음)"""
+    chunks = []
+    size = 0
+    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+        if max_bytes > 0 and size + len(chunk) >= max_bytes:
+            chunks.append(chunk[:max_bytes - size])
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)
+
+def _record(
+    stats: Optional[HostStats],
+    url: str,
+    ok: bool,
+    started: float,
+    bytes_read: int = 0,
+    parse_seconds: float = 0.0,
+    trace: Optional[FetchTrace] = None,
+    reachable: bool = True,
+    timed_out: bool = False
+) -> None:
+    """다운로드한 기사의 바이트 수와 다운로드/파싱 시간을 호스트 통계와 지연 시간 측정값에 기록합니다."""
+    fetch_seconds = max(0.0, time.perf_counter() - started - parse_seconds)
+    if trace is not None:
+        trace.record(url, fetch_seconds)
+    if bytes_read:
+        metrics.observe(PARSE_SECONDS, parse_seconds, domain=urlparse(url).netloc.lower())
+    if stats is None:
+        return
+    stats.record(
+        url,
+        ok,
+        bytes_read=bytes_read,
+        fetch_seconds=fetch_seconds,
+        parse_seconds=parse_seconds,
+        reachable=reachable,
+        timed_out=timed_out
+    )
+
+def _responded(status: Optional[int]) -> bool:
+    """HTTP 오류가 서버 상태와 무관한 응답(404 등)이면 True. 연결 실패/시간 초과/5xx/429는 False"""
+    return status is not None and status < 500 and status != 429
+
+def _blocked(url: str) -> Dict[str, str]:
+    return {
+        'title': '',
+        'content': '',
+        'error': f'응답하지 않는 언론사 서버라 잠시 요청하지 않습니다: {urlparse(url).netloc}'
+    }
+
+def _charset(headers: Mapping[str, str]) -> Optional[str]:
+    """Content-Type 헤더에 명시된 문자 인코딩을 반환합니다."""
+    match = _CHARSET_RE.search(headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+def _request_headers(entry: Optional[CachedArticle]) -> Dict[str, str]:
+    """캐시 항목이 있으면 조건부 요청 헤더를 추가합니다."""
+    if entry is None:
+        return ARTICLE_HEADERS
+    return {**ARTICLE_HEADERS, **entry.conditional_headers()}
+
+def _store(cache: Optional[ArticleCache], url: str, result: Dict[str, str], headers: Mapping[str, str]) -> None:
+    """추출에 성공한 결과를 검증 헤더와 함께 캐시에 저장합니다."""
+    if cache is None or result.get('error'):
+        return
+    cache.put(
+        url,
+        result['title'],
+        result['content'],
+        etag=headers.get('ETag', ''),
+        last_modified=headers.get('Last-Modified', '')
+    )
+
+def parse_article_html(html: str, url: str, engine: Optional[ExtractionEngine] = None) -> Dict[str, str]:
+    """
+    기사 HTML에서 제목과 본문을 추출합니다.
+
+    Args:
+        html (str): 기사 페이지 HTML
+        url (str): 기사 URL (언론사 규칙 결정에 사용)
+        engine (ExtractionEngine, optional): 본문 추출 엔진 (기본값: 내장 언론사 규칙)
+
+    Returns:
+        Dict[str, str]: title, content, error 키를 가진 추출 결과
+    """
+    return (engine or default_engine).extract(html, url)
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """검색어의 공백을 정리하고 대소문자를 통일합니다."""
+    return " ".join(query.split()).casefold()
+
+
+class TTLCache:
+    """TTL 만료와 LRU 축출을 함께 적용하는 스레드 안전 캐시"""
+
+    def __init__(self, maxsize: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+
+        Returns:
+            Optional[Any]: 캐시된 값
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        값을 저장합니다. 용량을 넘으면 가장 오래 사용되지 않은 항목부터 축출합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            value (Any): 저장할 값
+            ttl (float): 유효 시간(초)
+        """
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self.clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미적중 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+class SharedTTLCache:
+    """StateStore에 항목을 저장하여 여러 작업자 프로세스가 함께 사용하는 TTL 캐시
+
+    TTLCache와 같은 인터페이스를 제공합니다. 키는 JSON 문자열로, 값은 JSON으로 직렬화되므로
+    값을 꺼낼 때마다 새 객체가 만들어집니다.
+    """
+
+    # 이 횟수만큼 저장할 때마다 만료/초과 항목을 정리
+    TRIM_EVERY = 64
+
+    def __init__(self, store: Any, namespace: str = "search", maxsize: int = 1024):
+        self.store = store
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        value = self.store.get(self.namespace, self._key(key))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """값을 저장합니다. 주기적으로 만료된 항목과 용량을 넘는 항목을 정리합니다."""
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        self.store.set(self.namespace, self._key(key), value, ttl)
+        with self._lock:
+            self._writes += 1
+            trim = self._writes % self.TRIM_EVERY == 0
+        if trim:
+            self.store.trim(self.namespace, self.maxsize)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        self.store.clear(self.namespace)
+
+    def __len__(self) -> int:
+        return self.store.count(self.namespace)
+
+    def stats(self) -> Dict[str, Any]:
+        """이 프로세스의 적중/미적중 통계와 공유 캐시 크기를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / total if total else 0.0
+        }
@@ -1,7 +1,9 @@
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
-from mcp_naver_news.server import naver_news_context
+from fastmcp import Context
+
+from mcp_naver_news.server import get_naver_news_context, mcp
 
 logger = logging.getLogger("mcp-naver-news")
 
@@ -32,4 +34,57 @@ def with_context(
             logger.warning(f"⚠️ MCPContext 접근 실패: {e}")
 
     logger.warning("⚠️ Fallback 전역 컨텍스트 사용")
-    return fallback_func(naver_news_context)
+    return fallback_func(get_naver_news_context())
+
+def current_request_context() -> Optional[Context]:
+    """
+    현재 처리 중인 MCP 요청의 FastMCP Context를 반환합니다.
+
+    Returns:
+        Optional[Context]: 요청 처리 중이 아니면(직접 호출, 테스트 등) None
+    """
+    context = mcp.get_context()
+    try:
+        context.request_context
+    except ValueError:
+        # 요청 밖에서는 request_context 접근 시 ValueError 발생
+        return None
+    return context
+
+class ProgressReporter:
+    """
+    MCP 진행 알림과 부분 결과 전송 도우미.
+
+    클라이언트가 progressToken을 보낸 경우 진행률 알림을 보내고,
+    stream 모드에서는 완성된 항목을 로그 알림으로 즉시 전송합니다.
+    요청 밖에서 호출되거나 전송에 실패해도 도구 실행에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self, tool_name: str, total: int, stream: bool = False):
+        self.tool_name = tool_name
+        self.total = total
+        self.stream = stream
+        self.done = 0
+        self.context = current_request_context()
+
+    async def advance(self, chunk: Optional[Dict[str, Any]] = None, index: Optional[int] = None) -> None:
+        """
+        진행률을 하나 올리고, stream 모드이면 부분 결과를 전송합니다.
+
+        Args:
+            chunk: 방금 완성된 결과 항목
+            index: 전체 결과에서 항목의 위치
+        """
+        self.done += 1
+        if self.context is None:
+            return
+        try:
+            await self.context.report_progress(self.done, self.total)
+            if self.stream and chunk is not None:
+                await self.context.request_context.session.send_log_message(
+                    level="info",
+                    data={"tool": self.tool_name, "index": index, "progress": self.done, "total": self.total, "item": chunk},
+                    logger=f"mcp-naver-news.{self.tool_name}"
+                )
+        except Exception as e:
+            logger.debug(f"진행 알림 전송 실패 ({self.tool_name}): {e}")
@@ -0,0 +1,141 @@
+import hashlib
+import html
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, List, Mapping, Optional
+
+# 지문 비트 수와 본문이 같은 기사로 볼 최대 해밍 거리
+# (옮겨 실은 기사는 바이라인/꼬리말 차이로 4~5, 다른 기사는 25 이상)
+FINGERPRINT_BITS = 64
+MAX_DISTANCE = 8
+
+# 제목/요약이 같은 기사로 볼 최소 n-gram 자카드 유사도 (짧은 텍스트는 SimHash 편차가 커서 집합을 직접 비교)
+MIN_SIMILARITY = 0.6
+
+# 문자 n-gram 길이 (띄어쓰기와 조사가 달라도 겹치도록 공백을 뺀 음절 단위)
+SHINGLE_CHARS = 3
+
+# 본문 지문은 앞부분만 사용 (통신사 기사를 옮겨 실은 기사는 도입부가 같고, 뒤쪽은 언론사별 꼬리말이 붙음)
+BODY_CHARS = 2000
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """태그, HTML 엔티티, 공백과 문장 부호를 제거하고 소문자로 바꿉니다."""
+    return _NON_WORD_RE.sub("", html.unescape(_TAG_RE.sub("", text or ""))).lower()
+
+
+def _ngrams(normalized: str) -> Iterable[str]:
+    return (normalized[i:i + SHINGLE_CHARS] for i in range(max(1, len(normalized) - SHINGLE_CHARS + 1)))
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    """정규화한 텍스트의 문자 n-gram 집합"""
+    normalized = normalize(text)
+    return frozenset(_ngrams(normalized)) if normalized else frozenset()
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """두 n-gram 집합의 자카드 유사도 (어느 한쪽이 비어 있으면 0)"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def simhash(text: str) -> int:
+    """
+    문자 n-gram의 64비트 SimHash 지문을 계산합니다.
+
+    내용이 조금만 다른 텍스트는 지문의 해밍 거리가 작습니다.
+
+    Returns:
+        int: 지문 (정규화한 텍스트가 비어 있으면 0)
+    """
+    normalized = normalize(text)
+    if not normalized:
+        return 0
+    counts = Counter(_ngrams(normalized))
+    # n-gram 해시를 2진 문자열로 늘어놓고 자리별 1의 개수를 세어 다수결 (비트별 반복보다 빠름)
+    rows: List[str] = []
+    for shingle, count in counts.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=FINGERPRINT_BITS // 8).digest()
+        rows.extend([format(int.from_bytes(digest, "big"), f"0{FINGERPRINT_BITS}b")] * count)
+    majority = len(rows) / 2
+    bits = "".join("1" if column.count("1") > majority else "0" for column in zip(*rows))
+    return int(bits, 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def item_shingles(item: Mapping[str, Any]) -> FrozenSet[str]:
+    """검색 결과 항목의 제목과 요약 n-gram (본문을 받기 전 단계의 비교 기준)"""
+    return shingles(f"{item.get('title', '')} {item.get('description', '')}")
+
+
+def body_fingerprint(content: str) -> int:
+    """추출한 본문 앞부분의 SimHash 지문"""
+    return simhash(content[:BODY_CHARS])
+
+
+@dataclass
+class Cluster:
+    """같은 기사로 판단한 검색 결과 묶음 (members[0]이 대표, 나머지는 중복)"""
+
+    members: List[int]
+    shingles: FrozenSet[str] = frozenset()
+    body: Optional[int] = None
+
+    @property
+    def representative(self) -> int:
+        return self.members[0]
+
+    @property
+    def aliases(self) -> List[int]:
+        return self.members[1:]
+
+
+def cluster_items(items: Iterable[Mapping[str, Any]], min_similarity: float = MIN_SIMILARITY) -> List[Cluster]:
+    """
+    검색 결과를 순서대로 보며 제목/요약이 비슷한 대표가 있으면 그 묶음에, 없으면 새 묶음에 넣습니다.
+
+    검색 순위가 높은 항목이 대표가 되며, 제목과 요약이 모두 빈 항목은 묶지 않습니다.
+
+    Args:
+        items (Iterable[Mapping[str, Any]]): 네이버 API 응답 항목
+        min_similarity (float): 같은 기사로 볼 최소 자카드 유사도 (1보다 크면 묶지 않음)
+
+    Returns:
+        List[Cluster]: 대표의 검색 순위 순서로 정렬된 묶음
+    """
+    clusters: List[Cluster] = []
+    for index, item in enumerate(items):
+        grams = item_shingles(item)
+        match = next((c for c in clusters if similarity(c.shingles, grams) >= min_similarity), None)
+        if match is None:
+            clusters.append(Cluster([index], grams))
+        else:
+            match.members.append(index)
+    return clusters
+
+
+def merge_by_body(clusters: List[Cluster], max_distance: int = MAX_DISTANCE) -> List[Cluster]:
+    """
+    본문 지문(body)이 가까운 묶음을 합칩니다. 앞선 묶음의 대표를 유지하고 뒤 묶음의 항목은 중복이 됩니다.
+
+    제목/요약이 달라 추출 전에는 찾지 못한 중복 기사를 추출 후에 정리합니다.
+    """
+    merged: List[Cluster] = []
+    for current in clusters:
+        match = None
+        if current.body and max_distance >= 0:
+            match = next((c for c in merged if c.body and hamming(c.body, current.body) <= max_distance), None)
+        if match is None:
+            merged.append(current)
+        else:
+            match.members.extend(current.members)
+    return merged
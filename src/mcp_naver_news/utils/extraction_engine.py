@@ -0,0 +1,389 @@
+import re
+import codecs
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from lxml import etree
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.publisher_rules import (
+    NOISE_TAGS,
+    PublisherRegistry,
+    Rule,
+    Selector,
+    load_publisher_registry,
+)
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 이보다 짧은 본문은 추출 실패로 간주
+MIN_CONTENT_LENGTH = 100
+
+# 스트리밍 추출 시 기사 하나에서 읽을 최대 바이트 수
+STREAM_MAX_BYTES = 3 * 1024 * 1024
+
+# BeautifulSoup get_text()와 마찬가지로 본문 텍스트로 취급하지 않는 요소
+NON_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+
+# 문서 앞부분에서 찾는 <meta charset> 선언 (HTML 표준의 인코딩 사전 탐색과 같은 범위)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_PRESCAN_BYTES = 1024
+
+# 웹 브라우저와 마찬가지로 EUC-KR 계열 선언은 확장 한글을 포함하는 CP949로 읽음
+_ENCODING_OVERRIDES = {"euc_kr": "cp949"}
+
+# 파서는 스레드 간에 공유하지 않음
+_parsers = threading.local()
+
+
+class SelectorSet:
+    """여러 선택자를 한 번의 문서 순회로 매칭하도록 미리 색인한 선택자 집합
+
+    각 선택자는 id > class > 태그 이름 순으로 가장 선택적인 키에 색인되어,
+    요소마다 전체 선택자가 아닌 해당 키의 후보만 검사합니다.
+    """
+
+    def __init__(self, selectors: Sequence[Selector]):
+        self.selectors: List[Selector] = list(dict.fromkeys(selectors))
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._unindexed: List[int] = []
+        for index, selector in enumerate(self.selectors):
+            if selector.id is not None:
+                self._by_id.setdefault(selector.id, []).append(index)
+            elif selector.class_ is not None:
+                self._by_class.setdefault(selector.class_, []).append(index)
+            elif selector.name is not None:
+                self._by_name.setdefault(selector.name, []).append(index)
+            else:
+                self._unindexed.append(index)
+
+    def scan(self, root: Any, stop_after: Optional[int] = None) -> List[Optional[Any]]:
+        """
+        문서를 한 번 순회하며 선택자별로 문서 순서상 첫 번째 일치 요소를 찾습니다.
+
+        Args:
+            root (lxml.etree._Element): 파싱된 문서의 루트 요소
+            stop_after (int, optional): 앞쪽 선택자 n개가 모두 찾아지면 순회를 중단
+
+        Returns:
+            List[Optional[Any]]: selectors와 같은 순서의 첫 일치 요소 (없으면 None)
+        """
+        found: List[Optional[Any]] = [None] * len(self.selectors)
+        remaining = len(self.selectors)
+        required = len(self.selectors) if stop_after is None else min(stop_after, len(self.selectors))
+        for element in root.iter(etree.Element):
+            class_attr = element.get("class")
+            classes = class_attr.split() if class_attr else ()
+            candidates = list(self._unindexed)
+            element_id = element.get("id")
+            if element_id is not None and element_id in self._by_id:
+                candidates.extend(self._by_id[element_id])
+            for token in classes:
+                candidates.extend(self._by_class.get(token, ()))
+            candidates.extend(self._by_name.get(element.tag, ()))
+            for index in candidates:
+                if found[index] is None and self.selectors[index].matches(element, classes):
+                    found[index] = element
+                    remaining -= 1
+            if remaining == 0 or all(f is not None for f in found[:required]):
+                break
+        return found
+
+
+def element_text(element: Any, strip: Sequence[str] = ()) -> str:
+    """
+    요소의 텍스트를 BeautifulSoup get_text(strip=True)와 같은 방식으로 반환합니다.
+
+    각 텍스트 조각의 앞뒤 공백을 제거해 이어 붙이며,
+    strip에 지정된 태그의 하위 텍스트는 문서를 수정하지 않고 건너뜁니다.
+    """
+    skipped = NON_TEXT_TAGS.union(strip)
+    parts = []
+    # 스택에는 요소 또는 텍스트 조각이 들어가며, 요소 뒤 텍스트(tail)가 하위 요소보다 나중에 처리되도록 쌓음
+    stack: List[Any] = [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            text = node.strip()
+            if text:
+                parts.append(text)
+            continue
+        if node is not element and node.tail:
+            stack.append(node.tail)
+        if not isinstance(node.tag, str) or node.tag in skipped:
+            continue
+        stack.extend(reversed(node))
+        if node.text:
+            stack.append(node.text)
+    return "".join(parts)
+
+
+def parse_html(html: str) -> Optional[Any]:
+    """HTML을 lxml로 파싱하여 루트 요소를 반환합니다. 빈 문서면 None을 반환합니다."""
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = etree.HTMLParser(encoding="utf-8")
+    # 문자열에 인코딩 선언이 있어도 파싱되도록 UTF-8 바이트로 전달
+    return etree.fromstring(html.encode("utf-8"), parser)
+
+
+_TITLE = Selector(name="title")
+
+
+class ExtractionEngine:
+    """lxml로 한 번 파싱하고 한 번 순회하여 기사 제목과 본문을 추출하는 엔진
+
+    레지스트리에 등록된 언론사는 해당 규칙의 선택자만으로 먼저 순회하며,
+    최우선 선택자가 찾아지면 문서의 나머지를 보지 않고 바로 종료합니다.
+    등록되지 않은 언론사이거나 규칙으로 본문을 얻지 못하면
+    기본 규칙과 공통 대체 규칙을 순서대로 적용합니다.
+    """
+
+    def __init__(
+        self,
+        registry: PublisherRegistry,
+        default_rule: Rule,
+        fallback_rules: Sequence[Rule],
+        min_length: int = MIN_CONTENT_LENGTH,
+        stream_max_bytes: int = STREAM_MAX_BYTES
+    ):
+        self.registry = registry
+        self.default_rule = default_rule
+        self.fallback_rules = list(fallback_rules)
+        self.min_length = min_length
+        self.stream_max_bytes = stream_max_bytes
+        fallback_selectors = [s for rule in self.fallback_rules for s in rule.selectors]
+        self._default_set = SelectorSet([_TITLE, *default_rule.selectors, *fallback_selectors])
+        self._fallback_set = SelectorSet([_TITLE, *fallback_selectors])
+        # 언론사별 선택자 집합은 처음 사용할 때 색인
+        self._publisher_sets: Dict[str, SelectorSet] = {}
+
+    def _publisher_set(self, domain: str, rule: Rule) -> SelectorSet:
+        selector_set = self._publisher_sets.get(domain)
+        if selector_set is None:
+            selector_set = self._publisher_sets[domain] = SelectorSet([_TITLE, *rule.selectors])
+        return selector_set
+
+    def leading_rule(self, url: str) -> Rule:
+        """URL에 가장 먼저 적용되는 규칙 (등록된 언론사 규칙 또는 기본 규칙)을 반환합니다."""
+        publisher = self.registry.lookup(urlparse(url).netloc)
+        return publisher[1] if publisher is not None else self.default_rule
+
+    def extract(self, html: str, url: str) -> Dict[str, str]:
+        """
+        기사 HTML에서 제목과 본문을 추출합니다.
+
+        Args:
+            html (str): 기사 페이지 HTML
+            url (str): 기사 URL (언론사 규칙 결정에 사용)
+
+        Returns:
+            Dict[str, str]: title, content, error 키를 가진 추출 결과
+        """
+        return self.extract_root(parse_html(html), url)
+
+    def stream(self, url: str, encoding: Optional[str] = None) -> "StreamingExtraction":
+        """
+        응답 본문을 청크 단위로 받아 추출하는 증분 파서를 생성합니다.
+
+        Args:
+            url (str): 기사 URL
+            encoding (str, optional): Content-Type 헤더의 문자 인코딩 (없으면 문서에서 감지)
+        """
+        return StreamingExtraction(self, url, encoding)
+
+    def extract_root(self, root: Optional[Any], url: str) -> Dict[str, str]:
+        """파싱된 문서에서 제목과 본문을 추출합니다."""
+        publisher = self.registry.lookup(urlparse(url).netloc)
+        found: Dict[Selector, Optional[Any]] = {}
+        content = ''
+        if root is not None and publisher is not None:
+            domain, rule = publisher
+            selector_set = self._publisher_set(domain, rule)
+            # 제목과 최우선 선택자가 찾아지면 순회 중단
+            found.update(zip(selector_set.selectors, selector_set.scan(root, stop_after=2)))
+            content = _first_content(found, [rule])
+            selector_set = self._fallback_set
+            rules = self.fallback_rules
+        else:
+            selector_set = self._default_set
+            rules = [self.default_rule, *self.fallback_rules]
+        if root is not None and not content:
+            found.update((s, e) for s, e in zip(selector_set.selectors, selector_set.scan(root)) if e is not None)
+            content = _first_content(found, rules)
+
+        title_tag = found.get(_TITLE)
+        title = "".join(title_tag.itertext()).strip() if title_tag is not None else ''
+        if content and len(content) < self.min_length:
+            content = ''
+        if not content:
+            return {
+                'title': title,
+                'content': '',
+                'error': '본문 내용을 찾을 수 없습니다.'
+            }
+        return {
+            'title': title,
+            'content': content,
+            'error': ''
+        }
+
+
+def _first_content(found: Dict[Selector, Optional[Any]], rules: Sequence[Rule]) -> str:
+    """규칙 순서대로 적용하여 처음으로 얻은 본문을 반환합니다."""
+    for rule in rules:
+        element = next((found[s] for s in rule.selectors if found.get(s) is not None), None)
+        if element is not None:
+            content = element_text(element, rule.strip)
+            if content:
+                return content
+    return ''
+
+
+class StreamingExtraction:
+    """청크 단위로 HTML을 받아 파싱하며, 본문 요소가 닫히면 더 읽을 필요가 없음을 알려주는 증분 파서
+
+    제목과 최우선 선택자에 해당하는 요소가 닫히고 그 요소에 본문이 있으면
+    나머지 문서가 결과에 영향을 주지 않으므로 다운로드를 중단할 수 있습니다.
+    읽은 양이 stream_max_bytes를 넘으면 그때까지 받은 부분만으로 추출합니다.
+    """
+
+    def __init__(self, engine: ExtractionEngine, url: str, encoding: Optional[str] = None):
+        self.engine = engine
+        self.url = url
+        self.rule = engine.leading_rule(url)
+        self.bytes_read = 0
+        self.parse_seconds = 0.0
+        self.stopped_early = False
+        self.truncated = False
+        self.encoding = encoding
+        self._title_seen = False
+        self._parser: Optional[Any] = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        청크 하나를 파싱합니다.
+
+        Returns:
+            bool: 더 읽을 필요가 없으면 True
+        """
+        max_bytes = self.engine.stream_max_bytes
+        if max_bytes > 0 and self.bytes_read + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - self.bytes_read]
+            self.truncated = True
+        started = time.perf_counter()
+        if self._parser is None:
+            self._parser = _pull_parser(self.encoding or _sniff_charset(chunk))
+        self.bytes_read += len(chunk)
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            if element.tag == "title":
+                self._title_seen = True
+            elif self._title_seen and not self.stopped_early and self._is_body(element):
+                self.stopped_early = True
+        self.parse_seconds += time.perf_counter() - started
+        if self.truncated:
+            logger.debug(f"기사 크기 제한({max_bytes}바이트)에 도달하여 읽기를 중단합니다: {self.url}")
+        return self.stopped_early or self.truncated
+
+    def _is_body(self, element: Any) -> bool:
+        """닫힌 요소가 문서 순서상 첫 번째 최우선 선택자 요소이고 본문이 있는지 확인합니다."""
+        if not isinstance(element.tag, str) or not self.rule.selectors:
+            return False
+        selector = self.rule.selectors[0]
+        if not _matches(selector, element):
+            return False
+        # 같은 선택자에 해당하는 조상 요소가 아직 열려 있으면 그 조상이 먼저 선택됨
+        if any(_matches(selector, ancestor) for ancestor in element.iterancestors()):
+            return False
+        return bool(element_text(element, self.rule.strip))
+
+    def result(self) -> Dict[str, str]:
+        """지금까지 받은 문서로 추출 결과를 반환합니다."""
+        started = time.perf_counter()
+        try:
+            root = self._parser.close() if self._parser is not None else None
+        except etree.XMLSyntaxError:
+            root = None
+        result = self.engine.extract_root(root, self.url)
+        self.parse_seconds += time.perf_counter() - started
+        return result
+
+
+def _sniff_charset(chunk: bytes) -> Optional[str]:
+    """문서 앞부분의 <meta charset> 선언을 찾습니다."""
+    match = _META_CHARSET_RE.search(chunk[:_META_PRESCAN_BYTES])
+    return match.group(1).decode("ascii") if match else None
+
+
+def _pull_parser(encoding: Optional[str]) -> Any:
+    """
+    주어진 인코딩의 증분 파서를 생성합니다.
+
+    인코딩 이름은 Python 코덱 이름으로 정규화하여(예: ks_c_5601-1987 → CP949) 먼저 시도하고,
+    인코딩을 알 수 없으면 response.text와 마찬가지로 UTF-8로 읽습니다.
+    """
+    candidates = []
+    if encoding:
+        try:
+            name = codecs.lookup(encoding).name
+            candidates.append(_ENCODING_OVERRIDES.get(name, name.replace("_", "-")))
+        except LookupError:
+            pass
+        candidates.append(encoding)
+    for candidate in candidates:
+        try:
+            return etree.HTMLPullParser(events=("end",), encoding=candidate)
+        except LookupError:
+            continue
+    return etree.HTMLPullParser(events=("end",), encoding="utf-8")
+
+
+def _matches(selector: Selector, element: Any) -> bool:
+    class_attr = element.get("class")
+    return selector.matches(element, class_attr.split() if class_attr else ())
+
+
+DEFAULT_RULE = Rule((
+    Selector(name="article"),
+    Selector(name="div", class_pattern=re.compile("article|content|body"))
+))
+FALLBACK_RULES: List[Rule] = [
+    Rule((Selector(name="div", id="articleBody", class_contains="view_con"),), strip=NOISE_TAGS),
+    *(
+        Rule((selector,), strip=NOISE_TAGS)
+        for selector in (
+            Selector(id="articleBody"),
+            Selector(class_="article-body"),
+            Selector(class_="article-content"),
+            Selector(class_="view_con"),
+            Selector(id="news_content"),
+            Selector(id="content"),
+            Selector(id="textBody"),
+            Selector(id="article_content"),
+            Selector(id="article"),
+            Selector(class_="article"),
+            Selector(id="article-view-content-div"),
+            Selector(name="article"),
+        )
+    ),
+]
+
+
+
+def build_extraction_engine(config: NaverNewsConfig) -> ExtractionEngine:
+    """기본 언론사 규칙에 NAVER_NEWS_PUBLISHER_RULES_PATH 규칙을 더한 추출 엔진을 생성합니다."""
+    return ExtractionEngine(
+        load_publisher_registry(config.publisher_rules_path),
+        DEFAULT_RULE,
+        FALLBACK_RULES,
+        stream_max_bytes=config.fetch_max_bytes
+    )
+
+
+default_engine = ExtractionEngine(load_publisher_registry(), DEFAULT_RULE, FALLBACK_RULES)
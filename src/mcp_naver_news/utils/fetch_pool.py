@@ -0,0 +1,333 @@
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.article_cache import ArticleCache, canonical_url
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+from mcp_naver_news.utils.extraction_engine import ExtractionEngine
+from mcp_naver_news.utils.link_resolver import LinkResolver, is_naver_news_host
+from mcp_naver_news.utils.parse_pool import ParsePool
+from mcp_naver_news.utils.rate_limiter import PRIORITY_BULK, PRIORITY_INTERACTIVE
+from mcp_naver_news.utils.singleflight import SingleFlight
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 기사 하나의 추출이 끝날 때마다 호출되는 콜백 (index, 결과)
+ResultCallback = Callable[[int, Dict[str, str]], Optional[Awaitable[None]]]
+
+# URL을 받아 추출 결과를 돌려주는 비동기 추출기
+AsyncExtractor = Callable[[str], Awaitable[Dict[str, str]]]
+
+
+class PrioritySemaphore:
+    """우선순위 대기열이 있는 세마포어
+
+    슬롯이 부족하면 우선순위 값이 낮은 대기자(같으면 먼저 온 대기자)부터 슬롯을 받으므로,
+    미리 받기(PRIORITY_BULK)는 대화형 추출(PRIORITY_INTERACTIVE)이 모두 슬롯을 받은 뒤에 시작합니다.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> bool:
+        if self._value > 0 and not any(not future.done() for _, _, future in self._waiters):
+            self._value -= 1
+            return True
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되면 다음 대기자에게 넘김
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        self._value += 1
+        while self._value > 0 and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._value -= 1
+            future.set_result(None)
+
+
+async def _acquire(semaphore: PrioritySemaphore, timeout: float, priority: int) -> bool:
+    """
+    세마포어를 timeout 안에 얻으면 True를 반환합니다.
+
+    시간 초과나 취소로 포기한 획득이 그 뒤에 이루어지면 바로 돌려주므로 슬롯이 새지 않습니다.
+    """
+    task = asyncio.ensure_future(semaphore.acquire(priority))
+    try:
+        done, _ = await asyncio.wait({task}, timeout=max(0.0, timeout))
+    except BaseException:
+        _abandon(task, semaphore)
+        raise
+    if done:
+        return True
+    _abandon(task, semaphore)
+    return False
+
+
+def _abandon(task: "asyncio.Future[bool]", semaphore: PrioritySemaphore) -> None:
+    task.cancel()
+    task.add_done_callback(lambda done: None if done.cancelled() or done.exception() else semaphore.release())
+
+
+class ArticleFetchPool:
+    """기사 본문 병렬 추출 풀
+
+    전역 동시성 제한, 호스트별 동시성 제한, 기사별 마감 시간을 적용하여
+    여러 기사 본문을 동시에 추출하고 입력 순서대로 결과를 반환합니다.
+    item_timeout은 슬롯을 받은 뒤의 요청 시간에만 적용되고, 슬롯 대기는 queue_timeout으로 따로 제한하므로
+    대기열 뒤쪽의 기사도 요청 시간을 모두 쓰며 대기 때문에 늦은 기사는 호스트 통계에 기록되지 않습니다.
+    네이버 링크는 모두 같은 네이버 뉴스 호스트로 모이므로 그 호스트에는 naver_host_limit을 적용합니다.
+    제한은 같은 풀을 쓰는 모든 도구 호출에 함께 적용되며,
+    같은 기사에 대한 동시 요청은 한 번의 다운로드로 병합됩니다.
+    검색 결과 항목은 링크 선택기가 고른 URL 후보를 순서대로 시도합니다.
+
+    마감 시간은 호스트 통계의 최근 응답 시간에 맞춰 item_timeout보다 짧아질 수 있고,
+    연속으로 응답하지 않은 호스트는 슬롯을 기다리지 않고 바로 실패합니다.
+    hedge가 켜져 있으면 후보 URL이 호스트의 평소 응답 시간(p95) 안에 끝나지 않을 때
+    다음 후보도 함께 요청하여 먼저 성공한 결과를 사용합니다.
+    미리 받기(extract_item(speculative=True))는 슬롯을 기다리는 대화형 추출이 없을 때만 슬롯을 받습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        per_host_limit: int = 4,
+        naver_host_limit: int = 10,
+        item_timeout: float = 15.0,
+        queue_timeout: float = 60.0,
+        extractor: Optional[AsyncExtractor] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ArticleCache] = None,
+        engine: Optional[ExtractionEngine] = None,
+        resolver: Optional[LinkResolver] = None,
+        parse_pool: Optional[ParsePool] = None,
+        hedge: bool = True
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.naver_host_limit = max(1, naver_host_limit)
+        self.item_timeout = item_timeout
+        self.queue_timeout = queue_timeout
+        self.hedge = hedge
+        self.resolver = resolver or LinkResolver(engine.registry if engine is not None else None)
+        self.extractor = extractor or functools.partial(
+            aextract_article_content,
+            client=http_client,
+            cache=cache,
+            engine=engine,
+            stats=self.resolver.stats,
+            parse_pool=parse_pool
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global_limit = PrioritySemaphore(self.max_concurrency)
+        self._host_limits: Dict[str, PrioritySemaphore] = {}
+        self.flights = SingleFlight()
+
+    async def extract_all(
+        self,
+        urls: List[str],
+        on_result: Optional[ResultCallback] = None
+    ) -> List[Dict[str, str]]:
+        """
+        여러 기사 URL의 본문을 병렬로 추출합니다.
+
+        Args:
+            urls (List[str]): 기사 URL 목록
+            on_result (ResultCallback, optional): 기사별 추출 완료 시 호출할 콜백
+
+        Returns:
+            List[Dict[str, str]]: urls와 같은 순서의 추출 결과 목록
+        """
+        return await self._gather([functools.partial(self.extract, url) for url in urls], on_result)
+
+    async def extract_items(
+        self,
+        items: List[Mapping[str, Any]],
+        on_result: Optional[ResultCallback] = None
+    ) -> List[Dict[str, str]]:
+        """
+        검색 결과 항목들의 본문을 병렬로 추출합니다.
+
+        Args:
+            items (List[Mapping[str, Any]]): 검색 결과 항목 목록 (link, originallink)
+            on_result (ResultCallback, optional): 항목별 추출 완료 시 호출할 콜백
+
+        Returns:
+            List[Dict[str, str]]: items와 같은 순서의 추출 결과 목록
+        """
+        return await self._gather([functools.partial(self.extract_item, item) for item in items], on_result)
+
+    async def extract_item(self, item: Mapping[str, Any], speculative: bool = False) -> Dict[str, str]:
+        """
+        링크 선택기가 고른 URL 후보를 순서대로 시도하여 처음 성공한 결과를 반환합니다.
+
+        speculative(미리 받기)면 대화형 추출보다 낮은 우선순위로 슬롯을 기다립니다.
+        hedge가 켜져 있으면 진행 중인 후보가 호스트의 지연 기준을 넘길 때 다음 후보를 함께 시작하고,
+        하나가 성공하면 나머지 요청은 취소합니다.
+        """
+        result: Dict[str, str] = {'title': '', 'content': '', 'error': '기사 링크가 없습니다.'}
+        pending = self.resolver.candidates(item)
+        running: Dict["asyncio.Task[Dict[str, str]]", str] = {}
+        # 대체 요청으로 지는 쪽 다운로드를 취소할 수 있도록 미리 받기처럼 요청
+        cancellable = speculative or (self.hedge and len(pending) > 1)
+        priority = PRIORITY_BULK if speculative else PRIORITY_INTERACTIVE
+        try:
+            while pending or running:
+                if not running:
+                    url = pending.pop(0)
+                    running[asyncio.ensure_future(self.extract(url, speculative=cancellable, priority=priority))] = url
+                delay = None
+                if self.hedge and pending and len(running) == 1:
+                    delay = self.resolver.stats.hedge_delay(next(iter(running.values())))
+                done, _ = await asyncio.wait(running, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    url = pending.pop(0)
+                    logger.debug(f"기사 추출이 늦어 대체 링크를 함께 요청합니다: {url} ({delay:.2f}s)")
+                    running[asyncio.ensure_future(self.extract(url, speculative=True, priority=priority))] = url
+                    continue
+                for task in done:
+                    del running[task]
+                    result = task.result()
+                    if not result.get('error'):
+                        return result
+            return result
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _gather(
+        self,
+        jobs: List[Callable[[], Awaitable[Dict[str, str]]]],
+        on_result: Optional[ResultCallback]
+    ) -> List[Dict[str, str]]:
+        """작업을 동시에 실행하고, 끝나는 대로 콜백을 호출하며 입력 순서대로 결과를 반환합니다."""
+        async def run(index: int, job: Callable[[], Awaitable[Dict[str, str]]]) -> Dict[str, str]:
+            result = await job()
+            if on_result is not None:
+                maybe_awaitable = on_result(index, result)
+                if maybe_awaitable is not None:
+                    await maybe_awaitable
+            return result
+
+        return list(await asyncio.gather(*(run(i, job) for i, job in enumerate(jobs))))
+
+    async def extract(self, url: str, speculative: bool = False, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, str]:
+        """
+        동시성 제한 안에서 기사 하나를 추출합니다.
+
+        speculative(미리 받기, 대체 요청)로 호출한 추출은 취소될 때 같은 기사를 기다리는 다른 호출이 없으면
+        다운로드도 중단합니다. priority는 슬롯 대기 우선순위입니다. (낮을수록 먼저)
+        """
+        if not self.resolver.stats.allow(url):
+            # 연속으로 응답하지 않은 호스트는 슬롯을 기다리지 않고 바로 실패
+            return {
+                'title': '',
+                'content': '',
+                'error': f'응답하지 않는 언론사 서버라 잠시 요청하지 않습니다: {urlparse(url).netloc}'
+            }
+        return await self.flights.do(canonical_url(url), lambda: self._extract_limited(url, priority), cancel_orphaned=speculative)
+
+    async def _extract_limited(self, url: str, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, str]:
+        """전역/호스트별 슬롯을 queue_timeout 안에 확보한 뒤 기사를 추출합니다."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.queue_timeout
+        global_limit, host_limit = self._limits(urlparse(url).netloc)
+        # 호스트 슬롯을 먼저 잡아 대기 중인 작업이 전역 슬롯을 점유하지 않게 함
+        if not await _acquire(host_limit, deadline - loop.time(), priority):
+            return self._queue_timeout(url)
+        try:
+            if not await _acquire(global_limit, deadline - loop.time(), priority):
+                return self._queue_timeout(url)
+            try:
+                return await self._extract_one(url)
+            finally:
+                global_limit.release()
+        finally:
+            host_limit.release()
+
+    def _queue_timeout(self, url: str) -> Dict[str, str]:
+        # 슬롯을 기다리느라 늦은 것이므로 호스트 통계에는 기록하지 않음
+        logger.warning(f"기사 추출 대기 시간 초과: {url} ({self.queue_timeout:.1f}s)")
+        return {
+            'title': '',
+            'content': '',
+            'error': f'기사 추출 대기 시간 초과 ({self.queue_timeout:.1f}초)'
+        }
+
+    def _limits(self, host: str) -> Tuple[PrioritySemaphore, PrioritySemaphore]:
+        """현재 이벤트 루프에서 사용할 전역/호스트별 세마포어를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+            self._loop = loop
+            self._global_limit = PrioritySemaphore(self.max_concurrency)
+            self._host_limits = {}
+        if host not in self._host_limits:
+            limit = self.naver_host_limit if is_naver_news_host(host) else self.per_host_limit
+            self._host_limits[host] = PrioritySemaphore(limit)
+        return self._global_limit, self._host_limits[host]
+
+    async def _extract_one(self, url: str) -> Dict[str, str]:
+        """기사 하나를 마감 시간(호스트 응답 시간에 맞춘 값, 최대 item_timeout) 안에 추출합니다."""
+        timeout = self.resolver.stats.timeout(url, self.item_timeout)
+        try:
+            return await asyncio.wait_for(self.extractor(url), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"기사 추출 시간 초과: {url} ({timeout:.1f}s)")
+            # 슬롯을 받은 뒤 요청이 진행 중이던 시간 초과이므로 호스트 통계에 기록
+            self.resolver.stats.record(url, False, fetch_seconds=timeout, reachable=False, timed_out=True)
+            return {
+                'title': '',
+                'content': '',
+                'error': f'기사 추출 시간 초과 ({timeout:.1f}초)'
+            }
+        except Exception as e:
+            return {
+                'title': '',
+                'content': '',
+                'error': f'기사 추출 중 오류 발생: {str(e)}'
+            }
+
+    @classmethod
+    def from_config(
+        cls,
+        config: NaverNewsConfig,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ArticleCache] = None,
+        engine: Optional[ExtractionEngine] = None,
+        resolver: Optional[LinkResolver] = None,
+        parse_pool: Optional[ParsePool] = None
+    ) -> "ArticleFetchPool":
+        """NaverNewsConfig 값으로 풀을 생성합니다."""
+        return cls(
+            max_concurrency=config.fetch_concurrency,
+            per_host_limit=config.fetch_per_host,
+            naver_host_limit=config.fetch_per_host_naver,
+            item_timeout=config.fetch_timeout,
+            queue_timeout=config.fetch_queue_timeout,
+            http_client=http_client,
+            cache=cache,
+            engine=engine,
+            resolver=resolver,
+            parse_pool=parse_pool,
+            hedge=config.fetch_hedge
+        )
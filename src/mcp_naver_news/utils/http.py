@@ -0,0 +1,159 @@
+import logging
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+import httpx
+
+from mcp_naver_news.config import NaverNewsConfig
+
+# requests는 동기 세션을 처음 만들 때 로드 (비동기 경로만 사용하면 불러오지 않음)
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 기사 페이지 요청에 사용하는 기본 헤더
+ARTICLE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+}
+
+# 재시도할 응답 코드. 네이버 API 세션은 429를 재시도하지 않음 (urllib3 재시도는 속도 제한기와 일일 한도를 거치지 않음)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+API_RETRY_STATUSES = (500, 502, 503, 504)
+
+_shared_article_session: Optional["requests.Session"] = None
+
+
+def build_session(
+    pool_connections: int = 20,
+    pool_maxsize: int = 10,
+    max_retries: int = 2,
+    backoff_factor: float = 0.3,
+    headers: Optional[Dict[str, str]] = None,
+    retry_statuses: Tuple[int, ...] = RETRY_STATUSES
+) -> "requests.Session":
+    """
+    keep-alive 커넥션 풀과 재시도 정책이 적용된 세션을 생성합니다.
+
+    Args:
+        pool_connections (int): 유지할 호스트별 커넥션 풀 개수
+        pool_maxsize (int): 호스트 하나당 최대 커넥션 수
+        max_retries (int): 연결 오류 및 retry_statuses 응답 재시도 횟수
+        backoff_factor (float): 재시도 간 지수 백오프 계수
+        headers (Dict[str, str], optional): 세션 기본 헤더
+        retry_statuses (Tuple[int, ...]): 재시도할 응답 코드 (기본값: 429/5xx)
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def build_api_session(config: NaverNewsConfig) -> "requests.Session":
+    """네이버 Open API 호출용 세션을 생성합니다."""
+    return build_session(
+        pool_connections=1,
+        pool_maxsize=config.http_pool_maxsize,
+        max_retries=config.http_max_retries,
+        backoff_factor=config.http_backoff_factor,
+        headers={
+            "X-Naver-Client-Id": config.client_id,
+            "X-Naver-Client-Secret": config.client_secret
+        },
+        retry_statuses=API_RETRY_STATUSES
+    )
+
+
+def build_article_session(config: NaverNewsConfig) -> "requests.Session":
+    """언론사 기사 페이지 요청용 세션을 생성합니다."""
+    return build_session(
+        pool_connections=config.http_pool_connections,
+        # 호스트별 동시 추출 수보다 풀이 작으면 커넥션이 버려지므로 보정
+        pool_maxsize=max(config.http_pool_maxsize, config.fetch_per_host, config.fetch_per_host_naver),
+        max_retries=config.http_max_retries,
+        backoff_factor=config.http_backoff_factor,
+        headers=ARTICLE_HEADERS
+    )
+
+
+def article_connection_limit(config: NaverNewsConfig) -> int:
+    """
+    기사 페이지용 비동기 클라이언트의 최대 커넥션 수.
+
+    동시 추출 수와 미리 받기 동시 수에, 대체 요청(hedge)이 켜져 있으면 취소된 요청의 커넥션이
+    정리되는 동안 쓸 여유분(동시 추출 수의 절반)을 더합니다. 풀이 모자라면 대기 중인 요청이
+    PoolTimeout으로 실패합니다.
+    """
+    limit = config.fetch_concurrency + config.prefetch_concurrency
+    if config.fetch_hedge:
+        limit += max(1, config.fetch_concurrency // 2)
+    return max(limit, config.http_pool_maxsize)
+
+
+def build_async_client(
+    config: NaverNewsConfig,
+    headers: Optional[Dict[str, str]] = None,
+    max_connections: Optional[int] = None
+) -> httpx.AsyncClient:
+    """
+    keep-alive 커넥션 풀이 적용된 비동기 HTTP 클라이언트를 생성합니다.
+
+    Args:
+        config (NaverNewsConfig): 풀 크기 및 재시도 설정
+        headers (Dict[str, str], optional): 클라이언트 기본 헤더
+        max_connections (int, optional): 최대 동시 커넥션 수 (기본값: http_pool_maxsize와 API 버스트 중 큰 값)
+
+    Returns:
+        httpx.AsyncClient: 설정된 비동기 클라이언트
+    """
+    if max_connections is None:
+        max_connections = max(config.http_pool_maxsize, config.api_burst)
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        # 유지할 유휴 커넥션은 최대 커넥션 수를 넘을 수 없음
+        max_keepalive_connections=min(config.http_pool_connections, max_connections)
+    )
+    # httpx 전송 계층 재시도는 연결 오류에만 적용됨
+    transport = httpx.AsyncHTTPTransport(retries=config.http_max_retries, limits=limits)
+    return httpx.AsyncClient(
+        headers=headers,
+        transport=transport,
+        follow_redirects=True,
+        timeout=10
+    )
+
+
+def get_shared_article_session() -> "requests.Session":
+    """세션을 전달받지 못한 호출을 위한 프로세스 공용 기사 세션을 반환합니다."""
+    global _shared_article_session
+    if _shared_article_session is None:
+        _shared_article_session = build_session(headers=ARTICLE_HEADERS)
+    return _shared_article_session
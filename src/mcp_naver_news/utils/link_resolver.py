@@ -0,0 +1,259 @@
+import math
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional
+from urllib.parse import parse_qs, urlparse, urlunparse
+
+from mcp_naver_news.utils.publisher_rules import PublisherRegistry
+
+# 네이버 뉴스 기사 식별자(언론사 oid, 기사 aid)가 경로에 있는 형식
+_NAVER_PATH_RE = re.compile(r"^/(?:mnews/)?article/(\d{3})/(\d{10})")
+_NAVER_NEWS_HOSTS = ("n.news.naver.com", "news.naver.com", "m.news.naver.com")
+
+# 실측 데이터가 없는 호스트의 예상 추출 시간(초)과 기사 페이지 크기(바이트)
+_PRIOR_SECONDS = 1.0
+PRIOR_BYTES = 256 * 1024
+
+# 마감 시간/지연 기준에 쓰는 호스트별 최근 응답 시간 표본 수와, 이보다 적으면 실측 대신 기본값 사용
+LATENCY_WINDOW = 50
+MIN_SAMPLES = 5
+
+# 실측이 없는 호스트에서 대체 링크를 함께 요청하기까지 기다리는 시간(초)
+DEFAULT_HEDGE_DELAY = 3.0
+
+
+@dataclass
+class HostStat:
+    """호스트 하나의 기사 추출 통계"""
+
+    fetches: int = 0
+    failures: int = 0
+    bytes: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    # 응답 없이 실패한 연속 횟수와 차단 해제 시각 (회로 차단기)
+    consecutive_errors: int = 0
+    open_until: float = 0.0
+    cooldown: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        # 표본이 적을 때 한두 번의 결과에 과하게 반응하지 않도록 보정
+        return (self.fetches - self.failures + 1) / (self.fetches + 2)
+
+    @property
+    def expected_cost(self) -> float:
+        """성공 한 건을 얻는 데 드는 예상 시간(초). 낮을수록 우선 선택합니다."""
+        seconds = (self.fetch_seconds + self.parse_seconds + _PRIOR_SECONDS) / (self.fetches + 1)
+        return seconds / self.success_rate
+
+    @property
+    def expected_bytes(self) -> float:
+        """기사 한 건을 받을 때 내려받을 예상 바이트 수"""
+        return (self.bytes + PRIOR_BYTES) / (self.fetches + 1)
+
+
+class HostStats:
+    """호스트별 다운로드/파싱 통계 (링크 선택, 추출 마감 시간, 회로 차단 기준)
+
+    응답한 요청의 최근 응답 시간으로 호스트별 마감 시간(p99의 timeout_multiple배)과
+    대체 링크를 함께 요청할 지연 기준(p95)을 정합니다. 시간 초과한 요청은 마감 시간을 응답 시간
+    표본으로 넣으므로, 느려진 호스트의 마감 시간은 시간 초과할 때마다 timeout_multiple배씩 늘어납니다. 연결 실패/시간 초과/5xx처럼 응답 없이
+    failure_threshold번 연속 실패한 호스트는 cooldown초 동안 요청하지 않고 바로 실패시키며,
+    차단이 풀린 뒤에도 계속 실패하면 차단 시간을 max_cooldown까지 두 배씩 늘립니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        timeout_multiple: float = 3.0,
+        min_timeout: float = 2.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self.timeout_multiple = timeout_multiple
+        self.min_timeout = min_timeout
+        self.clock = clock
+        self._stats: Dict[str, HostStat] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        url: str,
+        ok: bool,
+        bytes_read: int = 0,
+        fetch_seconds: float = 0.0,
+        parse_seconds: float = 0.0,
+        reachable: bool = True,
+        timed_out: bool = False
+    ) -> None:
+        """
+        기사 추출 한 건의 결과를 기록합니다.
+
+        Args:
+            url (str): 추출한 기사 URL
+            ok (bool): 본문 추출 성공 여부
+            bytes_read (int): 내려받은 바이트 수
+            fetch_seconds (float): 다운로드에 걸린 시간(초)
+            parse_seconds (float): 파싱에 걸린 시간(초)
+            reachable (bool): 서버가 응답했는지 여부 (본문을 찾지 못한 경우 등은 응답한 것으로 봄)
+            timed_out (bool): 마감 시간 안에 끝나지 않았는지 여부 (걸린 시간을 응답 시간의 하한으로 기록)
+        """
+        host = _host(url)
+        with self._lock:
+            stat = self._stats.setdefault(host, HostStat())
+            stat.fetches += 1
+            stat.failures += 0 if ok else 1
+            stat.bytes += bytes_read
+            stat.fetch_seconds += fetch_seconds
+            stat.parse_seconds += parse_seconds
+            if reachable or timed_out:
+                # 시간 초과는 실제 응답 시간이 더 길다는 뜻이므로 표본에 넣어야 마감 시간이 다시 늘어남
+                self._latencies.setdefault(host, deque(maxlen=LATENCY_WINDOW)).append(fetch_seconds + parse_seconds)
+            if reachable:
+                stat.consecutive_errors = 0
+                stat.cooldown = 0.0
+                return
+            stat.consecutive_errors += 1
+            now = self.clock()
+            # 차단 중에 끝난 (차단 전에 시작한) 요청의 실패는 차단 시간을 다시 늘리지 않음
+            if 0 < self.failure_threshold <= stat.consecutive_errors and stat.open_until <= now:
+                # 차단이 풀린 뒤 다시 실패하면 차단 시간을 늘림
+                stat.cooldown = min(self.max_cooldown, stat.cooldown * 2) if stat.cooldown else self.cooldown
+                stat.open_until = now + stat.cooldown
+
+    def allow(self, url: str) -> bool:
+        """호스트가 차단되어 있지 않으면 True (차단 시간이 지나면 다시 요청해 상태를 확인)"""
+        with self._lock:
+            stat = self._stats.get(_host(url))
+            return stat is None or stat.open_until <= self.clock()
+
+    def timeout(self, url: str, default: float) -> float:
+        """호스트의 추출 마감 시간 (최근 응답 시간 p99의 timeout_multiple배, default를 넘지 않음)"""
+        p99 = self._quantile(url, 0.99)
+        if p99 is None:
+            return default
+        return min(default, max(self.min_timeout, p99 * self.timeout_multiple))
+
+    def hedge_delay(self, url: str) -> float:
+        """이 시간 안에 끝나지 않으면 대체 링크도 함께 요청할 지연 기준 (최근 응답 시간 p95)"""
+        p95 = self._quantile(url, 0.95)
+        return DEFAULT_HEDGE_DELAY if p95 is None else p95
+
+    def _quantile(self, url: str, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._latencies.get(_host(url), ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+    def expected_cost(self, url: str) -> float:
+        with self._lock:
+            stat = self._stats.get(_host(url))
+            cost = stat.expected_cost if stat is not None else HostStat().expected_cost
+            if stat is not None and stat.open_until > self.clock():
+                # 차단된 호스트는 마지막에 시도
+                cost = math.inf
+            return cost
+
+    def expected_bytes(self, url: str) -> float:
+        with self._lock:
+            stat = self._stats.get(_host(url))
+            return stat.expected_bytes if stat is not None else HostStat().expected_bytes
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 통계를 반환합니다."""
+        with self._lock:
+            return {
+                host: {**asdict(stat), "success_rate": round(stat.success_rate, 3)}
+                for host, stat in self._stats.items()
+            }
+
+
+def _host(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def is_naver_news_host(host: str) -> bool:
+    """네이버 뉴스 기사 페이지 호스트인지 확인합니다. (네이버 링크는 모두 이 호스트로 모임)"""
+    return host.lower().split(":", 1)[0] in _NAVER_NEWS_HOSTS
+
+
+def naver_article_url(url: str) -> Optional[str]:
+    """
+    네이버 뉴스 기사 URL을 가벼운 모바일 기사 페이지 주소로 변환합니다.
+
+    Args:
+        url (str): n.news.naver.com/article/..., news.naver.com/main/read.naver?oid=...&aid=... 등
+
+    Returns:
+        Optional[str]: https://n.news.naver.com/mnews/article/{oid}/{aid} (네이버 뉴스 기사가 아니면 None)
+    """
+    parsed = urlparse(url)
+    if parsed.netloc.lower() not in _NAVER_NEWS_HOSTS:
+        return None
+    match = _NAVER_PATH_RE.match(parsed.path)
+    if match:
+        oid, aid = match.groups()
+    else:
+        query = parse_qs(parsed.query)
+        oid, aid = query.get("oid", [""])[0], query.get("aid", [""])[0]
+        if not (oid and aid):
+            return None
+    return f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
+
+
+class LinkResolver:
+    """검색 결과 항목에서 본문을 추출할 URL 후보를 고르는 링크 선택기
+
+    구조가 일정한 네이버 뉴스 링크를 우선하고, 언론사 규칙에 모바일/인쇄용 호스트가 있으면
+    해당 주소로 바꿔 시도합니다. 호스트별 실측 통계가 쌓이면
+    성공 한 건당 예상 시간이 짧은 후보를 먼저 시도합니다.
+    """
+
+    def __init__(self, registry: Optional[PublisherRegistry] = None, stats: Optional[HostStats] = None):
+        self.registry = registry
+        self.stats = stats or HostStats()
+
+    def candidates(self, item: Mapping[str, Any]) -> List[str]:
+        """
+        항목의 추출 URL 후보를 시도할 순서대로 반환합니다.
+
+        Args:
+            item (Mapping[str, Any]): 검색 결과 항목 (link, originallink)
+
+        Returns:
+            List[str]: 중복 없는 URL 후보 목록 (첫 번째가 우선)
+        """
+        urls: List[str] = []
+        for url in (item.get("link", ""), item.get("originallink", "")):
+            if not url:
+                continue
+            naver = naver_article_url(url)
+            urls.extend([naver] if naver else [self._lightweight(url), url])
+        ordered = list(dict.fromkeys(u for u in urls if u))
+        # 통계가 없으면 기본 순서를 유지 (정렬은 안정적)
+        return sorted(ordered, key=self.stats.expected_cost)
+
+    def _lightweight(self, url: str) -> Optional[str]:
+        """언론사 규칙에 지정된 모바일/인쇄용 호스트로 바꾼 URL을 반환합니다."""
+        if self.registry is None:
+            return None
+        parsed = urlparse(url)
+        publisher = self.registry.lookup(parsed.netloc)
+        if publisher is None or not publisher[1].lightweight_host:
+            return None
+        domain, rule = publisher
+        host = parsed.netloc.lower().split(":", 1)[0]
+        # 기사 본문이 있는 대표 호스트(도메인 자체 또는 www)만 변환
+        if host not in (domain, f"www.{domain}"):
+            return None
+        return urlunparse(parsed._replace(scheme="https", netloc=rule.lightweight_host))
@@ -0,0 +1,355 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from mcp_naver_news.utils.state_store import StateStore
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 히스토그램 구간 상한(초): Prometheus 기본 구간에 느린 기사 다운로드용 30초 구간을 추가
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+TOOL_SECONDS = "mcp_naver_news_tool_seconds"
+API_SECONDS = "mcp_naver_news_api_request_seconds"
+RATE_LIMIT_WAIT_SECONDS = "mcp_naver_news_rate_limit_wait_seconds"
+FETCH_SECONDS = "mcp_naver_news_article_fetch_seconds"
+PARSE_SECONDS = "mcp_naver_news_article_parse_seconds"
+SERIALIZE_SECONDS = "mcp_naver_news_serialize_seconds"
+
+HELP = {
+    TOOL_SECONDS: "도구 호출 처리 시간",
+    API_SECONDS: "네이버 검색 API HTTP 요청 시간 (재시도 포함 각 요청)",
+    RATE_LIMIT_WAIT_SECONDS: "네이버 API 속도 제한 대기 시간",
+    FETCH_SECONDS: "언론사별 기사 다운로드 단계 시간 (connect는 DNS 조회 포함)",
+    PARSE_SECONDS: "언론사별 기사 본문 파싱 시간",
+    SERIALIZE_SECONDS: "도구 결과 JSON 직렬화 시간",
+}
+
+# 작업자별 측정값을 공유 저장소에 기록하는 이름 공간과 주기(초)
+METRICS_NAMESPACE = "metrics"
+PUBLISH_INTERVAL = 5.0
+
+_current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("mcp_naver_news_tool", default="none")
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def current_tool() -> str:
+    """현재 실행 중인 도구 이름을 반환합니다. 도구 밖에서 호출되면 "none"을 반환합니다."""
+    return _current_tool.get()
+
+
+class Histogram:
+    """고정 구간(BUCKETS) 지연 시간 히스토그램"""
+
+    def __init__(self) -> None:
+        # 마지막 칸은 +Inf 구간
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    """이름과 레이블별 지연 시간 히스토그램 모음 (프로세스 단위)"""
+
+    def __init__(self) -> None:
+        self._series: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """
+        측정값 하나를 기록합니다.
+
+        Args:
+            name (str): 측정 항목 이름
+            seconds (float): 걸린 시간(초)
+            **labels: 레이블 (tool, domain, phase 등)
+        """
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = Histogram()
+            histogram.observe(max(0.0, seconds))
+
+    @contextlib.contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        """with 블록의 실행 시간을 기록합니다. (예외가 발생해도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        JSON으로 직렬화할 수 있는 측정값 사본을 반환합니다.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 측정 항목 이름별 labels, buckets, count, sum 목록
+        """
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for (name, labels), histogram in sorted(self._series.items()):
+                result.setdefault(name, []).append({
+                    "labels": dict(labels),
+                    "buckets": list(histogram.counts),
+                    "count": histogram.count,
+                    "sum": histogram.sum
+                })
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+# 프로세스 공용 측정값
+metrics = MetricsRegistry()
+
+
+def timed_tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    도구 함수의 처리 시간을 기록하는 데코레이터 (@mcp.tool 아래에 적용)
+
+    실행 중에는 current_tool()이 도구 이름을 반환하므로, 그 안에서 기록하는 API 요청/직렬화 시간에
+    도구 레이블을 붙일 수 있습니다.
+    """
+    name = fn.__name__
+
+    @contextlib.contextmanager
+    def measure() -> Iterator[None]:
+        token = _current_tool.set(name)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "ok"
+        finally:
+            metrics.observe(TOOL_SECONDS, time.perf_counter() - started, tool=name, status=status)
+            _current_tool.reset(token)
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with measure():
+                return await fn(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with measure():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+class FetchTrace:
+    """httpx trace 확장으로 기사 다운로드의 단계별 시간을 측정합니다.
+
+    DNS 조회는 httpcore의 TCP 연결 단계 안에서 이루어지므로 connect에 포함되며,
+    리다이렉트를 따라간 경우 요청마다의 단계 시간을 합산합니다.
+    """
+
+    # 단계 이름: (시작 이벤트, 종료 이벤트)
+    PHASES = {
+        "connect": ("connect_tcp", "connect_tcp"),
+        "tls": ("start_tls", "start_tls"),
+        "ttfb": ("send_request_headers", "receive_response_headers"),
+    }
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.event(event_name)
+
+    def event(self, event_name: str, now: Optional[float] = None) -> None:
+        """httpcore 이벤트("connection.connect_tcp.started" 등) 하나를 기록합니다."""
+        now = time.perf_counter() if now is None else now
+        step, state = event_name.split(".")[-2:]
+        if state == "started":
+            self._started[step] = now
+            return
+        if state != "complete":
+            return
+        for phase, (begin, end) in self.PHASES.items():
+            if step == end and begin in self._started:
+                self.phases[phase] = self.phases.get(phase, 0.0) + now - self._started.pop(begin)
+
+    def record(self, url: str, fetch_seconds: float, registry: Optional[MetricsRegistry] = None) -> None:
+        """
+        단계별 시간과 나머지 본문 수신 시간(body), 전체 다운로드 시간(total)을 언론사 도메인별로 기록합니다.
+
+        Args:
+            url (str): 기사 URL
+            fetch_seconds (float): 파싱 시간을 제외한 전체 다운로드 시간(초)
+            registry (MetricsRegistry, optional): 기록 대상 (기본값: 프로세스 공용 측정값)
+        """
+        registry = registry or metrics
+        domain = urlparse(url).netloc.lower()
+        for phase, seconds in self.phases.items():
+            registry.observe(FETCH_SECONDS, seconds, domain=domain, phase=phase)
+        registry.observe(FETCH_SECONDS, max(0.0, fetch_seconds - sum(self.phases.values())), domain=domain, phase="body")
+        registry.observe(FETCH_SECONDS, fetch_seconds, domain=domain, phase="total")
+
+
+def merge(snapshots: List[Dict[str, List[Dict[str, Any]]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """여러 작업자의 snapshot()을 레이블별로 합산합니다."""
+    merged: Dict[Tuple[str, LabelKey], Dict[str, Any]] = {}
+    for snapshot in snapshots:
+        for name, series in snapshot.items():
+            for entry in series:
+                key = (name, tuple(sorted(entry["labels"].items())))
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = {**entry, "buckets": list(entry["buckets"])}
+                    continue
+                total["buckets"] = [a + b for a, b in zip(total["buckets"], entry["buckets"])]
+                total["count"] += entry["count"]
+                total["sum"] += entry["sum"]
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for (name, _), entry in sorted(merged.items()):
+        result.setdefault(name, []).append(entry)
+    return result
+
+
+def worker_key() -> str:
+    """공유 저장소에서 이 프로세스의 측정값을 구분하는 키"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def collect(store: Optional[StateStore] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    이 프로세스의 측정값에 다른 작업자가 공유 저장소에 기록한 측정값을 합산합니다.
+
+    Args:
+        store (StateStore, optional): 다중 작업자 모드의 공유 저장소 (없으면 이 프로세스만)
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: snapshot() 형식의 합산 결과
+    """
+    snapshots = [metrics.snapshot()]
+    if store is not None:
+        own = worker_key()
+        snapshots += [snapshot for key, snapshot in store.items(METRICS_NAMESPACE).items() if key != own]
+    return merge(snapshots)
+
+
+async def publish_metrics(store: StateStore, interval: float = PUBLISH_INTERVAL) -> None:
+    """다른 작업자가 합산할 수 있도록 이 프로세스의 측정값을 주기적으로 공유 저장소에 기록합니다. (취소될 때까지 실행)"""
+    key = worker_key()
+    try:
+        while True:
+            try:
+                # 공유 저장소 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(store.set, METRICS_NAMESPACE, key, metrics.snapshot(), ttl=interval * 3)
+            except Exception as e:
+                logger.debug(f"측정값 공유 실패: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        await asyncio.to_thread(store.delete, METRICS_NAMESPACE, key)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str], **extra: str) -> str:
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs.items()) + "}"
+
+
+def render_prometheus(snapshot: Dict[str, List[Dict[str, Any]]]) -> str:
+    """snapshot() 형식의 측정값을 Prometheus 텍스트 형식으로 변환합니다."""
+    lines = []
+    for name, series in snapshot.items():
+        lines.append(f"# HELP {name} {HELP.get(name, name)}")
+        lines.append(f"# TYPE {name} histogram")
+        for entry in series:
+            cumulative = 0
+            for upper, count in zip(BUCKETS + (math.inf,), entry["buckets"]):
+                cumulative += count
+                le = "+Inf" if upper == math.inf else repr(upper)
+                lines.append(f"{name}_bucket{_labels(entry['labels'], le=le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(entry['labels'])} {entry['sum']:.6f}")
+            lines.append(f"{name}_count{_labels(entry['labels'])} {entry['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _quantile(counts: List[int], total: int, q: float) -> float:
+    """구간 안에서 선형 보간한 분위수 추정값(초) (Prometheus histogram_quantile과 같은 방식)"""
+    rank = q * total
+    cumulative = 0
+    lower = 0.0
+    for upper, count in zip(BUCKETS, counts):
+        if count and cumulative + count >= rank:
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+        lower = upper
+    # +Inf 구간이면 가장 큰 유한 구간 상한
+    return lower
+
+
+def summarize(snapshot: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    측정 항목별로 레이블마다 건수, 평균, p50, p95(밀리초)를 정리합니다. 총 소요 시간이 큰 순서로 정렬합니다.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: 측정 항목 이름별 요약 목록
+    """
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for name, series in snapshot.items():
+        rows = []
+        for entry in sorted(series, key=lambda entry: entry["sum"], reverse=True):
+            count = entry["count"]
+            if not count:
+                continue
+            rows.append({
+                **entry["labels"],
+                "count": count,
+                "avg_ms": round(entry["sum"] / count * 1000, 1),
+                "p50_ms": round(_quantile(entry["buckets"], count, 0.5) * 1000, 1),
+                "p95_ms": round(_quantile(entry["buckets"], count, 0.95) * 1000, 1)
+            })
+        result[name] = rows
+    return result
+
+
+def metrics_route(store: Optional[StateStore] = None) -> Route:
+    """
+    Prometheus 형식으로 측정값을 제공하는 GET /metrics 경로를 생성합니다.
+
+    Args:
+        store (StateStore, optional): 다중 작업자 모드의 공유 저장소 (모든 작업자의 측정값을 합산)
+
+    Returns:
+        Route: SSE Starlette 앱에 추가할 경로
+    """
+    async def endpoint(request: Request) -> PlainTextResponse:
+        snapshot = await asyncio.to_thread(collect, store) if store is not None else collect(store)
+        return PlainTextResponse(render_prometheus(snapshot), media_type="text/plain; version=0.0.4")
+
+    return Route("/metrics", endpoint=endpoint, methods=["GET"])
@@ -0,0 +1,169 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# 선택 설치(pip install mcp-naver-news[fast]): 있으면 더 빠른 JSON 인코더 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .query import query_terms
+
+# 출력 필드 이름과 응답 키
+FIELDS = {
+    "title": "제목",
+    "link": "링크",
+    "originallink": "원본링크",
+    "description": "요약",
+    "pub_date": "발행일",
+    "content": "본문",
+}
+SUMMARY_FIELDS = ("title", "link", "originallink", "description", "pub_date")
+DETAIL_FIELDS = SUMMARY_FIELDS + ("content",)
+
+# 잘라낸 본문 표시
+ELLIPSIS = "…"
+
+
+@dataclass(slots=True)
+class NewsItem:
+    """검색 결과 기사 한 건 (API 응답 항목의 필요한 값만 보관)"""
+
+    title: str = ""
+    link: str = ""
+    originallink: str = ""
+    description: str = ""
+    pub_date: str = ""
+    content: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, item: Mapping[str, Any]) -> "NewsItem":
+        """네이버 API 응답 항목(본문 추출 결과 content 포함)으로 생성합니다."""
+        return cls(
+            item.get("title", ""),
+            item.get("link", ""),
+            item.get("originallink", ""),
+            item.get("description", ""),
+            item.get("pubDate", ""),
+            item.get("content")
+        )
+
+
+@dataclass(frozen=True)
+class OutputOptions:
+    """도구 응답 형식 (필드 선택, 들여쓰기, 본문 길이)"""
+
+    fields: Tuple[str, ...] = SUMMARY_FIELDS
+    compact: bool = False
+    max_chars: int = 0
+    snippet_chars: int = 0
+    terms: Tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        fields: Optional[Sequence[str]] = None,
+        compact: Optional[bool] = None,
+        default_fields: Tuple[str, ...] = SUMMARY_FIELDS,
+        default_compact: bool = False,
+        max_chars: Optional[int] = 0,
+        snippet_chars: Optional[int] = 0,
+        query: str = ""
+    ) -> "OutputOptions":
+        """
+        도구 인자로 응답 형식을 만듭니다.
+
+        Args:
+            fields (Sequence[str], optional): 포함할 필드 (없으면 default_fields)
+            compact (bool, optional): 들여쓰기 없는 JSON 여부 (없으면 default_compact)
+            default_fields (Tuple[str, ...]): 기본 필드
+            default_compact (bool): 기본 compact 설정 (NAVER_NEWS_OUTPUT_COMPACT)
+            max_chars (int, optional): 본문 최대 글자 수 (0이면 제한 없음)
+            snippet_chars (int, optional): 검색어 주변으로 남길 앞뒤 글자 수 (0이면 사용 안 함)
+            query (str): 스니펫 기준 검색어
+
+        Raises:
+            ValueError: 알 수 없는 필드인 경우
+        """
+        selected = tuple(dict.fromkeys(fields)) if fields else default_fields
+        unknown = [field for field in selected if field not in FIELDS]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(FIELDS)})")
+        return cls(
+            fields=selected,
+            compact=default_compact if compact is None else bool(compact),
+            max_chars=max(0, max_chars or 0),
+            snippet_chars=max(0, snippet_chars or 0),
+            terms=query_terms(query)
+        )
+
+
+def render(item: NewsItem, options: OutputOptions) -> Dict[str, Any]:
+    """기사를 선택한 필드만 담은 응답 항목으로 변환합니다."""
+    result: Dict[str, Any] = {}
+    for field in options.fields:
+        if field == "content":
+            result[FIELDS[field]] = shorten(item.content if item.content is not None else "본문 없음", options)
+        else:
+            result[FIELDS[field]] = getattr(item, field)
+    return result
+
+
+def shorten(text: str, options: OutputOptions) -> str:
+    """
+    본문을 검색어 주변 스니펫으로 줄이거나 max_chars로 자릅니다.
+
+    검색어가 본문에 없으면 앞부분을 max_chars만큼 남깁니다.
+    """
+    if options.snippet_chars > 0 and options.terms:
+        snippets = query_snippets(text, options.terms, options.snippet_chars)
+        if snippets:
+            text = snippets
+    if options.max_chars > 0 and len(text) > options.max_chars:
+        return text[:options.max_chars].rstrip() + ELLIPSIS
+    return text
+
+
+def query_snippets(text: str, terms: Sequence[str], window: int) -> str:
+    """
+    검색어가 나온 위치마다 앞뒤 window 글자를 남기고, 겹치는 구간은 합쳐 " … "로 잇습니다.
+
+    Returns:
+        str: 스니펫 (검색어가 없으면 빈 문자열)
+    """
+    lowered = text.lower()
+    spans: List[Tuple[int, int]] = []
+    for term in {term.lower() for term in terms}:
+        position = lowered.find(term)
+        while position != -1:
+            spans.append((max(0, position - window), min(len(text), position + len(term) + window)))
+            position = lowered.find(term, position + len(term))
+    if not spans:
+        return ""
+    spans.sort()
+    merged = [spans[0]]
+    for start, end in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    snippet = f" {ELLIPSIS} ".join(text[start:end].strip() for start, end in merged)
+    prefix = ELLIPSIS + " " if merged[0][0] > 0 else ""
+    suffix = " " + ELLIPSIS if merged[-1][1] < len(text) else ""
+    return prefix + snippet + suffix
+
+
+def dumps(data: Any, compact: bool = False) -> str:
+    """
+    응답을 JSON 문자열로 변환합니다. (orjson이 있으면 사용)
+
+    Args:
+        data (Any): 응답 데이터
+        compact (bool): True면 들여쓰기와 공백 없이 출력
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode("utf-8")
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, ensure_ascii=False, indent=2)
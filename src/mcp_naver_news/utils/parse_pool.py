@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.extraction_engine import ExtractionEngine, build_extraction_engine
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 작업자 프로세스마다 한 번 생성하는 추출 엔진
+_worker_engine: Optional[ExtractionEngine] = None
+
+
+def _init_worker(config: NaverNewsConfig) -> None:
+    """작업자 프로세스 시작 시 추출 엔진을 준비합니다."""
+    global _worker_engine
+    _worker_engine = build_extraction_engine(config)
+
+
+def _parse_in_worker(data: bytes, url: str, encoding: Optional[str]) -> Dict[str, str]:
+    """작업자 프로세스에서 실행되는 파싱 함수"""
+    assert _worker_engine is not None
+    return parse_document(_worker_engine, data, url, encoding)
+
+
+def parse_document(engine: ExtractionEngine, data: bytes, url: str, encoding: Optional[str]) -> Dict[str, str]:
+    """내려받은 HTML 바이트 전체를 파싱하여 추출 결과를 반환합니다."""
+    document = engine.stream(url, encoding)
+    document.feed(data)
+    return document.result()
+
+
+def gil_disabled() -> bool:
+    """GIL 없이 실행 중인 free-threaded 파이썬인지 확인합니다."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class ParsePool:
+    """HTML 파싱 전용 작업자 풀
+
+    다운로드는 이벤트 루프에서 그대로 처리하고, 내려받은 HTML의 파싱만 작업자에게 넘겨
+    여러 CPU 코어에서 동시에 실행합니다. 일반 파이썬에서는 GIL을 피하기 위해 프로세스를,
+    free-threaded 파이썬에서는 스레드를 사용합니다.
+    """
+
+    def __init__(self, config: NaverNewsConfig, workers: int, mode: str = "auto"):
+        if mode == "auto":
+            mode = "thread" if gil_disabled() else "process"
+        if mode not in ("process", "thread"):
+            raise ValueError(f"지원하지 않는 파싱 작업자 종류입니다: {mode} (auto, process, thread)")
+        self.workers = workers
+        self.mode = mode
+        self._engine: Optional[ExtractionEngine] = None
+        self._executor: Executor
+        if mode == "process":
+            # 서버의 스레드와 이벤트 루프를 복제하지 않도록 spawn으로 생성 (작업자는 첫 작업 때 시작)
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(config,)
+            )
+        else:
+            self._engine = build_extraction_engine(config)
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-naver-news-parse")
+        logger.info(f"HTML 파싱 작업자 풀 사용: {mode} {workers}개")
+
+    async def parse(self, data: bytes, url: str, encoding: Optional[str] = None) -> Tuple[Dict[str, str], float]:
+        """
+        HTML을 작업자에게 보내 파싱합니다.
+
+        Args:
+            data (bytes): 내려받은 HTML
+            url (str): 기사 URL (언론사 규칙 결정에 사용)
+            encoding (str, optional): Content-Type 헤더의 문자 인코딩
+
+        Returns:
+            Tuple[Dict[str, str], float]: 추출 결과와 파싱에 걸린 시간(초, 대기 포함)
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        if self._engine is not None:
+            result = await loop.run_in_executor(self._executor, parse_document, self._engine, data, url, encoding)
+        else:
+            result = await loop.run_in_executor(self._executor, _parse_in_worker, data, url, encoding)
+        return result, time.perf_counter() - started
+
+    def close(self) -> None:
+        """작업자를 종료합니다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_parse_pool(config: NaverNewsConfig) -> Optional[ParsePool]:
+    """NAVER_NEWS_PARSE_WORKERS가 1 이상이면 파싱 작업자 풀을 생성합니다."""
+    if config.parse_workers <= 0:
+        return None
+    return ParsePool(config, config.parse_workers, config.parse_executor)
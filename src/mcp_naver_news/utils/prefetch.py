@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple
+
+from mcp_naver_news.utils.article_cache import ArticleCache
+from mcp_naver_news.utils.dedup import MIN_SIMILARITY, cluster_items
+from mcp_naver_news.utils.fetch_pool import ArticleFetchPool
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 이보다 오래된 검색의 미리 받기는 취소 (모델이 다른 검색어로 넘어갔다고 판단)
+MAX_BATCHES = 2
+
+
+def _item_key(item: Mapping[str, Any]) -> str:
+    return item.get('originallink') or item.get('link', '')
+
+
+@dataclass
+class _Job:
+    task: "asyncio.Task[None]"
+    batch: int
+    started: bool = False
+
+
+class ArticlePrefetcher:
+    """search_news 결과 상위 기사의 본문을 미리 받아 기사 캐시를 채우는 백그라운드 작업기
+
+    search_news 다음에는 보통 같은 검색으로 search_news_detail을 호출하므로, 검색 순위가 높은 기사
+    (중복 기사 묶음마다 대표 하나)를 낮은 동시성으로 미리 추출해 둡니다. 미리 받기는 추출 풀의 슬롯을
+    대화형 추출보다 낮은 우선순위로 기다리므로 search_news_detail의 추출을 앞지르지 않습니다. 검색 한 번에 내려받는 양은
+    호스트별 평균 페이지 크기로 추정한 max_bytes 안으로 제한하고, 이미 캐시에 있는 기사는 건너뜁니다.
+
+    미리 받기는 다음 경우 취소됩니다.
+    - search_news_detail이 같은 기사를 직접 추출하기 시작할 때 아직 시작하지 않은 미리 받기
+      (이미 받는 중인 기사는 상세 검색이 같은 다운로드를 함께 기다림)
+    - 이후 검색이 MAX_BATCHES개 쌓였을 때 가장 오래된 검색의 미리 받기 (받는 중인 다운로드 포함)
+    """
+
+    def __init__(
+        self,
+        fetcher: ArticleFetchPool,
+        cache: ArticleCache,
+        top_k: int = 5,
+        concurrency: int = 2,
+        max_bytes: int = 2 * 1024 * 1024,
+        min_similarity: float = MIN_SIMILARITY
+    ):
+        self.fetcher = fetcher
+        self.cache = cache
+        self.top_k = top_k
+        self.concurrency = max(1, concurrency)
+        self.max_bytes = max_bytes
+        self.min_similarity = min_similarity
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._jobs: Dict[str, _Job] = {}
+        self._batches: Deque[Tuple[int, Set[str]]] = deque()
+        self._budgets: Dict[int, float] = {}
+        self._batch_id = 0
+        self.scheduled = 0
+        self.fetched = 0
+        self.skipped = 0
+        self.cancelled = 0
+
+    def schedule(self, items: List[Mapping[str, Any]]) -> int:
+        """
+        검색 결과 상위 기사의 미리 받기를 예약합니다. (이벤트 루프 안에서 호출, 즉시 반환)
+
+        Args:
+            items (List[Mapping[str, Any]]): 검색 결과 항목 (검색 순위 순서)
+
+        Returns:
+            int: 새로 예약한 기사 수
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 세마포어와 작업은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 시작
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._jobs, self._batches, self._budgets = {}, deque(), {}
+        self._batch_id += 1
+        batch: Set[str] = set()
+        scheduled = 0
+        for cluster in cluster_items(items, self.min_similarity)[:self.top_k]:
+            item = items[cluster.representative]
+            key = _item_key(item)
+            if not key:
+                continue
+            batch.add(key)
+            job = self._jobs.get(key)
+            if job is not None:
+                # 이전 검색에서 예약한 기사는 이번 검색의 예산으로 받음
+                job.batch = self._batch_id
+                continue
+            self._jobs[key] = _Job(loop.create_task(self._run(key, item)), self._batch_id)
+            self._jobs[key].task.add_done_callback(lambda _, key=key: self._forget(key))
+            scheduled += 1
+        self.scheduled += scheduled
+        self._budgets[self._batch_id] = float(self.max_bytes)
+        self._batches.append((self._batch_id, batch))
+        while len(self._batches) > MAX_BATCHES:
+            batch_id, keys = self._batches.popleft()
+            del self._budgets[batch_id]
+            self._cancel(keys.difference(*(newer for _, newer in self._batches)), started=True)
+        return scheduled
+
+    def claim(self, items: List[Mapping[str, Any]]) -> None:
+        """직접 추출할 기사의 대기 중인 미리 받기를 취소합니다. (받는 중인 기사는 그대로 둠)"""
+        self._cancel({_item_key(item) for item in items}, started=False)
+
+    def _cancel(self, keys: Set[str], started: bool) -> None:
+        for key in keys:
+            job = self._jobs.get(key)
+            if job is not None and (started or not job.started) and not job.task.done():
+                job.task.cancel()
+                self.cancelled += 1
+
+    def _forget(self, key: str) -> None:
+        job = self._jobs.get(key)
+        if job is not None and job.task.done():
+            del self._jobs[key]
+
+    async def _run(self, key: str, item: Mapping[str, Any]) -> None:
+        """동시성 슬롯을 얻으면 캐시와 예산을 확인한 뒤 기사를 추출합니다."""
+        async with self._slots:
+            job = self._jobs[key]
+            job.started = True
+            urls = self.fetcher.resolver.candidates(item)
+            if not urls or await asyncio.to_thread(self._cached, urls):
+                self.skipped += 1
+                return
+            # 예산은 검색 순위 순서로 시작하는 시점에 차감 (캐시에 있던 기사는 차감하지 않음)
+            expected = self.fetcher.resolver.stats.expected_bytes(urls[0])
+            budget = self._budgets.get(job.batch, 0.0)
+            if expected > budget:
+                self.skipped += 1
+                return
+            self._budgets[job.batch] = budget - expected
+            result = await self.fetcher.extract_item(item, speculative=True)
+            self.fetched += 1
+            if result.get('error'):
+                logger.debug(f"기사 미리 받기 실패: {key} - {result['error']}")
+
+    def _cached(self, urls: List[str]) -> bool:
+        for url in urls:
+            entry = self.cache.get(url)
+            if entry is not None and self.cache.is_fresh(entry):
+                return True
+        return False
+
+    async def aclose(self) -> None:
+        """남은 미리 받기를 모두 취소합니다."""
+        tasks = [job.task for job in self._jobs.values()]
+        for task in tasks:
+            task.cancel()
+        if tasks and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,149 @@
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Pattern, Sequence, Tuple
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 본문 추출 전 제거하는 요소 (규칙에 strip이 없으면 사용)
+NOISE_TAGS = ("script", "style", "iframe", "ins")
+
+# 패키지에 포함된 기본 언론사 규칙 파일
+BUILTIN_RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "publishers.json")
+
+# "tag#id.class" 형식의 선택자 (각 부분은 생략 가능)
+_SELECTOR_RE = re.compile(r"^(?P<name>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?:\.(?P<class_>[\w-]+))?$")
+
+
+@dataclass(frozen=True)
+class Selector:
+    """soup.find 한 번에 해당하는 요소 조건"""
+
+    name: Optional[str] = None
+    id: Optional[str] = None
+    class_: Optional[str] = None
+    class_pattern: Optional[Pattern[str]] = None
+    class_contains: Optional[str] = None
+
+    def matches(self, element: Any, classes: Sequence[str]) -> bool:
+        """요소가 모든 조건을 만족하는지 확인합니다."""
+        if self.name is not None and element.tag != self.name:
+            return False
+        if self.id is not None and element.get("id") != self.id:
+            return False
+        if self.class_ is not None and self.class_ not in classes:
+            return False
+        if self.class_pattern is not None and not any(self.class_pattern.search(c) for c in classes):
+            return False
+        if self.class_contains is not None and not any(self.class_contains in c for c in classes):
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class Rule:
+    """본문 후보 선택자(앞쪽 우선)와 본문 추출 전 제거할 태그"""
+
+    selectors: Tuple[Selector, ...]
+    strip: Tuple[str, ...] = ()
+    name: str = ""
+    # 같은 경로로 더 가벼운 페이지를 제공하는 모바일/인쇄용 호스트
+    lightweight_host: str = ""
+
+
+def parse_selector(text: str) -> Selector:
+    """
+    "div#articletxt", "article.story-news", "#textBody" 형식의 선택자를 변환합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 선택자 형식인 경우
+    """
+    match = _SELECTOR_RE.match(text.strip())
+    if match is None or not any(match.groupdict().values()):
+        raise ValueError(f"지원하지 않는 선택자 형식입니다: {text!r} (tag#id.class 형식만 지원)")
+    return Selector(**{k: v for k, v in match.groupdict().items() if v})
+
+
+def _parse_rule(domain: str, spec: Dict[str, Any]) -> Rule:
+    """규칙 파일의 항목 하나를 Rule로 변환합니다."""
+    selectors = spec.get("selectors")
+    if not selectors:
+        raise ValueError(f"{domain}: selectors가 비어 있습니다.")
+    return Rule(
+        tuple(parse_selector(s) for s in selectors),
+        strip=tuple(spec.get("strip", NOISE_TAGS)),
+        name=spec.get("name", ""),
+        lightweight_host=spec.get("lightweight_host", "")
+    )
+
+
+class PublisherRegistry:
+    """언론사 도메인별 본문 추출 규칙 레지스트리
+
+    도메인을 키로 하는 해시 맵이며, 호스트 이름 자체부터 상위 도메인 순으로
+    조회하므로 "n.news.naver.com"은 "news.naver.com" 규칙을,
+    "www.hankyung.com"은 "hankyung.com" 규칙을 사용합니다.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Rule]] = None):
+        self.rules: Dict[str, Rule] = {domain.lower(): rule for domain, rule in (rules or {}).items()}
+
+    def lookup(self, host: str) -> Optional[Tuple[str, Rule]]:
+        """
+        호스트에 해당하는 규칙을 찾습니다.
+
+        Args:
+            host (str): URL의 호스트 (포트 포함 가능)
+
+        Returns:
+            Optional[Tuple[str, Rule]]: (규칙 도메인, 규칙), 없으면 None
+        """
+        labels = host.lower().split(":", 1)[0].rstrip(".").split(".")
+        for i in range(len(labels) - 1):
+            domain = ".".join(labels[i:])
+            rule = self.rules.get(domain)
+            if rule is not None:
+                return domain, rule
+        return None
+
+    def merged(self, other: "PublisherRegistry") -> "PublisherRegistry":
+        """other의 규칙이 같은 도메인의 기존 규칙을 덮어쓴 새 레지스트리를 반환합니다."""
+        return PublisherRegistry({**self.rules, **other.rules})
+
+    def domains(self) -> Iterable[str]:
+        return self.rules.keys()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, Any]]) -> "PublisherRegistry":
+        """{도메인: {"name", "selectors", "strip", "lightweight_host"}} 형식의 데이터로 레지스트리를 생성합니다."""
+        return cls({domain: _parse_rule(domain, spec) for domain, spec in data.items()})
+
+    @classmethod
+    def load(cls, path: str) -> "PublisherRegistry":
+        """
+        JSON 규칙 파일을 불러옵니다.
+
+        Raises:
+            ValueError: 규칙 형식이 올바르지 않은 경우
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_publisher_registry(extra_path: str = "") -> PublisherRegistry:
+    """
+    기본 규칙에 사용자 규칙 파일을 덮어쓴 레지스트리를 생성합니다.
+
+    Args:
+        extra_path (str): 추가 규칙 JSON 파일 경로 (빈 문자열이면 기본 규칙만 사용)
+    """
+    registry = PublisherRegistry.load(BUILTIN_RULES_PATH)
+    if extra_path:
+        registry = registry.merged(PublisherRegistry.load(extra_path))
+        logger.info(f"언론사 추출 규칙 파일을 불러왔습니다: {extra_path}")
+    return registry
@@ -0,0 +1,35 @@
+import re
+from typing import List, Tuple
+
+# 따옴표로 묶은 구문, 제외(-) 또는 필수(+) 단어
+_QUERY_RE = re.compile(r'(-?)"([^"]+)"|([+-]?)(\S+)')
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str]]:
+    """
+    검색어를 포함할 단어/구문과 제외할 단어/구문으로 나눕니다.
+
+    네이버 검색과 같이 공백으로 구분한 단어는 모두 포함(AND)해야 하고, "따옴표"는 구문,
+    -단어는 제외를 뜻합니다.
+    """
+    include: List[str] = []
+    exclude: List[str] = []
+    for quoted_sign, phrase, sign, word in _QUERY_RE.findall(query or ""):
+        term = (phrase or word).strip()
+        if not term:
+            continue
+        (exclude if (quoted_sign or sign) == "-" else include).append(term)
+    return include, exclude
+
+
+def query_terms(query: str) -> Tuple[str, ...]:
+    """
+    스니펫 기준이 될 검색어 단어/구문을 뽑습니다.
+
+    제외(-) 단어는 기사에 없어야 하는 단어이므로 빼고, OR(|)로 묶인 단어는 각각 기준으로 삼습니다.
+    한 글자 단어는 본문 어디에나 나오므로 제외합니다.
+    """
+    include, _ = parse_query(query)
+    return tuple(
+        term for phrase in include for term in (part.strip() for part in phrase.split("|")) if len(term) > 1
+    )
@@ -0,0 +1,312 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.state_store import StateStore
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 낮은 값일수록 먼저 처리됨
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 5
+PRIORITY_BULK = 10
+
+# 네이버 Open API 일일 한도는 한국 시간 자정에 초기화됨
+KST = timezone(timedelta(hours=9))
+
+# 공유 저장소에 기록한 일일 사용량의 보관 기간(초)
+_QUOTA_RETENTION_SECONDS = 2 * 24 * 3600
+
+# 사용량 파일은 이만큼 호출하거나 이만큼 시간(초)이 지날 때마다 저장 (나머지는 close에서 저장)
+QUOTA_SAVE_EVERY = 20
+QUOTA_SAVE_INTERVAL = 10.0
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 API 호출 한도를 모두 사용한 경우 발생"""
+
+
+def kst_today() -> str:
+    """한국 시간 기준 오늘 날짜(YYYY-MM-DD)를 반환합니다."""
+    return datetime.now(KST).date().isoformat()
+
+
+class QuotaTracker:
+    """일일 API 호출 수를 추적하고 파일에 저장하여 재시작 후에도 유지하는 추적기
+
+    공유 저장소(store)를 지정하면 파일 대신 저장소의 원자적 카운터를 사용하므로
+    여러 작업자 프로세스가 하나의 일일 한도를 나눠 씁니다.
+
+    파일은 호출마다 쓰지 않고 save_every회 또는 save_interval초마다 저장하며, 남은 사용량은
+    close()에서 저장합니다. (비정상 종료 시 마지막 저장 이후 호출은 기록되지 않을 수 있음)
+    """
+
+    def __init__(
+        self,
+        daily_limit: int,
+        path: Optional[str] = None,
+        today: Callable[[], str] = kst_today,
+        store: Optional[StateStore] = None,
+        save_every: int = QUOTA_SAVE_EVERY,
+        save_interval: float = QUOTA_SAVE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.daily_limit = daily_limit
+        self.path = path
+        self.today = today
+        self.store = store
+        self.save_every = max(1, save_every)
+        self.save_interval = save_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._date = today()
+        self._used = 0
+        self._unsaved = 0
+        self._saved_at = clock()
+        self._load()
+
+    def _load(self) -> None:
+        """저장된 사용량을 불러옵니다. 날짜가 바뀌었으면 무시합니다."""
+        if self.store is not None or not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("date") == self._date:
+                self._used = int(state.get("used", 0))
+        except (OSError, ValueError) as e:
+            logger.warning(f"API 사용량 파일을 읽지 못했습니다: {self.path} - {e}")
+
+    def _save(self) -> None:
+        """사용량을 원자적으로 저장합니다."""
+        self._unsaved = 0
+        self._saved_at = self.clock()
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"date": self._date, "used": self._used}, f)
+        os.replace(tmp_path, self.path)
+
+    def _roll(self) -> None:
+        """날짜가 바뀌면 사용량을 초기화합니다."""
+        today = self.today()
+        if today != self._date:
+            self._date = today
+            self._used = 0
+
+    def consume(self, n: int = 1) -> None:
+        """
+        호출 n회를 사용량에 반영합니다.
+
+        Raises:
+            QuotaExceededError: 일일 한도를 넘는 경우
+        """
+        with self._lock:
+            self._roll()
+            if self.store is not None:
+                used = self.store.incr("quota", self._date, n, limit=max(0, self.daily_limit), ttl=_QUOTA_RETENTION_SECONDS)
+                if used is None:
+                    raise self._exceeded()
+                self._used = used
+                return
+            if self.daily_limit > 0 and self._used + n > self.daily_limit:
+                raise self._exceeded()
+            self._used += n
+            self._unsaved += n
+            if self._unsaved >= self.save_every or self.clock() - self._saved_at >= self.save_interval:
+                self._save()
+
+    def close(self) -> None:
+        """저장하지 않은 사용량을 파일에 기록합니다."""
+        with self._lock:
+            if self.store is None and self._unsaved:
+                self._save()
+
+    def _exceeded(self) -> QuotaExceededError:
+        return QuotaExceededError(
+            f"네이버 API 일일 호출 한도({self.daily_limit}회)를 모두 사용했습니다. 자정(KST) 이후 다시 시도하세요."
+        )
+
+    def _current(self) -> int:
+        """오늘 사용량을 반환합니다. 공유 저장소가 있으면 다른 작업자의 사용량도 포함합니다."""
+        if self.store is not None:
+            self._used = int(self.store.get("quota", self._date) or 0)
+        return self._used
+
+    def remaining(self) -> Optional[int]:
+        """오늘 남은 호출 수를 반환합니다. 한도가 없으면 None을 반환합니다."""
+        with self._lock:
+            self._roll()
+            if self.daily_limit <= 0:
+                return None
+            return max(0, self.daily_limit - self._current())
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._roll()
+            return self._current()
+
+
+class RateLimiter:
+    """우선순위 대기열이 있는 토큰 버킷 속도 제한기
+
+    초당 허용량을 넘는 요청은 실패시키지 않고 대기열에 넣어 고르게 내보내며,
+    대기 중에는 대화형 요청(PRIORITY_INTERACTIVE)을 대량 요청(PRIORITY_BULK)보다 먼저 처리합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 10.0,
+        burst: int = 10,
+        quota: Optional[QuotaTracker] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = max(rate_per_second, 0.001)
+        self.burst = max(1, burst)
+        self.quota = quota
+        self.clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self) -> float:
+        """경과 시간만큼 토큰을 채우고 현재 시각을 반환합니다."""
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    def _try_take(self) -> float:
+        """토큰을 하나 가져오면 0을, 부족하면 다음 토큰까지 남은 시간을 반환합니다."""
+        now = self._refill()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _check_quota(self) -> None:
+        """대기열에 들어가기 전에 한도 소진 여부를 확인합니다."""
+        if self.quota is not None and self.quota.remaining() == 0:
+            raise self.quota._exceeded()
+
+    async def _quota_call(self, func: Callable[[], None]) -> None:
+        """일일 한도 확인/반영을 실행합니다. 공유 저장소는 다른 작업자의 쓰기 잠금을 기다릴 수 있으므로 스레드에서 실행"""
+        if self.quota is not None and self.quota.store is not None:
+            await asyncio.to_thread(func)
+        else:
+            func()
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        요청 하나를 보낼 수 있을 때까지 대기합니다.
+
+        Args:
+            priority (int): 대기 우선순위 (낮을수록 먼저 처리)
+
+        Raises:
+            QuotaExceededError: 일일 한도를 모두 사용한 경우
+        """
+        await self._quota_call(self._check_quota)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            granted = not self._waiters and self._try_take() == 0
+            if not granted:
+                future: "asyncio.Future[None]" = loop.create_future()
+                heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        if not granted:
+            self._dispatch(loop)
+            await future
+        if self.quota is not None:
+            await self._quota_call(self.quota.consume)
+
+    def acquire_blocking(self) -> None:
+        """
+        동기 클라이언트용 acquire. 토큰이 생길 때까지 현재 스레드를 대기시킵니다.
+
+        Raises:
+            QuotaExceededError: 일일 한도를 모두 사용한 경우
+        """
+        self._check_quota()
+        while True:
+            with self._lock:
+                # 비동기 대기자가 있으면 먼저 처리되도록 양보
+                wait = 1 / self.rate if self._waiters else self._try_take()
+            if wait == 0:
+                break
+            time.sleep(wait)
+        if self.quota is not None:
+            self.quota.consume()
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """토큰이 있는 만큼 우선순위 순서로 대기자를 깨우고, 남으면 다음 실행을 예약합니다."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            while self._waiters:
+                future = self._waiters[0][2]
+                if future.done():
+                    heapq.heappop(self._waiters)
+                    continue
+                wait = self._try_take()
+                if wait > 0:
+                    self._timer = loop.call_later(wait, self._dispatch, loop)
+                    return
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+
+    def close(self) -> None:
+        """일일 한도 사용량을 저장합니다."""
+        if self.quota is not None:
+            self.quota.close()
+
+    def pause(self, seconds: float) -> None:
+        """429 응답 등으로 서버가 속도 제한을 알린 경우 모든 요청을 잠시 멈춥니다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+            self._tokens = 0.0
+
+    def status(self) -> Dict[str, Any]:
+        """현재 속도 제한 및 일일 한도 사용 현황을 반환합니다."""
+        with self._lock:
+            self._refill()
+            tokens = self._tokens
+            queued = sum(1 for _, _, future in self._waiters if not future.done())
+        status: Dict[str, Any] = {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "available_tokens": round(tokens, 2),
+            "queued_requests": queued
+        }
+        if self.quota is not None:
+            status.update({
+                "daily_quota": self.quota.daily_limit,
+                "used_today": self.quota.used,
+                "remaining_today": self.quota.remaining()
+            })
+        return status
+
+
+def build_rate_limiter(config: NaverNewsConfig, store: Optional[StateStore] = None) -> RateLimiter:
+    """NaverNewsConfig 값으로 속도 제한기와 일일 한도 추적기를 생성합니다. (store가 있으면 사용량을 공유)"""
+    quota = QuotaTracker(config.api_daily_quota, path=config.api_quota_state_path or None, store=store)
+    return RateLimiter(config.api_rate_per_second, config.api_burst, quota=quota)
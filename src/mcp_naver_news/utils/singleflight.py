@@ -0,0 +1,64 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """동일한 키의 동시 요청을 하나의 업스트림 호출로 합치는 요청 병합기
+
+    같은 키로 진행 중인 호출이 있으면 새 호출은 그 결과를 함께 기다립니다.
+    대기자 한 명이 취소되어도 공유 작업은 다른 대기자를 위해 계속 실행됩니다.
+    (cancel_orphaned로 기다리던 마지막 대기자가 취소되면 공유 작업도 취소)
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]], cancel_orphaned: bool = False) -> T:
+        """
+        키별로 한 번만 factory를 실행하고 그 결과를 모든 대기자에게 반환합니다.
+
+        Args:
+            key (Hashable): 요청 식별 키
+            factory (Callable[[], Awaitable[T]]): 실제 업스트림 호출을 만드는 함수
+            cancel_orphaned (bool): 이 대기자가 취소될 때 남은 대기자가 없으면 공유 작업도 취소
+
+        Returns:
+            T: 공유된 호출 결과 (예외도 모든 대기자에게 전파됨)
+        """
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self.calls += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if cancel_orphaned and self._waiters.get(key) == 1 and self._inflight.get(key) is task:
+                # 새 대기자가 취소 중인 작업에 합류하지 않도록 먼저 목록에서 제거
+                del self._inflight[key]
+                task.cancel()
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """완료된 작업을 진행 중 목록에서 제거합니다."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우 예외가 회수되지 않았다는 경고를 막음
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,228 @@
+import asyncio
+import contextlib
+import logging
+import re
+import socket
+from typing import AsyncIterator, Optional, Set
+from urllib.parse import parse_qs
+from uuid import UUID
+
+import httpx
+import uvicorn
+from fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mcp_naver_news.utils.metrics import metrics_route, publish_metrics
+from mcp_naver_news.utils.state_store import StateStore
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 작업자 간 전달된 요청 표시 (다시 전달하지 않음)
+FORWARDED_HEADER = "x-mcp-naver-news-forwarded"
+
+# SSE 스트림의 첫 endpoint 이벤트에 담긴 세션 ID (전송 계층 내부 상태 대신 프로토콜로 세션을 파악)
+_ENDPOINT_SESSION_RE = re.compile(rb"event: endpoint\r?\ndata: [^\r\n]*[?&]session_id=([0-9a-f]{32})")
+
+
+class _InternalServer(uvicorn.Server):
+    """다른 작업자가 전달한 요청을 받는 내부 리스너 (시그널은 바깥 서버가 처리)"""
+
+    def install_signal_handlers(self) -> None:
+        # uvicorn 0.29 미만
+        pass
+
+    @contextlib.contextmanager
+    def capture_signals(self):  # type: ignore[override]
+        yield
+
+
+class SessionRouter:
+    """SSE 세션을 연 작업자에게 메시지 POST를 전달하는 ASGI 미들웨어
+
+    여러 작업자가 하나의 포트를 공유하면 클라이언트의 GET /sse 스트림과 이후의 POST /messages 요청이
+    서로 다른 작업자에 도착할 수 있습니다. 각 작업자는 자신이 가진 세션과 내부 리스너 주소를
+    공유 저장소에 등록하고, 자신의 세션이 아닌 POST는 해당 작업자의 내부 리스너로 전달합니다.
+    세션 ID는 SSE 응답의 endpoint 이벤트에서 읽으므로 FastMCP SSE 앱의 내부 상태에 의존하지 않습니다.
+    공유 저장소 접근은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+
+    NAMESPACE = "sse_sessions"
+
+    def __init__(self, app: ASGIApp, store: StateStore):
+        self.app = app
+        self.store = store
+        # 내부 리스너 주소 ("127.0.0.1:포트"), 시작 전에는 None
+        self.address: Optional[str] = None
+        self._known: Set[UUID] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def tracking_send(self, send: Send, sessions: Set[UUID]) -> Send:
+        """
+        SSE 응답에서 endpoint 이벤트를 찾아 세션을 등록한 뒤 전송하는 send를 반환합니다.
+
+        클라이언트가 세션 주소를 받기 전에 등록되므로 다른 작업자가 첫 POST부터 전달할 수 있습니다.
+
+        Args:
+            send (Send): 원래 ASGI send
+            sessions (Set[UUID]): 등록한 세션 ID를 모을 집합 (연결이 끝나면 release_sessions에 전달)
+        """
+        streaming = False
+
+        async def wrapped(message: Message) -> None:
+            nonlocal streaming
+            if message["type"] == "http.response.start":
+                streaming = b"text/event-stream" in dict(message.get("headers", [])).get(b"content-type", b"")
+            elif streaming and not sessions and message["type"] == "http.response.body":
+                match = _ENDPOINT_SESSION_RE.search(message.get("body", b""))
+                if match:
+                    session_id = UUID(hex=match.group(1).decode())
+                    await asyncio.to_thread(self.store.set, self.NAMESPACE, session_id.hex, self.address)
+                    self._known.add(session_id)
+                    sessions.add(session_id)
+            await send(message)
+
+        return wrapped
+
+    def release_sessions(self, session_ids: Set[UUID]) -> None:
+        """연결이 끝난 세션을 공유 저장소에서 제거합니다."""
+        for session_id in session_ids:
+            self.store.delete(self.NAMESPACE, session_id.hex)
+        self._known -= session_ids
+
+    async def owner(self, scope: Scope) -> Optional[str]:
+        """요청의 세션을 가진 다른 작업자의 주소를 반환합니다. 직접 처리할 요청이면 None을 반환합니다."""
+        headers = dict(scope.get("headers", []))
+        if FORWARDED_HEADER.encode() in headers:
+            return None
+        try:
+            session_id = UUID(hex=query_session_id(scope))
+        except ValueError:
+            return None
+        if session_id in self._known:
+            return None
+        address = await asyncio.to_thread(self.store.get, self.NAMESPACE, session_id.hex)
+        return address if address and address != self.address else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] == "GET":
+            sessions: Set[UUID] = set()
+            try:
+                await self.app(scope, receive, self.tracking_send(send, sessions))
+            finally:
+                if sessions:
+                    await asyncio.to_thread(self.release_sessions, sessions)
+            return
+        address = await self.owner(scope)
+        if address is None:
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope, receive)
+        body = await request.body()
+        try:
+            forwarded = await self._http().post(
+                str(request.url.replace(scheme="http", netloc=address)),
+                content=body,
+                headers={
+                    "content-type": request.headers.get("content-type", "application/json"),
+                    FORWARDED_HEADER: "1"
+                }
+            )
+            response = Response(
+                forwarded.content,
+                status_code=forwarded.status_code,
+                media_type=forwarded.headers.get("content-type")
+            )
+        except httpx.HTTPError as e:
+            # 세션을 가진 작업자가 종료된 경우
+            logger.warning(f"SSE 세션 작업자({address})에 메시지를 전달하지 못했습니다: {e}")
+            await asyncio.to_thread(self.store.delete, self.NAMESPACE, query_session_id(scope))
+            response = Response("Could not find session", status_code=404)
+        await response(scope, receive, send)
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=30)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        await asyncio.to_thread(self.release_sessions, set(self._known))
+
+
+def query_session_id(scope: Scope) -> str:
+    """요청의 session_id 쿼리 값을 반환합니다."""
+    return parse_qs(scope.get("query_string", b"").decode()).get("session_id", [""])[0]
+
+
+def fastmcp_sse_app(mcp: FastMCP) -> Starlette:
+    """FastMCP가 공개하는 SSE 앱을 반환합니다. (http_app(transport="sse")가 있으면 사용, 없으면 sse_app)"""
+    http_app = getattr(mcp, "http_app", None)
+    if http_app is not None:
+        return http_app(transport="sse")
+    return mcp.sse_app()
+
+
+def build_worker_app(mcp: FastMCP, store: StateStore) -> Starlette:
+    """
+    여러 작업자가 한 포트를 공유할 때 사용하는 SSE 앱을 생성합니다.
+
+    FastMCP SSE 앱의 경로와 전체 작업자의 측정값을 합산한 /metrics를 제공하며,
+    세션 위치를 공유 저장소에 등록하고 다른 작업자의 세션으로 온 메시지를 전달하는
+    내부 리스너(127.0.0.1, 임의 포트)를 함께 실행합니다.
+
+    Args:
+        mcp (FastMCP): 도구가 등록된 MCP 서버
+        store (StateStore): 작업자 간 공유 저장소
+
+    Returns:
+        Starlette: ASGI 앱
+    """
+    sse_app = fastmcp_sse_app(mcp)
+    router = SessionRouter(sse_app, store)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        router.address = "127.0.0.1:%d" % sock.getsockname()[1]
+        # 열린 SSE 스트림이 종료를 막지 않도록 대기 시간을 제한
+        internal = _InternalServer(
+            uvicorn.Config(app, lifespan="off", log_level="warning", timeout_graceful_shutdown=1)
+        )
+        task = asyncio.create_task(internal.serve(sockets=[sock]))
+        # /metrics가 어느 작업자에 도착해도 전체 작업자의 합계를 반환하도록 측정값을 공유
+        publisher = asyncio.create_task(publish_metrics(store))
+        logger.info(f"SSE 작업자 내부 리스너 시작: {router.address}")
+        try:
+            # 감싼 FastMCP 앱의 lifespan도 함께 실행
+            async with sse_app.router.lifespan_context(sse_app):
+                yield
+        finally:
+            publisher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await publisher
+            internal.should_exit = True
+            await task
+            sock.close()
+            await router.aclose()
+
+    app = Starlette(
+        debug=mcp.settings.debug,
+        routes=[
+            metrics_route(store),
+            # 경로 접두사가 없으므로 FastMCP 앱이 받는 경로는 그대로 유지됨
+            Mount("/", app=router),
+        ],
+        lifespan=lifespan
+    )
+    app.state.session_router = router
+    return app
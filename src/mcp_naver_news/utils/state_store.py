@@ -0,0 +1,210 @@
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+from mcp_naver_news.config import NaverNewsConfig
+
+logger = logging.getLogger("mcp-naver-news")
+
+
+class StateStore(ABC):
+    """여러 서버 작업자 프로세스가 공유하는 키-값 저장소
+
+    검색 캐시, API 일일 사용량, SSE 세션 위치처럼 작업자 사이에 일치해야 하는 상태를 보관합니다.
+    값은 JSON으로 직렬화할 수 있어야 하며, 외부 저장소(Redis 등)를 사용하려면 이 클래스를 구현하고
+    NAVER_NEWS_STATE_STORE에 "모듈:팩토리" 형식으로 지정합니다.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장합니다. ttl(초)이 없으면 만료되지 않습니다."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """값을 삭제합니다."""
+
+    @abstractmethod
+    def incr(self, namespace: str, key: str, amount: int = 1, limit: int = 0, ttl: Optional[float] = None) -> Optional[int]:
+        """
+        정수 값을 원자적으로 증가시킵니다.
+
+        Args:
+            namespace (str): 이름 공간
+            key (str): 키
+            amount (int): 증가량
+            limit (int): 증가 후 값의 상한 (0이면 제한 없음)
+            ttl (float, optional): 새로 만드는 항목의 유효 시간(초)
+
+        Returns:
+            Optional[int]: 증가 후 값, 상한을 넘으면 증가하지 않고 None
+        """
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """이름 공간의 모든 항목을 삭제합니다."""
+
+    @abstractmethod
+    def count(self, namespace: str) -> int:
+        """이름 공간의 유효한 항목 수를 반환합니다."""
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """이름 공간의 유효한 항목을 모두 반환합니다. (작업자별 측정값 합산에 사용, 기본 구현은 빈 dict)"""
+        return {}
+
+    def trim(self, namespace: str, max_entries: int) -> None:
+        """만료된 항목을 지우고, max_entries를 넘으면 만료가 가까운 항목부터 삭제합니다."""
+
+    def close(self) -> None:
+        """저장소 연결을 닫습니다."""
+
+
+class SqliteStateStore(StateStore):
+    """SQLite 파일 기반 공유 저장소 (같은 호스트의 작업자 프로세스 간 공유)"""
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.clock = clock
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # 트랜잭션은 incr에서만 명시적으로 시작
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, self.clock())
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = self.clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False), expires_at)
+            )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def incr(self, namespace: str, key: str, amount: int = 1, limit: int = 0, ttl: Optional[float] = None) -> Optional[int]:
+        now = self.clock()
+        with self._lock:
+            # 다른 프로세스의 증가와 겹치지 않도록 쓰기 잠금을 먼저 획득
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM state WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+                if row is None or (row[1] is not None and row[1] <= now):
+                    current, expires_at = 0, now + ttl if ttl is not None else None
+                else:
+                    current, expires_at = int(json.loads(row[0])), row[1]
+                if limit > 0 and current + amount > limit:
+                    self._conn.execute("ROLLBACK")
+                    return None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (namespace, key, json.dumps(current + amount), expires_at)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return current + amount
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM state WHERE namespace = ?", (namespace,))
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM state WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, self.clock())
+            ).fetchone()
+        return row[0]
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM state WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, self.clock())
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def trim(self, namespace: str, max_entries: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM state WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (namespace, self.clock())
+            )
+            self._conn.execute(
+                """
+                DELETE FROM state WHERE namespace = ? AND key NOT IN (
+                    SELECT key FROM state WHERE namespace = ?
+                    ORDER BY expires_at IS NULL DESC, expires_at DESC LIMIT ?
+                )
+                """,
+                (namespace, namespace, max(0, max_entries))
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def load_state_store(config: NaverNewsConfig) -> Optional[StateStore]:
+    """
+    NAVER_NEWS_STATE_STORE 설정에 따라 공유 저장소를 생성합니다.
+
+    - "" 또는 "memory": 공유하지 않음 (None, 프로세스별 메모리 상태 사용)
+    - "sqlite": NAVER_NEWS_STATE_STORE_PATH의 SQLite 파일
+    - "모듈:팩토리": 팩토리(config)가 반환한 StateStore (외부 저장소 연동)
+
+    Raises:
+        ValueError: 지원하지 않는 값이거나 팩토리가 StateStore를 반환하지 않은 경우
+    """
+    backend = config.state_store.strip()
+    if backend in ("", "memory"):
+        return None
+    if backend == "sqlite":
+        logger.info(f"공유 상태 저장소 사용: {config.state_store_path}")
+        return SqliteStateStore(config.state_store_path)
+    if ":" not in backend:
+        raise ValueError(f"지원하지 않는 상태 저장소입니다: {backend} (memory, sqlite, 모듈:팩토리)")
+    module_name, factory_name = backend.split(":", 1)
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    store = factory(config)
+    if not isinstance(store, StateStore):
+        raise ValueError(f"{backend}가 StateStore를 반환하지 않았습니다: {type(store).__name__}")
+    logger.info(f"공유 상태 저장소 사용: {backend}")
+    return store
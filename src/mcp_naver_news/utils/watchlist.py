@@ -0,0 +1,331 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from mcp_naver_news.utils.article_archive import pub_date_timestamp
+from mcp_naver_news.utils.cache import normalize_query
+from mcp_naver_news.utils.rate_limiter import KST, PRIORITY_BATCH
+from mcp_naver_news.utils.state_store import StateStore
+
+logger = logging.getLogger("mcp-naver-news")
+
+# 공유 저장소의 이름 공간 (키는 정규화한 검색어)
+WATCHLIST_NAMESPACE = "watchlist"
+
+# 폴링 중인 검색어 표시 (작업자 사이에서 같은 검색어를 동시에 폴링하지 않도록 사용)
+# 작업자가 폴링 도중 종료되어도 이 시간(초)이 지나면 다시 폴링할 수 있음
+POLLING_NAMESPACE = "watchlist_polling"
+POLLING_LEASE = 300.0
+
+# 네이버 뉴스 검색 API의 페이지 크기 및 시작 위치 상한
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+# 새 기사가 거의 없을 때의 첫 페이지 크기 (예상 새 기사 수에 맞춰 MAX_DISPLAY까지 늘림)
+MIN_DISPLAY = 10
+
+# 기준 시각(high_water)보다 이만큼 이전에 발행된 기사의 링크까지 기억 (같은 발행 시각/늦게 색인된 기사 대비)
+SEEN_WINDOW = 3600.0
+MAX_SEEN = 500
+
+# 폴링 한 번에 새 기사가 이 정도 쌓이도록 간격을 조정하고, 새 기사 비율은 지수 이동 평균으로 추정
+TARGET_NEW = 5
+RATE_SMOOTHING = 0.3
+
+
+@dataclass
+class WatchState:
+    """관심 검색어 하나의 폴링 상태"""
+
+    query: str
+    interval: float
+    high_water: float = 0.0
+    seen: Dict[str, float] = field(default_factory=dict)
+    next_poll_at: float = 0.0
+    last_polled_at: float = 0.0
+    rate: float = 0.0
+    polls: int = 0
+    api_calls: int = 0
+    last_calls: int = 0
+    new_total: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WatchState":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def summary(self) -> Dict[str, Any]:
+        """도구 응답용 요약"""
+        return {
+            '검색어': self.query,
+            '다음확인': datetime.fromtimestamp(self.next_poll_at, KST).strftime("%Y-%m-%d %H:%M:%S") if self.next_poll_at else "즉시",
+            '확인간격(분)': round(self.interval / 60, 1),
+            '시간당새기사': round(self.rate * 3600, 2),
+            '누적새기사': self.new_total,
+            'API호출': self.api_calls,
+        }
+
+
+class Watchlist:
+    """관심 검색어의 새 기사를 최소한의 API 호출로 찾는 폴링 목록
+
+    검색어마다 마지막으로 본 기사의 발행 시각(high_water)과 링크를 기억하고, sort=date 결과를
+    이미 본 기사가 나올 때까지만 넘겨 새 기사만 반환합니다. 확인 간격은 검색어별 새 기사 빈도에
+    맞춰 min_interval과 max_interval 사이에서 조정되므로, 자주 호출해도 확인할 때가 된 검색어만
+    API를 사용합니다.
+
+    상태는 공유 저장소(store)가 있으면 저장소에, 없으면 path의 JSON 파일에 저장합니다.
+    폴링 중인 검색어는 표시해 두므로 poll이 겹쳐 호출되어도(다른 작업자 포함) 한 번만 폴링합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        store: Optional[StateStore] = None,
+        min_interval: float = 300.0,
+        max_interval: float = 21600.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._states: Dict[str, WatchState] = {}
+        self._polling: Set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        if self.store is not None or not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._states = {key: WatchState.from_dict(value) for key, value in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"관심 검색어 파일을 읽지 못했습니다: {self.path} - {e}")
+
+    def _save(self) -> None:
+        """파일 상태를 원자적으로 저장합니다."""
+        if self.store is not None or not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({key: state.to_dict() for key, state in self._states.items()}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def _all(self) -> Dict[str, WatchState]:
+        """모든 상태의 복사본 (폴링 중인 상태를 호출자가 바꾸지 않도록 파일 모드도 복사)"""
+        if self.store is not None:
+            return {key: WatchState.from_dict(value) for key, value in self.store.items(WATCHLIST_NAMESPACE).items()}
+        return {key: WatchState.from_dict(state.to_dict()) for key, state in self._states.items()}
+
+    def _get(self, key: str) -> Optional[WatchState]:
+        """검색어 하나의 최신 상태 복사본"""
+        if self.store is not None:
+            value = self.store.get(WATCHLIST_NAMESPACE, key)
+            return WatchState.from_dict(value) if value is not None else None
+        state = self._states.get(key)
+        return WatchState.from_dict(state.to_dict()) if state is not None else None
+
+    def _claim(self, keys: List[str], force: bool, now: float) -> List[WatchState]:
+        """
+        폴링 중이 아닌 검색어를 폴링 중으로 표시하고, 표시한 뒤 다시 읽은 상태 중 확인할 때가 된 것을 반환합니다.
+
+        다시 읽으므로 겹친 poll이 방금 저장한 기준 시각을 이어받고, 그 사이 확인을 마친 검색어는 건너뜁니다.
+        """
+        claimed: List[WatchState] = []
+        with self._lock:
+            for key in keys:
+                if key in self._polling:
+                    continue
+                if self.store is not None and self.store.incr(POLLING_NAMESPACE, key, limit=1, ttl=POLLING_LEASE) is None:
+                    continue
+                state = self._get(key)
+                if state is None or not (force or state.next_poll_at <= now):
+                    if self.store is not None:
+                        self.store.delete(POLLING_NAMESPACE, key)
+                    continue
+                self._polling.add(key)
+                claimed.append(state)
+        return claimed
+
+    def _release(self, states: List[WatchState]) -> None:
+        """폴링 중 표시를 지웁니다."""
+        with self._lock:
+            for state in states:
+                key = normalize_query(state.query)
+                self._polling.discard(key)
+                if self.store is not None:
+                    self.store.delete(POLLING_NAMESPACE, key)
+
+    def _put(self, states: List[WatchState], existing_only: bool = False) -> None:
+        """상태를 저장합니다. existing_only면 그 사이 삭제된 검색어는 다시 추가하지 않습니다."""
+        with self._lock:
+            keys = set(self._all()) if existing_only else set()
+            for state in states:
+                key = normalize_query(state.query)
+                if existing_only and key not in keys:
+                    continue
+                if self.store is not None:
+                    self.store.set(WATCHLIST_NAMESPACE, key, state.to_dict())
+                else:
+                    self._states[key] = state
+            self._save()
+
+    def add(self, queries: List[str]) -> List[str]:
+        """
+        관심 검색어를 추가합니다. 첫 폴링에서 현재 최신 기사를 기준으로 삼고, 그 뒤의 기사만 새 기사로 반환합니다.
+
+        Returns:
+            List[str]: 새로 추가한 검색어 (이미 있는 검색어는 제외)
+        """
+        existing = self._all()
+        added: Dict[str, WatchState] = {}
+        for query in queries:
+            query = " ".join(query.split())
+            key = normalize_query(query)
+            if query and key not in existing and key not in added:
+                added[key] = WatchState(query=query, interval=self.min_interval)
+        self._put(list(added.values()))
+        return [state.query for state in added.values()]
+
+    def remove(self, queries: List[str]) -> List[str]:
+        """관심 검색어를 삭제하고 삭제한 검색어를 반환합니다."""
+        existing = self._all()
+        removed = []
+        with self._lock:
+            for query in queries:
+                key = normalize_query(query)
+                if key not in existing:
+                    continue
+                removed.append(existing.pop(key).query)
+                if self.store is not None:
+                    self.store.delete(WATCHLIST_NAMESPACE, key)
+                else:
+                    self._states.pop(key, None)
+            self._save()
+        return removed
+
+    def states(self) -> List[WatchState]:
+        """다음 확인 시각 순서의 관심 검색어 상태"""
+        return sorted(self._all().values(), key=lambda state: state.next_poll_at)
+
+    async def poll(
+        self,
+        news: Any,
+        force: bool = False,
+        queries: Optional[List[str]] = None
+    ) -> List[Tuple[WatchState, List[Dict[str, Any]], str]]:
+        """
+        확인할 때가 된 검색어를 동시에 폴링합니다.
+
+        Args:
+            news: asearch_news(query, display, start, sort, priority)를 제공하는 NewsAPI
+            force (bool): 확인 시각과 관계없이 모두 폴링
+            queries (List[str], optional): 이 검색어만 폴링 (관심 목록에 있는 것만)
+
+        Returns:
+            List[Tuple[WatchState, List[Dict[str, Any]], str]]: 폴링한 검색어별 (상태, 최신순 새 기사, 오류 메시지)
+        """
+        now = self.clock()
+        states = await asyncio.to_thread(self.states)
+        if queries is not None:
+            wanted = {normalize_query(query) for query in queries}
+            states = [state for state in states if normalize_query(state.query) in wanted]
+        keys = [normalize_query(state.query) for state in states if force or state.next_poll_at <= now]
+        # 상태 파일/공유 저장소 접근은 이벤트 루프를 막지 않도록 스레드에서 실행
+        due = await asyncio.to_thread(self._claim, keys, force, now)
+
+        async def run(state: WatchState) -> Tuple[WatchState, List[Dict[str, Any]], str]:
+            try:
+                return state, await self._poll_one(news, state, now), ""
+            except Exception as e:
+                # 한도 초과 등 실패한 검색어는 상태를 바꾸지 않고 다음 호출에서 다시 확인
+                logger.warning(f"관심 검색어 확인 실패: {state.query} - {e}")
+                return state, [], str(e)
+
+        try:
+            results = await asyncio.gather(*(run(state) for state in due))
+            await asyncio.to_thread(self._put, [state for state, _, error in results if not error], True)
+        finally:
+            await asyncio.to_thread(self._release, due)
+        return list(results)
+
+    async def _poll_one(self, news: Any, state: WatchState, now: float) -> List[Dict[str, Any]]:
+        """sort=date 결과를 이미 본 기사가 나올 때까지 넘기며 새 기사를 모으고 다음 확인 시각을 정합니다."""
+        baseline = state.polls == 0
+        cutoff = state.high_water - SEEN_WINDOW if state.high_water else None
+        expected = state.rate * (now - state.last_polled_at) if state.last_polled_at else 0.0
+        display = min(MAX_DISPLAY, max(MIN_DISPLAY, math.ceil(expected * 2)))
+        start = 1
+        state.last_calls = 0
+        new_items: List[Dict[str, Any]] = []
+        reached = baseline
+        while True:
+            result = await news.asearch_news(state.query, display, start, "date", priority=PRIORITY_BATCH)
+            state.api_calls += 1
+            state.last_calls += 1
+            items = result.get('items', [])
+            for item in items:
+                link = item.get('originallink') or item.get('link', '')
+                if link in state.seen or (cutoff is not None and pub_date_timestamp(item.get('pubDate', '')) < cutoff):
+                    reached = True
+                    break
+                new_items.append(item)
+            if reached or len(items) < display or start + display > MAX_START:
+                break
+            # 새 기사가 한 페이지를 넘으면 남은 구간은 최대 크기 페이지로 확인
+            start += display
+            display = min(MAX_DISPLAY, MAX_START - start + 1)
+        overflowed = not reached and start + display > MAX_START
+
+        for item in new_items:
+            link = item.get('originallink') or item.get('link', '')
+            published = pub_date_timestamp(item.get('pubDate', ''))
+            state.seen[link] = published
+            state.high_water = max(state.high_water, published)
+        # 기준 시각 근처의 링크만 기억
+        recent = sorted(
+            ((link, published) for link, published in state.seen.items() if published >= state.high_water - SEEN_WINDOW),
+            key=lambda entry: entry[1],
+            reverse=True
+        )
+        state.seen = dict(recent[:MAX_SEEN])
+        if baseline:
+            self._schedule(state, 0, now, overflowed=False)
+            return []
+        state.new_total += len(new_items)
+        self._schedule(state, len(new_items), now, overflowed)
+        return new_items
+
+    def _schedule(self, state: WatchState, new_count: int, now: float, overflowed: bool) -> None:
+        """새 기사 빈도로 다음 확인 간격을 정합니다. (TARGET_NEW건이 쌓일 시간, 새 기사가 없으면 두 배)"""
+        if state.last_polled_at and now > state.last_polled_at:
+            observed = new_count / (now - state.last_polled_at)
+            state.rate = observed if state.polls <= 1 else RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * state.rate
+        if overflowed:
+            # 검색 구간을 넘을 만큼 새 기사가 많으면 가장 짧은 간격으로 확인
+            interval = self.min_interval
+        elif state.rate > 0:
+            interval = TARGET_NEW / state.rate
+        else:
+            interval = state.interval * 2
+        state.interval = min(self.max_interval, max(self.min_interval, interval))
+        state.next_poll_at = now + state.interval
+        state.last_polled_at = now
+        state.polls += 1
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.tools.news_tools import _archive, search_news_archive
+from mcp_naver_news.utils.article_archive import ArticleArchive, bigrams
+from mcp_naver_news.utils.query import parse_query
+from mcp_naver_news.utils.output import NewsItem
+
+
+def _item(number, title, content, pub_date="Mon, 13 Oct 2025 09:00:00 +0900"):
+    return {
+        "title": title,
+        "link": f"https://n.news.naver.com/mnews/article/001/{number}",
+        "originallink": f"https://www.example.com/article/{number}",
+        "description": "요약",
+        "pubDate": pub_date,
+        "content": content,
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = ArticleArchive(str(tmp_path / "archive.sqlite3"))
+    archive.add([
+        _item(1, "<b>반도체</b> 수출 급증", "메모리 반도체 수출이 늘었다. 기준금리는 동결됐다."),
+        _item(2, "금리 인하 기대", "한국은행이 기준금리 인하를 검토한다.", "Wed, 15 Oct 2025 10:00:00 +0900"),
+        _item(3, "배터리 업황", "이차전지와 반도체 장비 투자가 줄었다.", "Fri, 17 Oct 2025 08:00:00 +0900"),
+    ])
+    yield archive
+    archive.close()
+
+
+def _titles(items):
+    return [item["title"] for item in items]
+
+
+def test_query_syntax_matches_korean_substrings(archive):
+    """Words must all occur (even two-syllable ones and inside compounds), phrases stay contiguous and -words exclude"""
+    assert parse_query('반도체 "수출 급증" -배터리') == (["반도체", "수출 급증"], ["배터리"])
+    assert _titles(archive.search('반도체 "수출이 늘었다"')) == ["반도체 수출 급증"]
+    assert sorted(_titles(archive.search("금리"))) == ["금리 인하 기대", "반도체 수출 급증"]
+    assert _titles(archive.search("반도체 -배터리")) == ["반도체 수출 급증"]
+    assert archive.search("장비 수출") == []
+
+
+def test_two_syllable_terms_use_the_bigram_index(archive):
+    """Words are indexed as overlapping character pairs, and single-character terms still match via LIKE"""
+    assert bigrams("<기준금리> 동결, AI") == "기준 준금 금리 동결 ai"
+
+    plan = archive._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT rowid FROM archive_grams WHERE archive_grams MATCH ?", ('"금리"',)
+    ).fetchall()
+    assert any("VIRTUAL TABLE INDEX" in row[-1] for row in plan)
+    assert _titles(archive.search("기준금리 -인하")) == ["반도체 수출 급증"]
+    assert _titles(archive.search("업 배터리")) == ["배터리 업황"]
+
+
+def test_date_range_is_inclusive_in_korea_time(archive):
+    """start_date and end_date cover whole days in KST and an empty query lists by date"""
+    assert _titles(archive.search(start_date="2025-10-15", end_date="2025-10-17", sort="date")) == ["배터리 업황", "금리 인하 기대"]
+    assert _titles(archive.search("반도체", end_date="2025-10-13")) == ["반도체 수출 급증"]
+    with pytest.raises(ValueError):
+        archive.search(start_date="10/15/2025")
+
+
+def test_reinserting_unchanged_articles_is_a_no_op(archive):
+    """Only new or changed articles are (re)indexed, and stale text stops matching"""
+    assert archive.add([_item(3, "배터리 업황", "이차전지와 반도체 장비 투자가 줄었다.")]) == 0
+    assert archive.add([_item(3, "배터리 업황", "이차전지 투자가 늘었다.")]) == 1
+
+    assert len(archive) == 3
+    assert _titles(archive.search("반도체 장비")) == []
+    assert _titles(archive.search("이차전지")) == ["배터리 업황"]
+
+
+def test_compaction_applies_retention_and_keeps_index_consistent(tmp_path):
+    """Compaction drops articles beyond the age and size limits, including their index entries"""
+    archive = ArticleArchive(str(tmp_path / "archive.sqlite3"), max_entries=1, max_days=30)
+    now = datetime.now(timezone.utc)
+    archive.add([
+        _item(1, "오래된 기사", "반도체 옛날 이야기", format_datetime(now - timedelta(days=400))),
+        _item(2, "이전 기사", "반도체 지난주 이야기", format_datetime(now - timedelta(days=7))),
+        _item(3, "최신 기사", "반도체 오늘 이야기", format_datetime(now - timedelta(hours=1))),
+    ])
+
+    result = archive.compact()
+
+    assert result == {"removed": 2, "entries": 1}
+    assert _titles(archive.search("반도체")) == ["최신 기사"]
+    archive.close()
+
+
+def test_detail_results_are_archived_and_searchable_offline(tmp_path):
+    """Extracted articles are stored by the detail tool and served by search_news_archive without the API"""
+    archive = ArticleArchive(str(tmp_path / "archive.sqlite3"))
+    config = NaverNewsConfig(client_id="test", client_secret="test")
+    lifespan_context = SimpleNamespace(article_archive=archive, client=SimpleNamespace(config=config))
+    ctx = SimpleNamespace(request_context=SimpleNamespace(lifespan_context=lifespan_context))
+    items = [_item(1, "반도체 수출", ""), _item(2, "실패한 기사", "")]
+    news_items = [NewsItem.from_api(item) for item in items]
+    news_items[0].content = "메모리 반도체 수출 호조"
+    news_items[1].content = "본문 추출 실패: timeout"
+
+    _archive(lifespan_context, items, news_items)
+    result = asyncio.run(search_news_archive(query="반도체", fields=["title", "content"], compact=True, ctx=ctx))
+
+    assert json.loads(result.text) == [{"제목": "반도체 수출", "본문": "메모리 반도체 수출 호조"}]
+    assert len(archive) == 1
+    archive.close()
+
+
+def test_trigram_archives_are_reindexed_on_open(tmp_path):
+    """An archive created with the earlier trigram index is searchable through the new index after reopening"""
+    path = str(tmp_path / "archive.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE archive (
+            id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, link TEXT NOT NULL, originallink TEXT NOT NULL,
+            title TEXT NOT NULL, description TEXT NOT NULL, content TEXT NOT NULL, pub_date TEXT NOT NULL,
+            published_at REAL NOT NULL, archived_at REAL NOT NULL
+        );
+        CREATE VIRTUAL TABLE archive_fts USING fts5(title, content, content='archive', content_rowid='id', tokenize='trigram');
+        CREATE TRIGGER archive_ai AFTER INSERT ON archive BEGIN
+            INSERT INTO archive_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END;
+        INSERT INTO archive VALUES (1, 'example.com/1', '', '', '환율 급등', '', '원달러 환율이 올랐다.', '', 0, 0);
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    archive = ArticleArchive(path)
+
+    assert _titles(archive.search("환율")) == ["환율 급등"]
+    tables = {row[0] for row in archive._conn.execute("SELECT name FROM sqlite_master")}
+    assert "archive_fts" not in tables and "archive_ai" not in tables
+    archive.close()
@@ -0,0 +1,75 @@
+import asyncio
+import httpx
+from mcp_naver_news.utils.article_cache import ArticleCache, canonical_url
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+
+HTML = "<html><head><title>제목</title></head><body><article>" + "본문 " * 60 + "</article></body></html>"
+
+def test_canonical_url_strips_tracking_and_fragment():
+    """Tracking parameters, fragments and host case do not split cache entries"""
+    assert canonical_url("HTTPS://News.Example.com/a?id=1&utm_source=x#top") == "https://news.example.com/a?id=1"
+
+def test_cache_survives_restart(tmp_path):
+    """Entries written by one instance are readable after reopening the file"""
+    path = str(tmp_path / "articles.sqlite3")
+    cache = ArticleCache(path)
+    cache.put("https://news.example.com/1", "제목", "본문", etag='"v1"')
+    cache.close()
+
+    reopened = ArticleCache(path)
+    entry = reopened.get("https://news.example.com/1")
+
+    assert entry.title == "제목"
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+def test_cache_evicts_least_recently_accessed(tmp_path):
+    """The size cap evicts the entry that was read least recently"""
+    cache = ArticleCache(str(tmp_path / "articles.sqlite3"), max_entries=2, evict_every=1)
+    cache.put("https://a.example.com/1", "a", "a")
+    cache.put("https://b.example.com/1", "b", "b")
+    cache.get("https://a.example.com/1")
+    cache.put("https://c.example.com/1", "c", "c")
+
+    assert len(cache) == 2
+    assert cache.get("https://b.example.com/1") is None
+    assert cache.get("https://a.example.com/1") is not None
+
+def test_reads_and_evictions_are_batched(tmp_path):
+    """Access times are written in batches and the size cap is enforced every evict_every inserts, keeping recent reads"""
+    cache = ArticleCache(str(tmp_path / "articles.sqlite3"), max_entries=3, evict_every=3)
+    for name in "abcd":
+        cache.put(f"https://{name}.example.com/1", name, name)
+    cache.get("https://a.example.com/1")
+    cache.put("https://e.example.com/1", "e", "e")
+
+    assert len(cache) == 5
+    assert cache._touched
+
+    cache.put("https://f.example.com/1", "f", "f")
+
+    assert len(cache) == 3
+    assert cache.get("https://a.example.com/1") is not None
+    assert cache.get("https://b.example.com/1") is None
+
+def test_not_modified_response_skips_parsing(tmp_path):
+    """A 304 revalidation returns the cached body without downloading the page again"""
+    cache = ArticleCache(str(tmp_path / "articles.sqlite3"), fresh_seconds=0)
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=HTML, headers={"ETag": '"v1"'})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await aextract_article_content("https://news.example.com/1", client=client, cache=cache)
+            second = await aextract_article_content("https://news.example.com/1", client=client, cache=cache)
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert seen_headers == [None, '"v1"']
+    assert first == second
+    assert second['error'] == ''
@@ -0,0 +1,52 @@
+import asyncio
+from mcp_naver_news.apis.news import NewsAPI
+from mcp_naver_news.tools.news_tools import BatchQuery, search_news_batch, _group_batch_results
+
+
+class _KeywordClient:
+    """검색어별로 정해진 링크를 돌려주는 가짜 비동기 클라이언트"""
+    def __init__(self, links_by_query, fail=()):
+        self.links_by_query = links_by_query
+        self.fail = set(fail)
+        self.requests = []
+
+    async def get(self, endpoint, params=None, priority=0):
+        self.requests.append((params["query"], params["display"], params["sort"], priority))
+        if params["query"] in self.fail:
+            raise RuntimeError("upstream error")
+        items = [{"title": link, "link": link} for link in self.links_by_query[params["query"]]]
+        return {"items": items}
+
+def test_asearch_many_runs_all_queries_and_isolates_errors():
+    """Every query runs with its own display/sort and one failure does not fail the batch"""
+    client = _KeywordClient({"a": ["l1"], "b": ["l2"]}, fail={"b"})
+    news_api = NewsAPI(None, async_client=client)
+
+    results = asyncio.run(news_api.asearch_many([
+        {"query": "a", "display": 5, "sort": "date"},
+        {"query": "b"},
+    ]))
+
+    assert results[0]["items"][0]["link"] == "l1"
+    assert "error" in results[1]
+    assert ("a", 5, "date") == client.requests[0][:3]
+
+def test_group_batch_results_dedupes_across_queries():
+    """Shared articles are emitted once with every query that found them"""
+    specs = [{"query": "삼성전자"}, {"query": "반도체"}]
+    results = [
+        {"items": [{"link": "l1"}, {"link": "l2"}]},
+        {"items": [{"link": "l2"}, {"link": "l3"}]},
+    ]
+
+    grouped = _group_batch_results(specs, results)
+
+    assert grouped[0]["기사"][1]["적중검색어"] == ["삼성전자", "반도체"]
+    assert grouped[1]["기사"][0] == {"링크": "l2", "중복": "삼성전자"}
+    assert grouped[1]["기사"][1]["적중검색어"] == ["반도체"]
+
+def test_batch_query_defaults():
+    """Per-query display/sort fall back to the shared defaults"""
+    query = BatchQuery(query="카카오")
+
+    assert query.display is None and query.sort is None
@@ -0,0 +1,91 @@
+import json
+from types import SimpleNamespace
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.apis.news import NewsAPI
+from mcp_naver_news.tools.news_tools import get_api_quota
+from mcp_naver_news.utils.cache import TTLCache, normalize_query
+from mcp_naver_news.utils.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class _CountingClient:
+    """호출 횟수를 기록하는 가짜 NaverNewsClient"""
+    def __init__(self, config):
+        self.config = config
+        self.calls = 0
+
+    def get(self, endpoint, params=None):
+        self.calls += 1
+        return {"items": [{"title": params["query"], "link": "https://n.news.naver.com/1"}]}
+
+def test_normalize_query():
+    """Whitespace and case differences map to the same key"""
+    assert normalize_query("  Samsung   Electronics ") == normalize_query("samsung electronics")
+
+def test_ttl_expiry_and_lru_eviction():
+    """Entries expire after their TTL and the least recently used entry is evicted first"""
+    clock = _FakeClock()
+    cache = TTLCache(maxsize=2, clock=clock)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+def test_news_api_serves_repeated_queries_from_cache():
+    """Repeated normalized queries hit the cache and cached items are not shared with callers"""
+    config = NaverNewsConfig(client_id="id", client_secret="secret")
+    client = _CountingClient(config)
+    news_api = NewsAPI(client, cache=TTLCache())
+
+    first = news_api.search_news(query="삼성전자 ", display=10)
+    first["items"][0]["content"] = "변경"
+    second = news_api.search_news(query="삼성전자", display=10)
+
+    assert client.calls == 1
+    assert "content" not in second["items"][0]
+
+def test_date_sort_uses_shorter_ttl():
+    """date-sorted results expire on their own, shorter TTL"""
+    clock = _FakeClock()
+    config = NaverNewsConfig(client_id="id", client_secret="secret", search_cache_ttl_sim=600, search_cache_ttl_date=60)
+    client = _CountingClient(config)
+    news_api = NewsAPI(client, cache=TTLCache(clock=clock))
+
+    news_api.search_news(query="q", sort="date")
+    news_api.search_news(query="q", sort="sim")
+    clock.now = 120
+    news_api.search_news(query="q", sort="date")
+    news_api.search_news(query="q", sort="sim")
+
+    assert client.calls == 3
+
+def test_api_quota_reports_search_cache_hits():
+    """get_api_quota shows operators how many searches the cache answered without an API call"""
+    config = NaverNewsConfig(client_id="id", client_secret="secret")
+    cache = TTLCache()
+    news_api = NewsAPI(_CountingClient(config), cache=cache)
+    for _ in range(3):
+        news_api.search_news(query="삼성전자", display=10)
+    lifespan_context = SimpleNamespace(client=SimpleNamespace(config=config), rate_limiter=RateLimiter(), search_cache=cache)
+    ctx = SimpleNamespace(request_context=SimpleNamespace(lifespan_context=lifespan_context))
+
+    status = json.loads(get_api_quota(ctx=ctx).text)
+
+    assert status["search_cache"]["hits"] == 2
+    assert status["search_cache"]["misses"] == 1
+    assert status["search_cache"]["size"] == 1
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.tools.news_tools import search_news_detail
+from mcp_naver_news.utils.dedup import Cluster, body_fingerprint, cluster_items, hamming, merge_by_body
+
+WIRE = "(서울=연합뉴스) 홍길동 기자 = 삼성전자가 3분기 연결 기준 영업이익이 9조1천억원으로 잠정 집계됐다고 8일 밝혔다."
+BODY = (
+    "삼성전자가 3분기 연결 기준 영업이익이 9조1천억원으로 잠정 집계됐다고 8일 밝혔다. 메모리 반도체 가격이 오르며 "
+    "서버용 고대역폭메모리 판매가 늘었고, 파운드리 적자 폭도 줄었다. 증권가는 4분기에도 메모리 업황 개선이 이어질 것으로 "
+    "내다봤다. 스마트폰 사업은 신제품 출시 효과로 매출이 늘었지만 마케팅 비용 증가로 수익성은 소폭 낮아졌다. "
+    "디스플레이 부문은 주요 고객사의 신제품 패널 공급이 본격화하며 분기 최대 매출을 기록했다."
+)
+
+
+def _item(number, title, description, host="www.example.com"):
+    return {
+        "title": title,
+        "link": f"https://n.news.naver.com/mnews/article/001/{number}",
+        "originallink": f"https://{host}/article/{number}",
+        "description": description,
+        "pubDate": "Wed, 08 Oct 2025 09:00:00 +0900",
+    }
+
+
+ITEMS = [
+    _item(1, "삼성전자, 3분기 영업이익 9조원…<b>반도체</b> 회복", WIRE, "www.yna.co.kr"),
+    _item(2, "SK하이닉스, 3분기 영업이익 7조원…HBM 호조", "SK하이닉스가 3분기 연결 기준 영업이익이 7조원으로 잠정 집계됐다고 24일 밝혔다.", "www.hankyung.com"),
+    _item(3, "[속보] 삼성전자, 3분기 영업이익 9조원…반도체 회복", WIRE, "www.mk.co.kr"),
+    _item(4, "삼성전자 3분기 영업익 9조원 '반도체 회복'", WIRE.split(" = ", 1)[1], "www.sedaily.com"),
+]
+
+
+def test_wire_copies_cluster_under_the_top_ranked_item():
+    """Republished copies with edited titles join the first-ranked article, other stories stay separate"""
+    clusters = cluster_items(ITEMS)
+
+    assert [c.members for c in clusters] == [[0, 2, 3], [1]]
+    assert cluster_items(ITEMS, min_similarity=1.1)[0].members == [0]
+
+
+def test_body_fingerprints_merge_copies_found_after_extraction():
+    """Bodies differing only in bylines and footers are merged, while a different story is kept"""
+    copy = "(서울=뉴스1) 김기자 = " + BODY + " 무단전재 및 재배포 금지"
+    other = BODY[::-1]
+    assert hamming(body_fingerprint(BODY), body_fingerprint(copy)) <= 8
+    assert hamming(body_fingerprint(BODY), body_fingerprint(other)) > 8
+
+    clusters = [Cluster([0], body=body_fingerprint(BODY)), Cluster([1], body=body_fingerprint(other)), Cluster([2], body=body_fingerprint(copy))]
+
+    assert [c.members for c in merge_by_body(clusters)] == [[0, 2], [1]]
+
+
+def _context(fetched, failing=()):
+    async def asearch_news(**kwargs):
+        return {"items": [dict(item) for item in ITEMS]}
+
+    async def extract_items(items, on_result=None):
+        results = []
+        for position, item in enumerate(items):
+            fetched.append(item["originallink"])
+            error = "timeout" if item["originallink"] in failing else ""
+            body = BODY[::-1] if "hankyung" in item["originallink"] else BODY
+            result = {"title": "", "content": "" if error else body, "error": error}
+            await on_result(position, result)
+            results.append(result)
+        return results
+
+    config = NaverNewsConfig(client_id="test", client_secret="test")
+    lifespan_context = SimpleNamespace(
+        client=SimpleNamespace(config=config),
+        news=SimpleNamespace(asearch_news=asearch_news),
+        fetcher=SimpleNamespace(extract_items=extract_items),
+        article_archive=None,
+        prefetcher=None
+    )
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context=lifespan_context))
+
+
+def test_detail_extracts_one_article_per_cluster():
+    """Duplicates are neither fetched nor returned in full, and their links are listed on the representative"""
+    fetched = []
+
+    result = asyncio.run(search_news_detail(query="삼성전자 실적", fields=["link"], ctx=_context(fetched)))
+
+    assert fetched == ["https://www.yna.co.kr/article/1", "https://www.hankyung.com/article/2"]
+    items = json.loads(result.text)
+    assert len(items) == 2
+    assert items[0]["중복기사"] == ["https://www.mk.co.kr/article/3", "https://www.sedaily.com/article/4"]
+    assert "중복기사" not in items[1]
+
+
+def test_failed_representative_falls_back_to_a_copy():
+    """When the representative cannot be extracted the next copy in its cluster is fetched instead"""
+    fetched = []
+
+    result = asyncio.run(search_news_detail(
+        query="삼성전자 실적",
+        fields=["link", "content"],
+        ctx=_context(fetched, failing={"https://www.yna.co.kr/article/1"})
+    ))
+
+    assert fetched[-1] == "https://www.mk.co.kr/article/3"
+    first = json.loads(result.text)[0]
+    assert first["링크"] == "https://n.news.naver.com/mnews/article/001/3"
+    assert "https://www.yna.co.kr/article/1" in first["중복기사"]
@@ -0,0 +1,91 @@
+from mcp_naver_news.utils.extraction_engine import (
+    ExtractionEngine,
+    SelectorSet,
+    default_engine,
+    element_text,
+    parse_html,
+)
+from mcp_naver_news.utils.publisher_rules import PublisherRegistry, Rule, Selector
+
+BODY = "가" * 120
+
+
+def test_domain_rule_strips_noise_without_mutating_document():
+    """Naver pages use the domain selector and skip script/ad text"""
+    html = (
+        "<html><head><title> 제목 </title></head><body>"
+        f"<div id='newsct_article'>{BODY}<script>var x=1;</script><ins>광고</ins><!-- c --></div>"
+        "</body></html>"
+    )
+
+    result = default_engine.extract(html, "https://n.news.naver.com/article/1")
+
+    assert result == {"title": "제목", "content": BODY, "error": ""}
+
+def test_fallback_selectors_follow_priority_order():
+    """An earlier fallback selector wins even if a later one appears first in the document"""
+    html = f"<body><div id='textBody'>{'나' * 120}</div><div class='article-body'>{BODY}</div></body>"
+
+    result = default_engine.extract(html, "https://www.example.com/news/1")
+
+    assert result["content"] == BODY
+
+def test_empty_candidate_falls_through_to_next_selector():
+    """A selector whose element has no text does not stop the cascade"""
+    html = f"<body><div id='articleBody'><script>x</script></div><div id='content'>{BODY}</div></body>"
+
+    result = default_engine.extract(html, "https://www.example.com/news/1")
+
+    assert result["content"] == BODY
+
+def test_short_content_is_reported_as_missing():
+    """Content under the minimum length is treated as an extraction failure"""
+    result = default_engine.extract("<title>t</title><article>짧은 본문</article>", "https://a.com/1")
+
+    assert result == {"title": "t", "content": "", "error": "본문 내용을 찾을 수 없습니다."}
+
+def test_scan_finds_first_match_per_selector_in_one_pass():
+    """Each selector gets its first match in document order"""
+    selectors = [Selector(name="p"), Selector(class_="x"), Selector(id="missing")]
+    root = parse_html("<div class='a x'>1</div><p>2</p><p class='x'>3</p>")
+
+    found = SelectorSet(selectors).scan(root)
+
+    assert [f.text if f is not None else None for f in found] == ["2", "1", None]
+
+def test_element_text_matches_get_text_strip_semantics():
+    """Text pieces are stripped and joined, tails included, skipped subtrees dropped"""
+    root = parse_html("<div id='a'> 하나 <b> 둘 </b> 셋 <i>넷</i> 다섯 </div>")
+    div = root.find(".//div")
+
+    assert element_text(div) == "하나둘셋넷다섯"
+    assert element_text(div, ("i",)) == "하나둘셋다섯"
+
+def test_custom_engine_rules():
+    """Engines can be built from custom domain rules"""
+    engine = ExtractionEngine(
+        PublisherRegistry({"example.org": Rule((Selector(name="main"),))}),
+        Rule(()),
+        [],
+        min_length=1
+    )
+
+    assert engine.extract("<main>본문</main>", "https://www.example.org/a")["content"] == "본문"
+    assert engine.extract("<main>본문</main>", "https://other.org/a")["error"]
+
+def test_publisher_rule_falls_back_to_common_selectors():
+    """A registered publisher whose selector yields nothing still gets the fallback cascade"""
+    html = f"<title>t</title><div id='articletxt'></div><div id='news_content'>{BODY}</div>"
+
+    result = default_engine.extract(html, "https://www.hankyung.com/article/1")
+
+    assert result["content"] == BODY
+
+def test_scan_stops_once_leading_selectors_are_found():
+    """stop_after leaves later selectors unresolved when the leading ones are found"""
+    selector_set = SelectorSet([Selector(name="title"), Selector(id="a"), Selector(id="b")])
+    root = parse_html("<title>t</title><div id='a'>1</div><div id='b'>2</div>")
+
+    found = selector_set.scan(root, stop_after=2)
+
+    assert found[1] is not None and found[2] is None
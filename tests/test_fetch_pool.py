@@ -0,0 +1,195 @@
+import asyncio
+import time
+from mcp_naver_news.utils.fetch_pool import ArticleFetchPool
+from mcp_naver_news.utils.link_resolver import HostStats, LinkResolver
+
+
+def _slow_extractor(delays, active, peak):
+    """URL별 지연 시간만큼 대기하는 가짜 비동기 추출기"""
+    async def extract(url):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        try:
+            await asyncio.sleep(delays.get(url, 0.05))
+            return {'title': url, 'content': f'본문 {url}', 'error': ''}
+        finally:
+            active[0] -= 1
+    return extract
+
+def test_extract_all_keeps_order_and_runs_in_parallel():
+    """Results follow input order and total time tracks the slowest page"""
+    urls = [f"https://host{i}.example.com/a" for i in range(8)]
+    delays = {url: 0.2 if i == 0 else 0.05 for i, url in enumerate(urls)}
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(max_concurrency=8, extractor=_slow_extractor(delays, active, peak))
+
+    started = time.perf_counter()
+    results = asyncio.run(pool.extract_all(urls))
+    elapsed = time.perf_counter() - started
+
+    assert [r['title'] for r in results] == urls
+    assert elapsed < 0.6
+    assert peak[0] == 8
+
+def test_extract_all_respects_per_host_limit():
+    """Only per_host_limit fetches run against one host at a time"""
+    urls = [f"https://same.example.com/{i}" for i in range(6)]
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(max_concurrency=6, per_host_limit=2, extractor=_slow_extractor({}, active, peak))
+
+    asyncio.run(pool.extract_all(urls))
+
+    assert peak[0] == 2
+
+def test_global_limit_is_shared_across_calls():
+    """Concurrent extract_all calls share one global concurrency budget"""
+    urls = [f"https://host{i}.example.com/a" for i in range(4)]
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(max_concurrency=3, extractor=_slow_extractor({}, active, peak))
+
+    async def run_both():
+        await asyncio.gather(pool.extract_all(urls), pool.extract_all(urls))
+
+    asyncio.run(run_both())
+
+    assert peak[0] == 3
+
+def test_extract_all_item_timeout():
+    """A page slower than item_timeout yields an error entry instead of blocking"""
+    urls = ["https://slow.example.com/a", "https://fast.example.com/b"]
+    delays = {urls[0]: 1.0, urls[1]: 0.01}
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(item_timeout=0.2, extractor=_slow_extractor(delays, active, peak))
+
+    results = asyncio.run(pool.extract_all(urls))
+
+    assert '시간 초과' in results[0]['error']
+    assert results[1]['error'] == ''
+
+def test_identical_urls_are_fetched_once():
+    """Concurrent requests for the same article share one download"""
+    calls = []
+
+    async def extract(url):
+        calls.append(url)
+        await asyncio.sleep(0.05)
+        return {'title': url, 'content': '본문', 'error': ''}
+
+    pool = ArticleFetchPool(extractor=extract)
+    url = "https://news.example.com/1"
+
+    async def run():
+        return await asyncio.gather(pool.extract_all([url, url]), pool.extract(url + "#top"))
+
+    first, second = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert first[0] == first[1] == second
+
+def _warm(stats, url, seconds, count=10):
+    for _ in range(count):
+        stats.record(url, True, fetch_seconds=seconds)
+
+def test_slow_candidate_is_hedged_with_the_alternative_link():
+    """When the first link is slower than its host's usual latency the other link is tried and the loser cancelled"""
+    naver = "https://n.news.naver.com/mnews/article/001/0000000001"
+    publisher = "https://www.example.com/article/1"
+    cancelled = []
+
+    async def extract(url):
+        try:
+            await asyncio.sleep(1.0 if url == naver else 0.05)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return {'title': url, 'content': '본문', 'error': ''}
+
+    pool = ArticleFetchPool(extractor=extract)
+    _warm(pool.resolver.stats, naver, 0.05)
+    _warm(pool.resolver.stats, publisher, 0.06)
+
+    started = time.perf_counter()
+    result = asyncio.run(pool.extract_item({"link": naver, "originallink": publisher}))
+
+    assert result['title'] == publisher
+    assert time.perf_counter() - started < 0.5
+    assert cancelled == [naver]
+
+def test_deadline_adapts_and_open_hosts_fail_fast():
+    """A host's deadline shrinks to its observed latency, and after repeated timeouts it is skipped without waiting"""
+    calls = []
+
+    async def extract(url):
+        calls.append(url)
+        await asyncio.sleep(1.0 if "slow" in url else 0.01)
+        return {'title': url, 'content': '본문', 'error': ''}
+
+    resolver = LinkResolver(stats=HostStats(failure_threshold=2, min_timeout=0.05))
+    pool = ArticleFetchPool(item_timeout=5.0, extractor=extract, resolver=resolver, hedge=False)
+    _warm(pool.resolver.stats, "https://slow.example.com/0", 0.02)
+    item = {"link": "https://slow.example.com/1", "originallink": "https://fast.example.com/1"}
+
+    started = time.perf_counter()
+    results = asyncio.run(pool.extract_all(["https://slow.example.com/1", "https://slow.example.com/2"]))
+    assert time.perf_counter() - started < 0.5
+    assert all('시간 초과' in result['error'] for result in results)
+
+    calls.clear()
+    result = asyncio.run(pool.extract_item(item))
+    assert result['title'] == "https://fast.example.com/1"
+    assert calls == ["https://fast.example.com/1"]
+
+def test_slot_wait_has_its_own_deadline():
+    """Queued fetches keep their full request timeout, and give up at queue_timeout without counting against the host or leaking slots"""
+    urls = [f"https://same.example.com/{i}" for i in range(6)]
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(
+        per_host_limit=1, item_timeout=0.15, queue_timeout=0.25, extractor=_slow_extractor(dict.fromkeys(urls, 0.1), active, peak)
+    )
+
+    async def run():
+        results = await pool.extract_all(urls)
+        return results, pool._host_limits["same.example.com"]._value
+
+    started = time.perf_counter()
+    results, free_slots = asyncio.run(run())
+
+    assert time.perf_counter() - started < 0.45
+    # 세 번째 기사는 item_timeout보다 오래 기다렸지만 요청 시간은 그대로 받음
+    assert [result['error'] for result in results[:3]] == ['', '', '']
+    assert all('대기 시간 초과' in result['error'] for result in results[3:])
+    assert free_slots == 1
+    assert pool.resolver.stats.snapshot() == {}
+
+def test_naver_mirror_host_has_its_own_limit():
+    """Naver links all share n.news.naver.com, which gets naver_host_limit instead of per_host_limit"""
+    urls = [f"https://n.news.naver.com/mnews/article/001/{i:010d}" for i in range(6)]
+    active, peak = [0], [0]
+    pool = ArticleFetchPool(per_host_limit=2, naver_host_limit=6, extractor=_slow_extractor({}, active, peak))
+
+    asyncio.run(pool.extract_all(urls))
+
+    assert peak[0] == 6
+
+def test_prefetches_wait_behind_interactive_fetches():
+    """Speculative extracts queued first still get a free slot only after interactive extracts waiting for it"""
+    order = []
+
+    async def extract(url):
+        order.append(url)
+        await asyncio.sleep(0.02)
+        return {'title': url, 'content': '본문', 'error': ''}
+
+    pool = ArticleFetchPool(max_concurrency=1, extractor=extract, hedge=False)
+
+    async def run():
+        first = asyncio.ensure_future(pool.extract("https://a.example.com/0"))
+        await asyncio.sleep(0.005)
+        prefetches = [asyncio.ensure_future(pool.extract_item({"link": f"https://b.example.com/{i}"}, speculative=True)) for i in range(2)]
+        await asyncio.sleep(0.005)
+        interactive = asyncio.ensure_future(pool.extract("https://c.example.com/1"))
+        await asyncio.gather(first, interactive, *prefetches)
+
+    asyncio.run(run())
+
+    assert order[:2] == ["https://a.example.com/0", "https://c.example.com/1"]
@@ -0,0 +1,172 @@
+import asyncio
+import httpx
+import pytest
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.apis.client import NaverNewsClient, AsyncNaverNewsClient
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+from mcp_naver_news.utils.http import (
+    article_connection_limit,
+    build_api_session,
+    build_article_session,
+    build_async_client,
+    build_session,
+)
+from mcp_naver_news.utils.link_resolver import HostStats
+from mcp_naver_news.utils.rate_limiter import QuotaExceededError, QuotaTracker, RateLimiter
+
+
+class _FakeResponse:
+    status_code = 200
+    headers = {"Content-Type": "application/json"}
+    text = '{"items": []}'
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"items": []}
+
+class _RecordingSession:
+    """get 호출을 기록하는 가짜 세션"""
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return _FakeResponse()
+
+    def post(self, url, **kwargs):
+        self.calls.append(url)
+        return _FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+def test_build_session_pool_and_retry():
+    """Sessions mount a pooled adapter with the requested retry policy"""
+    session = build_session(pool_connections=5, pool_maxsize=7, max_retries=3, headers={"X-Test": "1"})
+    adapter = session.get_adapter("https://openapi.naver.com")
+
+    assert adapter._pool_connections == 5
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert session.headers["X-Test"] == "1"
+
+def test_article_session_covers_per_host_concurrency():
+    """Article pools are never smaller than the per-host fetch limit"""
+    config = NaverNewsConfig(client_id="id", client_secret="secret", http_pool_maxsize=2, fetch_per_host=6, fetch_per_host_naver=3)
+    adapter = build_article_session(config).get_adapter("https://www.yna.co.kr")
+
+    assert adapter._pool_maxsize == 6
+
+def test_api_session_leaves_429_to_the_rate_limiter():
+    """urllib3 does not retry 429 for the API, since its retries would bypass the rate limiter and daily quota"""
+    adapter = build_api_session(NaverNewsConfig(client_id="id", client_secret="secret")).get_adapter("https://openapi.naver.com")
+
+    assert 429 not in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+
+def test_article_client_pool_covers_fetches_prefetches_and_hedges():
+    """The article client has room for every fetch slot, prefetch and hedge, and keep-alive never exceeds the cap"""
+    config = NaverNewsConfig(client_id="id", client_secret="secret", fetch_concurrency=10, prefetch_concurrency=2)
+    client = build_async_client(config, max_connections=article_connection_limit(config))
+    pool = client._transport._pool
+
+    assert article_connection_limit(config) == 17
+    assert pool._max_connections == 17
+    assert pool._max_keepalive_connections == 17
+    assert build_async_client(config)._transport._pool._max_keepalive_connections == 10
+
+def test_pool_timeouts_are_not_blamed_on_the_host():
+    """A request that never left the local connection pool is not recorded in the host statistics"""
+    def handler(request):
+        raise httpx.PoolTimeout("pool full")
+
+    stats = HostStats()
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await aextract_article_content("https://news.example.com/1", client=client, stats=stats)
+
+    assert asyncio.run(run())["error"]
+    assert stats.snapshot() == {}
+
+def test_client_reuses_session():
+    """NaverNewsClient sends every request through one long-lived session"""
+    session = _RecordingSession()
+    client = NaverNewsClient(config=NaverNewsConfig(client_id="id", client_secret="secret"), session=session)
+
+    client.get("news.json", {"query": "a"})
+    client.get("news.json", {"query": "b"})
+    client.close()
+
+    assert len(session.calls) == 2
+    assert session.closed
+
+def test_async_client_retries_rate_limited_requests():
+    """AsyncNaverNewsClient retries 429 responses before returning the payload"""
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"items": [1]})]
+    transport = httpx.MockTransport(lambda request: responses.pop(0))
+    config = NaverNewsConfig(client_id="id", client_secret="secret")
+
+    async def run():
+        client = AsyncNaverNewsClient(config=config, client=httpx.AsyncClient(transport=transport))
+        try:
+            return await client.get("news.json", {"query": "a"})
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == {"items": [1]}
+    assert responses == []
+
+def test_async_client_uses_configured_base_url():
+    """NAVER_NEWS_BASE_URL (config.base_url) redirects API requests, e.g. to a local stand-in server"""
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"items": []})
+
+    config = NaverNewsConfig(client_id="id", client_secret="secret", base_url="http://127.0.0.1:8080/v1/search/news.json")
+
+    async def run():
+        client = AsyncNaverNewsClient(config=config, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            return await client.get("news.json", {"query": "a"})
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+    assert requested == ["http://127.0.0.1:8080/v1/search/news.json?query=a"]
+
+def test_aextract_article_content_uses_shared_client():
+    """The async extractor fetches through the given client and parses the body"""
+    body = "본문 " * 60
+    html = f"<html><head><title>제목</title></head><body><article>{body}</article></body></html>"
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=html))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await aextract_article_content("https://news.example.com/1", client=client)
+
+    result = asyncio.run(run())
+
+    assert result['error'] == ''
+    assert result['title'] == '제목'
+    assert result['content'].startswith('본문')
+
+def test_post_requests_are_rate_limited_and_counted():
+    """post() goes through the shared rate limiter and daily quota like get()"""
+    session = _RecordingSession()
+    limiter = RateLimiter(rate_per_second=100, burst=5, quota=QuotaTracker(daily_limit=2))
+    client = NaverNewsClient(NaverNewsConfig(client_id="id", client_secret="secret"), session=session, rate_limiter=limiter)
+
+    client.get("news.json")
+    client.post("news.json")
+
+    assert limiter.quota.used == 2
+    with pytest.raises(QuotaExceededError):
+        client.post("news.json")
+    assert len(session.calls) == 2
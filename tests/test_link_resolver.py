@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+
+from mcp_naver_news.utils.fetch_pool import ArticleFetchPool
+from mcp_naver_news.utils.link_resolver import HostStats, LinkResolver, naver_article_url
+from mcp_naver_news.utils.publisher_rules import load_publisher_registry
+
+NAVER = "https://n.news.naver.com/mnews/article/001/0014300000"
+
+
+def test_naver_urls_are_normalized_to_mobile_article_page():
+    """The different Naver article URL forms map to one lightweight mobile URL"""
+    assert naver_article_url("https://n.news.naver.com/article/001/0014300000?sid=101") == NAVER
+    assert naver_article_url("https://news.naver.com/main/read.naver?mode=LSD&oid=001&aid=0014300000") == NAVER
+    assert naver_article_url("https://m.news.naver.com/read.nhn?oid=001&aid=0014300000") == NAVER
+    assert naver_article_url("https://www.yna.co.kr/view/AKR1") is None
+
+def test_candidates_prefer_naver_then_publisher_variants():
+    """Naver-hosted links come first, publisher links are rewritten to their lightweight host"""
+    resolver = LinkResolver(load_publisher_registry())
+    item = {
+        "link": "https://n.news.naver.com/article/001/0014300000",
+        "originallink": "https://www.yna.co.kr/view/AKR1"
+    }
+
+    assert resolver.candidates(item) == [NAVER, "https://m.yna.co.kr/view/AKR1", "https://www.yna.co.kr/view/AKR1"]
+
+def test_candidates_without_naver_link_are_deduplicated():
+    """When link and originallink are the same publisher URL it is tried once"""
+    resolver = LinkResolver(load_publisher_registry())
+    url = "https://www.hankyung.com/article/1"
+
+    assert resolver.candidates({"link": url, "originallink": url}) == [url]
+
+def test_host_stats_reorder_candidates():
+    """A host that keeps failing is tried after a host that succeeds quickly"""
+    stats = HostStats()
+    resolver = LinkResolver(stats=stats)
+    item = {"link": NAVER, "originallink": "https://www.hankyung.com/article/1"}
+    for _ in range(3):
+        stats.record(NAVER, False, fetch_seconds=2.0)
+        stats.record("https://www.hankyung.com/article/2", True, bytes_read=1000, fetch_seconds=0.2)
+
+    assert resolver.candidates(item)[0] == "https://www.hankyung.com/article/1"
+    assert stats.snapshot()["n.news.naver.com"]["failures"] == 3
+
+def test_extract_item_falls_back_to_next_candidate():
+    """A failed candidate does not fail the item while another source is available"""
+    calls = []
+
+    async def extractor(url):
+        calls.append(url)
+        if "naver" in url:
+            return {"title": "", "content": "", "error": "본문 내용을 찾을 수 없습니다."}
+        return {"title": "t", "content": "본문", "error": ""}
+
+    pool = ArticleFetchPool(extractor=extractor)
+    item = {"link": NAVER, "originallink": "https://www.hankyung.com/article/1"}
+
+    result = asyncio.run(pool.extract_item(item))
+
+    assert result["content"] == "본문"
+    assert calls == [NAVER, "https://www.hankyung.com/article/1"]
+
+def test_timeouts_follow_each_hosts_latency():
+    """Hosts with enough samples get a deadline of a p99 multiple, bounded by the default and the minimum"""
+    stats = HostStats(timeout_multiple=3.0, min_timeout=2.0)
+    for _ in range(10):
+        stats.record("https://fast.example.com/a", True, fetch_seconds=0.2)
+        stats.record("https://slow.example.com/a", True, fetch_seconds=3.0)
+    stats.record("https://new.example.com/a", True, fetch_seconds=0.1)
+
+    assert stats.timeout("https://fast.example.com/b", 15.0) == 2.0
+    assert stats.timeout("https://slow.example.com/b", 15.0) == 9.0
+    assert stats.timeout("https://slow.example.com/b", 5.0) == 5.0
+    assert stats.timeout("https://new.example.com/b", 15.0) == 15.0
+    assert stats.hedge_delay("https://fast.example.com/b") == 0.2
+
+def test_timeouts_grow_when_a_host_slows_down_and_shrink_after_it_recovers():
+    """Timed-out fetches count as latency samples so a slower but healthy host is not cut off by its old deadline"""
+    stats = HostStats(failure_threshold=5, timeout_multiple=3.0, min_timeout=2.0)
+    url = "https://slowing.example.com/a"
+    for _ in range(50):
+        stats.record(url, True, fetch_seconds=0.4)
+    assert stats.timeout(url, 15.0) == 2.0
+
+    outcomes = []
+    for _ in range(10):
+        deadline = stats.timeout(url, 15.0)
+        if deadline < 5.0:
+            stats.record(url, False, fetch_seconds=deadline, reachable=False, timed_out=True)
+        else:
+            stats.record(url, True, fetch_seconds=5.0)
+        outcomes.append(deadline >= 5.0)
+
+    assert outcomes[0] is False and all(outcomes[1:])
+    assert stats.allow(url)
+    assert stats.timeout(url, 15.0) == 15.0
+
+    for _ in range(50):
+        stats.record(url, True, fetch_seconds=0.4)
+    assert stats.timeout(url, 15.0) == 2.0
+
+def test_circuit_breaker_opens_backs_off_and_closes():
+    """Consecutive unreachable fetches block a host for a cooldown that doubles on repeated failure and resets on success"""
+    now = [0.0]
+    stats = HostStats(failure_threshold=3, cooldown=30.0, clock=lambda: now[0])
+    url = "https://dead.example.com/a"
+    for _ in range(5):
+        stats.record(url, False, reachable=True)
+    assert stats.allow(url)
+
+    for _ in range(3):
+        stats.record(url, False, reachable=False)
+    assert not stats.allow(url)
+    assert LinkResolver(stats=stats).candidates({"link": url, "originallink": "https://ok.example.com/a"})[0] == "https://ok.example.com/a"
+
+    now[0] = 31.0
+    assert stats.allow(url)
+    stats.record(url, False, reachable=False)
+    assert stats.snapshot()["dead.example.com"]["cooldown"] == 60.0
+    assert not stats.allow(url)
+
+    now[0] = 100.0
+    stats.record(url, True)
+    stats.record(url, False, reachable=False)
+    assert stats.allow(url)
+
+def test_server_errors_count_against_the_host_but_missing_pages_do_not():
+    """5xx and 429 responses are treated as unreachable, 404 as a host that answered"""
+    from mcp_naver_news.utils.article_extractor import aextract_article_content
+
+    status = {"down.example.com": 503, "up.example.com": 404}
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(status[request.url.host])))
+    stats = HostStats(failure_threshold=2)
+
+    async def run():
+        for _ in range(2):
+            for host in status:
+                result = await aextract_article_content(f"https://{host}/a", client=client, stats=stats)
+                assert result["error"]
+        return await aextract_article_content("https://down.example.com/b", client=client, stats=stats)
+
+    result = asyncio.run(run())
+
+    assert "잠시 요청하지 않습니다" in result["error"]
+    assert stats.allow("https://up.example.com/b")
+    assert stats.snapshot()["down.example.com"]["fetches"] == 2
@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+from mcp_naver_news.utils.metrics import (
+    API_SECONDS,
+    FETCH_SECONDS,
+    METRICS_NAMESPACE,
+    PARSE_SECONDS,
+    TOOL_SECONDS,
+    FetchTrace,
+    MetricsRegistry,
+    collect,
+    current_tool,
+    metrics,
+    metrics_route,
+    render_prometheus,
+    summarize,
+    timed_tool,
+)
+from mcp_naver_news.utils.state_store import SqliteStateStore
+
+
+def _series(snapshot, name, **labels):
+    return next(entry for entry in snapshot[name] if entry["labels"] == labels)
+
+
+def test_prometheus_rendering_uses_cumulative_buckets():
+    """Histogram buckets are rendered cumulatively with +Inf, sum and count"""
+    registry = MetricsRegistry()
+    for seconds in (0.004, 0.2, 0.2, 60):
+        registry.observe(TOOL_SECONDS, seconds, tool="search_news", status="ok")
+
+    text = render_prometheus(registry.snapshot())
+
+    assert "# TYPE mcp_naver_news_tool_seconds histogram" in text
+    assert 'mcp_naver_news_tool_seconds_bucket{status="ok",tool="search_news",le="0.005"} 1' in text
+    assert 'mcp_naver_news_tool_seconds_bucket{status="ok",tool="search_news",le="0.25"} 3' in text
+    assert 'mcp_naver_news_tool_seconds_bucket{status="ok",tool="search_news",le="+Inf"} 4' in text
+    assert 'mcp_naver_news_tool_seconds_count{status="ok",tool="search_news"} 4' in text
+    row = summarize(registry.snapshot())[TOOL_SECONDS][0]
+    assert row["count"] == 4 and 100 < row["p50_ms"] <= 250
+
+
+def test_fetch_trace_splits_download_phases():
+    """Connect, TLS and time-to-first-byte come from httpcore events and the rest counts as body"""
+    registry = MetricsRegistry()
+    trace = FetchTrace()
+    for event, now in [
+        ("connection.connect_tcp.started", 0.0),
+        ("connection.connect_tcp.complete", 0.1),
+        ("connection.start_tls.started", 0.1),
+        ("connection.start_tls.complete", 0.3),
+        ("http11.send_request_headers.started", 0.3),
+        ("http11.send_request_headers.complete", 0.31),
+        ("http11.receive_response_headers.started", 0.31),
+        ("http11.receive_response_headers.complete", 0.8),
+    ]:
+        trace.event(event, now)
+
+    trace.record("https://WWW.Example.com/a", 1.0, registry)
+
+    snapshot = registry.snapshot()
+    assert _series(snapshot, FETCH_SECONDS, domain="www.example.com", phase="connect")["sum"] == pytest.approx(0.1)
+    assert _series(snapshot, FETCH_SECONDS, domain="www.example.com", phase="tls")["sum"] == pytest.approx(0.2)
+    assert _series(snapshot, FETCH_SECONDS, domain="www.example.com", phase="ttfb")["sum"] == pytest.approx(0.5)
+    assert _series(snapshot, FETCH_SECONDS, domain="www.example.com", phase="body")["sum"] == pytest.approx(0.2)
+
+
+def test_timed_tool_labels_nested_spans_and_errors():
+    """Spans inside a tool carry its name, and failed calls are recorded with status=error"""
+    metrics.reset()
+
+    @timed_tool
+    async def search_news():
+        with metrics.span(API_SECONDS, tool=current_tool()):
+            pass
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(search_news())
+
+    snapshot = metrics.snapshot()
+    assert _series(snapshot, API_SECONDS, tool="search_news")["count"] == 1
+    assert _series(snapshot, TOOL_SECONDS, tool="search_news", status="error")["count"] == 1
+    assert current_tool() == "none"
+
+
+def test_metrics_endpoint_sums_all_workers(tmp_path):
+    """/metrics adds the snapshots other workers published to the shared store"""
+    metrics.reset()
+    metrics.observe(TOOL_SECONDS, 0.2, tool="search_news", status="ok")
+    store = SqliteStateStore(str(tmp_path / "state.sqlite3"))
+    store.set(METRICS_NAMESPACE, "other-host:1", metrics.snapshot())
+    app = Starlette(routes=[metrics_route(store)])
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get("/metrics")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'mcp_naver_news_tool_seconds_count{status="ok",tool="search_news"} 2' in response.text
+    assert _series(collect(), TOOL_SECONDS, tool="search_news", status="ok")["count"] == 1
+
+
+def test_article_extraction_records_domain_latency():
+    """Fetching an article records total download and parse time under the publisher domain"""
+    metrics.reset()
+    page = "<html><head><title>제목</title></head><body><div id='articletxt'>" + "본문 " * 60 + "</div></body></html>"
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=page.encode()))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await aextract_article_content("https://www.hankyung.com/article/1", client=client)
+
+    assert not asyncio.run(run())["error"]
+    snapshot = metrics.snapshot()
+    assert _series(snapshot, FETCH_SECONDS, domain="www.hankyung.com", phase="total")["count"] == 1
+    assert _series(snapshot, PARSE_SECONDS, domain="www.hankyung.com")["count"] == 1
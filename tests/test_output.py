@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from mcp_naver_news.utils.output import (
+    DETAIL_FIELDS,
+    NewsItem,
+    OutputOptions,
+    dumps,
+    query_snippets,
+    render,
+)
+
+API_ITEM = {
+    "title": "제목",
+    "link": "https://n.news.naver.com/mnews/article/001/1",
+    "originallink": "https://www.hankyung.com/article/1",
+    "description": "요약",
+    "pubDate": "Mon, 13 Oct 2025 09:00:00 +0900",
+}
+
+
+def test_default_output_matches_previous_format():
+    """Without options the response keeps the Korean keys and the indented layout"""
+    rendered = render(NewsItem.from_api(API_ITEM), OutputOptions.build())
+
+    assert list(rendered) == ["제목", "링크", "원본링크", "요약", "발행일"]
+    assert json.loads(dumps([rendered])) == [rendered]
+    assert dumps([rendered]).startswith("[\n  {\n")
+
+
+def test_fields_and_compact_shrink_the_response():
+    """Selected fields only, serialized without whitespace"""
+    options = OutputOptions.build(["title", "link"], compact=True)
+
+    text = dumps([render(NewsItem.from_api(API_ITEM), options)], compact=options.compact)
+
+    assert text == '[{"제목":"제목","링크":"https://n.news.naver.com/mnews/article/001/1"}]'
+
+
+def test_unknown_field_is_rejected():
+    """Typos in field names fail loudly instead of returning empty items"""
+    with pytest.raises(ValueError):
+        OutputOptions.build(["title", "body"])
+
+
+def test_body_is_cut_to_snippets_around_query_terms():
+    """Windows around each term are merged, and the body is truncated when no term occurs"""
+    body = "가" * 100 + "반도체 수출" + "나" * 100 + "반도체" + "다" * 100
+
+    snippets = query_snippets(body, ["반도체"], 5)
+
+    assert snippets == "… 가가가가가반도체 수출나나 … 나나나나나반도체다다다다다 …"
+    options = OutputOptions.build(default_fields=DETAIL_FIELDS, max_chars=10, snippet_chars=5, query="+메모리 -반도체")
+    assert options.terms == ("메모리",)
+    item = NewsItem.from_api({**API_ITEM, "content": "라" * 50})
+    assert render(item, options)["본문"] == "라" * 10 + "…"
+
+
+def test_excluded_terms_are_not_snippet_anchors():
+    """Snippets never centre on a -term the user excluded, while phrases and OR terms still count"""
+    options = OutputOptions.build(snippet_chars=5, query='삼성전자 -광고 -"보도 자료" "반도체 수출" 메모리|낸드 가')
+
+    assert options.terms == ("삼성전자", "반도체 수출", "메모리", "낸드")
+
+
+def test_news_item_has_no_instance_dict():
+    """The item model uses slots rather than a per-instance dict"""
+    item = NewsItem.from_api(API_ITEM)
+
+    assert not hasattr(item, "__dict__")
+    assert render(item, OutputOptions.build(default_fields=DETAIL_FIELDS))["본문"] == "본문 없음"
@@ -0,0 +1,50 @@
+import asyncio
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.apis.news import NewsAPI
+
+
+class _PagedClient:
+    """start/display에 맞는 페이지를 돌려주는 가짜 비동기 클라이언트"""
+    def __init__(self, total, duplicates=()):
+        self.total = total
+        self.duplicates = set(duplicates)
+        self.requests = []
+
+    async def get(self, endpoint, params=None, priority=0):
+        self.requests.append((params["start"], params["display"], priority))
+        await asyncio.sleep(0.01)
+        start, display = params["start"], params["display"]
+        items = []
+        for rank in range(start, min(start + display, self.total + 1)):
+            # 중복 지정된 순위는 1번 기사와 같은 링크를 반환
+            link = "https://n.news.naver.com/1" if rank in self.duplicates else f"https://n.news.naver.com/{rank}"
+            items.append({"title": str(rank), "link": link})
+        return {"total": self.total, "start": start, "display": display, "items": items}
+
+def _collect(news_api, **kwargs):
+    async def run():
+        return [page async for page in news_api.aiter_news_pages("q", **kwargs)]
+    return asyncio.run(run())
+
+def test_pages_fan_out_and_cover_window():
+    """All offsets up to max_results are requested once, as bulk traffic"""
+    client = _PagedClient(total=5000)
+    news_api = NewsAPI(None, async_client=client)
+
+    pages = _collect(news_api, max_results=1000)
+
+    assert sorted(start for start, _, _ in client.requests) == list(range(1, 1000, 100))
+    assert all(priority > 0 for _, _, priority in client.requests)
+    assert sum(len(items) for _, items in pages) == 1000
+
+def test_pages_stop_at_total_and_dedupe_links():
+    """Collection stops at the result total and repeated links are dropped"""
+    client = _PagedClient(total=250, duplicates={150})
+    news_api = NewsAPI(None, async_client=client)
+
+    pages = _collect(news_api, max_results=1000)
+    links = [item["link"] for _, items in sorted(pages, key=lambda p: p[0]) for item in items]
+
+    assert client.requests[-1][1] <= 100
+    assert max(start for start, _, _ in client.requests) == 201
+    assert len(links) == len(set(links)) == 249
@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+from mcp_naver_news.utils.parse_pool import ParsePool, build_parse_pool
+
+BODY = "본문 " * 60
+HTML = f"<html><head><title>제목</title></head><body><div id='articletxt'>{BODY}</div></body></html>"
+URL = "https://www.hankyung.com/article/1"
+
+
+def _config(**overrides):
+    return NaverNewsConfig(client_id="x", client_secret="y", **overrides)
+
+def test_parse_pool_disabled_by_default():
+    """No pool is created unless NAVER_NEWS_PARSE_WORKERS is set"""
+    assert build_parse_pool(_config()) is None
+
+def test_process_pool_parses_in_worker():
+    """Process workers build their own engine and return the same result as in-process parsing"""
+    pool = ParsePool(_config(), workers=1, mode="process")
+    try:
+        result, seconds = asyncio.run(pool.parse(HTML.encode("cp949"), URL, "euc-kr"))
+    finally:
+        pool.close()
+
+    assert result == {"title": "제목", "content": BODY.strip(), "error": ""}
+    assert seconds > 0
+
+def test_extractor_ships_downloaded_page_to_pool():
+    """With a pool, the extractor only downloads and the pool parses"""
+    pool = ParsePool(_config(), workers=2, mode="thread")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=HTML.encode()))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await aextract_article_content(URL, client=client, parse_pool=pool)
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        pool.close()
+
+    assert result["content"] == BODY.strip()
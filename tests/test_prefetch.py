@@ -0,0 +1,139 @@
+import asyncio
+
+from mcp_naver_news.utils.article_cache import ArticleCache
+from mcp_naver_news.utils.fetch_pool import ArticleFetchPool
+from mcp_naver_news.utils.link_resolver import PRIOR_BYTES
+from mcp_naver_news.utils.prefetch import ArticlePrefetcher
+
+TOPICS = ["반도체 수출 급증", "기준금리 동결 결정", "배터리 공장 증설", "부동산 거래량 감소", "원달러 환율 급등", "조선 수주 호조"]
+
+
+def _item(number, title):
+    return {
+        "title": title,
+        "link": f"https://n.news.naver.com/mnews/article/001/{number:010d}",
+        "originallink": f"https://www.example.com/article/{number}",
+        "description": f"{title} 관련 기사",
+    }
+
+
+ITEMS = [_item(number, title) for number, title in enumerate(TOPICS, start=1)]
+
+
+class FakeSite:
+    """Serves articles through the article cache like the real extractor, recording actual downloads"""
+
+    def __init__(self, cache, delay=0.01):
+        self.cache = cache
+        self.delay = delay
+        self.downloads = []
+        self.cancelled = []
+        self.release = None
+
+    async def extract(self, url):
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry.to_result()
+        self.downloads.append(url)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.release is not None:
+                await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        self.cache.put(url, "제목", "본문")
+        return {"title": "제목", "content": "본문", "error": ""}
+
+
+def _setup(tmp_path, **kwargs):
+    cache = ArticleCache(str(tmp_path / "articles.sqlite3"))
+    site = FakeSite(cache)
+    pool = ArticleFetchPool(extractor=site.extract)
+    return site, pool, ArticlePrefetcher(pool, cache, **kwargs)
+
+
+async def _drain(prefetcher):
+    while prefetcher._jobs:
+        await asyncio.sleep(0.005)
+
+
+def test_top_results_are_prefetched_so_detail_is_served_from_cache(tmp_path):
+    """Only the top-K distinct stories are fetched in the background, and the follow-up extraction downloads nothing"""
+    site, pool, prefetcher = _setup(tmp_path, top_k=3)
+    items = [ITEMS[0], {**ITEMS[0], "link": "https://n.news.naver.com/mnews/article/002/0000000009", "originallink": "https://copy.example.com/1"}, *ITEMS[1:]]
+
+    async def run():
+        assert prefetcher.schedule(items) == 3
+        await _drain(prefetcher)
+        downloaded = list(site.downloads)
+        prefetcher.claim(items[:4])
+        results = await pool.extract_items(items[:4])
+        return downloaded, results
+
+    downloaded, results = asyncio.run(run())
+
+    assert downloaded == [f"https://n.news.naver.com/mnews/article/001/{n:010d}" for n in (1, 2, 3)]
+    assert site.downloads == downloaded + ["https://n.news.naver.com/mnews/article/002/0000000009"]
+    assert all(result["content"] == "본문" for result in results)
+
+    async def again():
+        prefetcher.schedule(items)
+        await _drain(prefetcher)
+
+    asyncio.run(again())
+    assert prefetcher.skipped == 3
+    assert len(site.downloads) == 4
+
+
+def test_byte_budget_limits_each_search(tmp_path):
+    """Articles beyond the estimated byte budget of a search are not prefetched"""
+    site, _, prefetcher = _setup(tmp_path, top_k=5, concurrency=1, max_bytes=2 * PRIOR_BYTES)
+
+    async def run():
+        prefetcher.schedule(ITEMS)
+        await _drain(prefetcher)
+
+    asyncio.run(run())
+
+    assert len(site.downloads) == 2
+    assert prefetcher.skipped == 3
+
+
+def test_detail_takes_over_queued_and_joins_running_prefetches(tmp_path):
+    """A detail call cancels prefetches that have not started and shares the download that is already running"""
+    site, pool, prefetcher = _setup(tmp_path, top_k=4, concurrency=1)
+
+    async def run():
+        site.release = asyncio.Event()
+        prefetcher.schedule(ITEMS)
+        await asyncio.sleep(0.05)
+        prefetcher.claim(ITEMS[:4])
+        detail = asyncio.ensure_future(pool.extract_items(ITEMS[:4]))
+        await asyncio.sleep(0.05)
+        site.release.set()
+        return await detail
+
+    results = asyncio.run(run())
+
+    assert prefetcher.cancelled == 3
+    assert len(site.downloads) == len(set(site.downloads)) == 4
+    assert all(result["content"] == "본문" for result in results)
+
+
+def test_stale_searches_are_cancelled_including_running_downloads(tmp_path):
+    """Once newer searches pile up, the oldest search's prefetches are cancelled along with their in-flight download"""
+    site, _, prefetcher = _setup(tmp_path, top_k=1, concurrency=3)
+
+    async def run():
+        site.release = asyncio.Event()
+        for item in ITEMS[:3]:
+            prefetcher.schedule([item])
+            await asyncio.sleep(0.03)
+        site.release.set()
+        await _drain(prefetcher)
+
+    asyncio.run(run())
+
+    assert site.cancelled == [site.downloads[0]]
+    assert prefetcher.fetched == 2
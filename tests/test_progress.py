@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+from mcp_naver_news.utils.ctx_helper import ProgressReporter
+
+
+class _FakeSession:
+    def __init__(self):
+        self.messages = []
+
+    async def send_log_message(self, level, data, logger=None):
+        self.messages.append(data)
+
+class _FakeContext:
+    """report_progress와 로그 전송을 기록하는 가짜 FastMCP Context"""
+    def __init__(self):
+        self.progress = []
+        self.request_context = SimpleNamespace(session=_FakeSession())
+
+    async def report_progress(self, progress, total=None):
+        self.progress.append((progress, total))
+
+def test_reporter_is_noop_outside_requests():
+    """Direct calls (no MCP request) never fail on progress reporting"""
+    reporter = ProgressReporter("search_news_detail", total=2, stream=True)
+
+    asyncio.run(reporter.advance({'제목': 'a'}, index=0))
+
+    assert reporter.context is None
+    assert reporter.done == 1
+
+def test_reporter_streams_chunks_with_progress():
+    """Each advance sends a progress notification and, in stream mode, the item itself"""
+    reporter = ProgressReporter("search_news_detail", total=2, stream=True)
+    reporter.context = _FakeContext()
+
+    async def run():
+        await reporter.advance({'제목': 'b'}, index=1)
+        await reporter.advance({'제목': 'a'}, index=0)
+
+    asyncio.run(run())
+
+    assert reporter.context.progress == [(1, 2), (2, 2)]
+    assert [m["index"] for m in reporter.context.request_context.session.messages] == [1, 0]
+
+def test_reporter_without_stream_sends_progress_only():
+    """Without stream mode only progress notifications are sent"""
+    reporter = ProgressReporter("search_news_detail", total=1)
+    reporter.context = _FakeContext()
+
+    asyncio.run(reporter.advance({'제목': 'a'}, index=0))
+
+    assert reporter.context.progress == [(1, 1)]
+    assert reporter.context.request_context.session.messages == []
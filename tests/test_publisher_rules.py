@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from mcp_naver_news.utils.publisher_rules import (
+    PublisherRegistry,
+    Selector,
+    load_publisher_registry,
+    parse_selector,
+)
+
+
+def test_parse_selector():
+    """Compact tag#id.class selectors are parsed into Selector fields"""
+    assert parse_selector("div#articletxt") == Selector(name="div", id="articletxt")
+    assert parse_selector("article.story-news") == Selector(name="article", class_="story-news")
+    assert parse_selector("#textBody") == Selector(id="textBody")
+
+    with pytest.raises(ValueError):
+        parse_selector("div > p")
+
+def test_lookup_walks_parent_domains():
+    """Subdomains resolve to the most specific registered domain"""
+    registry = load_publisher_registry()
+
+    assert registry.lookup("n.news.naver.com")[0] == "news.naver.com"
+    assert registry.lookup("www.hankyung.com:443")[0] == "hankyung.com"
+    assert registry.lookup("blog.naver.com") is None
+    assert registry.lookup("localhost") is None
+
+def test_builtin_rules_keep_original_publishers():
+    """The bundled data file covers the publishers that used to be hard-coded"""
+    registry = load_publisher_registry()
+
+    for domain in ("news.naver.com", "nspna.com", "yna.co.kr", "hankyung.com"):
+        assert domain in registry.domains()
+    assert "div" in registry.rules["nspna.com"].strip
+
+def test_extra_rules_file_overrides_builtin(tmp_path):
+    """Rules from NAVER_NEWS_PUBLISHER_RULES_PATH replace built-in rules for the same domain"""
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({
+        "hankyung.com": {"name": "한국경제", "selectors": ["div.new-body"], "strip": []},
+        "example.kr": {"selectors": ["main"]}
+    }), encoding="utf-8")
+
+    registry = load_publisher_registry(str(path))
+
+    assert registry.rules["hankyung.com"].selectors == (Selector(name="div", class_="new-body"),)
+    assert registry.rules["hankyung.com"].strip == ()
+    assert registry.lookup("www.example.kr")[0] == "example.kr"
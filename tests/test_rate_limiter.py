@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from mcp_naver_news.utils.rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    QuotaExceededError,
+    QuotaTracker,
+    RateLimiter,
+)
+from mcp_naver_news.utils.state_store import SqliteStateStore
+
+
+def test_bursts_are_queued_and_smoothed():
+    """Requests beyond the burst wait for tokens instead of failing"""
+    limiter = RateLimiter(rate_per_second=50, burst=2)
+
+    async def run():
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire() for _ in range(7)))
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+
+    # 버스트 2개 이후 나머지 5개는 초당 50개 속도로 배출
+    assert 0.08 <= elapsed < 0.5
+
+def test_interactive_requests_jump_ahead_of_bulk():
+    """Queued interactive requests are released before queued bulk requests"""
+    limiter = RateLimiter(rate_per_second=100, burst=1)
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    async def run():
+        await limiter.acquire()
+        bulk = [asyncio.ensure_future(request(f"bulk{i}", PRIORITY_BULK)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(request("interactive", PRIORITY_INTERACTIVE))
+        await asyncio.gather(*bulk, interactive)
+
+    asyncio.run(run())
+
+    assert order[0] == "interactive"
+
+def test_quota_persists_across_restarts(tmp_path):
+    """Daily usage is reloaded from disk and resets when the KST date changes"""
+    path = str(tmp_path / "quota.json")
+    day = ["2026-10-18"]
+    quota = QuotaTracker(daily_limit=3, path=path, today=lambda: day[0])
+    quota.consume(2)
+    quota.close()
+
+    reloaded = QuotaTracker(daily_limit=3, path=path, today=lambda: day[0])
+    assert reloaded.remaining() == 1
+
+    day[0] = "2026-10-19"
+    assert reloaded.remaining() == 3
+
+def test_quota_file_is_written_in_batches(tmp_path):
+    """Usage is persisted every save_every calls or save_interval seconds, and the rest on close"""
+    path = tmp_path / "quota.json"
+    now = [0.0]
+    quota = QuotaTracker(daily_limit=100, path=str(path), save_every=3, save_interval=60, clock=lambda: now[0])
+
+    quota.consume()
+    quota.consume()
+    assert not path.exists()
+    quota.consume()
+    assert json.loads(path.read_text())["used"] == 3
+
+    quota.consume()
+    now[0] = 61.0
+    quota.consume()
+    assert json.loads(path.read_text())["used"] == 5
+
+    quota.consume()
+    RateLimiter(quota=quota).close()
+    assert json.loads(path.read_text())["used"] == 6
+
+def test_exhausted_quota_fails_fast(tmp_path):
+    """Once the daily quota is spent, acquire raises instead of queueing"""
+    quota = QuotaTracker(daily_limit=1, path=str(tmp_path / "quota.json"))
+    limiter = RateLimiter(rate_per_second=100, burst=5, quota=quota)
+
+    async def run():
+        await limiter.acquire()
+        await limiter.acquire()
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(run())
+    assert limiter.status()["remaining_today"] == 0
+
+
+def test_shared_quota_store_is_used_off_the_event_loop(tmp_path):
+    """With a shared store, quota reads and increments run in a worker thread, and exhaustion still fails fast"""
+    store = SqliteStateStore(str(tmp_path / "state.sqlite3"))
+    threads = []
+    incr = store.incr
+
+    def recording_incr(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return incr(*args, **kwargs)
+
+    store.incr = recording_incr
+    limiter = RateLimiter(rate_per_second=100, burst=5, quota=QuotaTracker(daily_limit=2, store=store))
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire()
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(run())
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+    assert limiter.status()["used_today"] == 2
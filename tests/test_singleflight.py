@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from mcp_naver_news.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_result():
+    """N concurrent callers with one key trigger a single upstream call"""
+    flights = SingleFlight()
+    calls = []
+
+    async def upstream():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"items": []}
+
+    async def run():
+        return await asyncio.gather(*(flights.do("q", upstream) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert flights.coalesced == 9
+    assert all(result is results[0] for result in results)
+    assert len(flights) == 0
+
+def test_errors_propagate_to_every_waiter():
+    """A failing upstream call raises in every coalesced caller"""
+    flights = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(*(flights.do("q", upstream) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Cancelling one waiter leaves the shared call running for the others"""
+    flights = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flights.do("q", upstream))
+        second = asyncio.ensure_future(flights.do("q", upstream))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+def test_orphaned_speculative_call_is_cancelled():
+    """A speculative waiter cancels the shared call when nobody else waits, but not when another caller joined"""
+    flights = SingleFlight()
+    cancelled = []
+
+    async def upstream():
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return "done"
+
+    async def run():
+        alone = asyncio.ensure_future(flights.do("a", upstream, cancel_orphaned=True))
+        shared = asyncio.ensure_future(flights.do("b", upstream, cancel_orphaned=True))
+        joined = asyncio.ensure_future(flights.do("b", upstream))
+        await asyncio.sleep(0.01)
+        alone.cancel()
+        shared.cancel()
+        await asyncio.gather(alone, shared, return_exceptions=True)
+        # 취소된 작업에 새 호출이 합류하지 않고 새로 시작
+        again = await flights.do("a", upstream)
+        return again, await joined
+
+    assert asyncio.run(run()) == ("done", "done")
+    assert cancelled == [1]
+    assert len(flights) == 0
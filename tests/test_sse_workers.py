@@ -0,0 +1,70 @@
+import asyncio
+import json
+import threading
+
+import httpx
+from fastmcp import FastMCP
+
+from mcp_naver_news.utils.sse_workers import build_worker_app
+from mcp_naver_news.utils.state_store import SqliteStateStore
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "test", "version": "0"}}
+}
+
+
+def test_messages_are_forwarded_to_the_worker_owning_the_session(tmp_path):
+    """A POST that lands on another worker reaches the worker holding the SSE stream"""
+    path = str(tmp_path / "state.sqlite3")
+    server = FastMCP("test")
+    owner_store = SqliteStateStore(path)
+    writers = []
+    store_set = owner_store.set
+
+    def recording_set(*args, **kwargs):
+        writers.append(threading.get_ident())
+        store_set(*args, **kwargs)
+
+    owner_store.set = recording_set
+    owner = build_worker_app(server, owner_store)
+    other = build_worker_app(server, SqliteStateStore(path))
+
+    async def run():
+        async with owner.router.lifespan_context(owner), other.router.lifespan_context(other):
+            owner_address = owner.state.session_router.address
+            other_address = other.state.session_router.address
+            async with httpx.AsyncClient(timeout=5) as client:
+                async with client.stream("GET", f"http://{owner_address}/sse") as stream:
+                    lines = stream.aiter_lines()
+                    endpoint = None
+                    async for line in lines:
+                        if line.startswith("data: "):
+                            endpoint = line[len("data: "):]
+                            break
+                    response = await client.post(f"http://{other_address}{endpoint}", content=json.dumps(INITIALIZE))
+                    async for line in lines:
+                        if line.startswith("data: "):
+                            return response.status_code, json.loads(line[len("data: "):])
+                    return response.status_code, None
+
+    status, message = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert status == 202
+    assert message["id"] == 1
+    assert message["result"]["serverInfo"]["name"] == "test"
+    # 세션 등록과 측정값 공유는 이벤트 루프 스레드에서 저장소에 쓰지 않음
+    assert writers and threading.get_ident() not in writers
+
+def test_unknown_session_is_rejected(tmp_path):
+    """Messages for a session no worker holds get the transport's 404"""
+    app = build_worker_app(FastMCP("test"), SqliteStateStore(str(tmp_path / "state.sqlite3")))
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/messages/?session_id=" + "0" * 32, content=json.dumps(INITIALIZE))
+
+    assert asyncio.run(run()).status_code == 404
@@ -0,0 +1,77 @@
+import asyncio
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+from mcp_naver_news import server
+from mcp_naver_news.apis.client import NaverNewsClient
+
+IMPORT_CHECK = (
+    "import json, sys; import mcp_naver_news.server as server; "
+    "print(json.dumps({'requests': 'requests' in sys.modules, 'lxml': 'lxml.etree' in sys.modules, "
+    "'context': server._context is not None}))"
+)
+
+
+def test_server_import_has_no_side_effects(tmp_path):
+    """Importing the server builds no clients and loads neither requests nor lxml, even without credentials"""
+    env = {key: value for key, value in os.environ.items() if not key.startswith("X_NAVER_")}
+    env["NAVER_NEWS_ARTICLE_CACHE_PATH"] = str(tmp_path / "articles.sqlite3")
+    env["NAVER_NEWS_ARCHIVE_PATH"] = str(tmp_path / "archive.sqlite3")
+    env["NAVER_NEWS_WATCHLIST_PATH"] = str(tmp_path / "watchlist.json")
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK], env=env, capture_output=True, text=True, check=True, cwd=str(tmp_path)
+    )
+    assert json.loads(output.stdout.strip().splitlines()[-1]) == {"requests": False, "lxml": False, "context": False}
+    assert not (tmp_path / "articles.sqlite3").exists()
+    assert not (tmp_path / "archive.sqlite3").exists()
+    assert not (tmp_path / "watchlist.json").exists()
+
+
+def test_sessions_share_one_context_until_the_last_one_ends(monkeypatch):
+    """Concurrent lifespans reuse a single context, which is closed after the last session"""
+    monkeypatch.setenv("X_NAVER_CLIENT_ID", "test")
+    monkeypatch.setenv("X_NAVER_CLIENT_SECRET", "test")
+    monkeypatch.setenv("NAVER_NEWS_ARTICLE_CACHE_PATH", "")
+    monkeypatch.setenv("NAVER_NEWS_ARCHIVE_PATH", "")
+    monkeypatch.setenv("NAVER_NEWS_WATCHLIST_PATH", "")
+    monkeypatch.setenv("NAVER_NEWS_API_QUOTA_STATE_PATH", "")
+    monkeypatch.setattr(server, "_context", None)
+    monkeypatch.setattr(server, "_context_users", 0)
+
+    async def run():
+        async with server.naver_news_lifespan(server.mcp) as first:
+            async with server.naver_news_lifespan(server.mcp) as second:
+                assert first is second
+            assert server._context is first
+        assert server._context is None
+        return first
+
+    ctx = asyncio.run(run())
+    assert ctx.article_client.is_closed
+
+
+def test_unusable_archive_is_disabled_instead_of_failing_startup(monkeypatch, tmp_path):
+    """A SQLite build without FTS5 trigram support only turns the archive off"""
+    from mcp_naver_news.utils import article_archive
+
+    def unsupported(*args, **kwargs):
+        raise sqlite3.OperationalError("no such tokenizer: trigram")
+
+    monkeypatch.setattr(article_archive, "ArticleArchive", unsupported)
+    config = server.NaverNewsConfig(
+        client_id="test",
+        client_secret="test",
+        article_cache_path="",
+        api_quota_state_path="",
+        archive_path=str(tmp_path / "archive.sqlite3"),
+        watchlist_path=""
+    )
+
+    context = server.NaverNewsContext(client=NaverNewsClient(config=config))
+
+    assert context.article_archive is None
+    assert context.news is not None
+    asyncio.run(context.aclose())
@@ -0,0 +1,98 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.utils.cache import SharedTTLCache
+from mcp_naver_news.utils.rate_limiter import QuotaExceededError, QuotaTracker
+from mcp_naver_news.utils.state_store import SqliteStateStore, load_state_store
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_values_expire_and_are_visible_to_other_connections(tmp_path):
+    """A value written by one worker is read by another until its TTL passes"""
+    path = str(tmp_path / "state.sqlite3")
+    clock = _FakeClock()
+    writer = SqliteStateStore(path, clock=clock)
+    reader = SqliteStateStore(path, clock=clock)
+
+    writer.set("search", "k", {"items": [1, 2]}, ttl=10)
+    assert reader.get("search", "k") == {"items": [1, 2]}
+    assert reader.count("search") == 1
+
+    clock.now += 11
+    assert reader.get("search", "k") is None
+    assert reader.count("search") == 0
+
+def test_incr_is_atomic_and_capped_across_connections(tmp_path):
+    """Concurrent increments from separate connections never exceed the limit"""
+    path = str(tmp_path / "state.sqlite3")
+    stores = [SqliteStateStore(path) for _ in range(4)]
+    granted = []
+
+    def worker(store):
+        for _ in range(20):
+            if store.incr("quota", "day", 1, limit=50) is not None:
+                granted.append(1)
+
+    threads = [threading.Thread(target=worker, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(granted) == 50
+    assert stores[0].get("quota", "day") == 50
+
+def test_shared_search_cache_is_trimmed_to_maxsize(tmp_path):
+    """The shared cache keeps at most maxsize entries, preferring the longest-lived ones"""
+    store = SqliteStateStore(str(tmp_path / "state.sqlite3"))
+    cache = SharedTTLCache(store, maxsize=2)
+    cache.TRIM_EVERY = 1
+    cache.set(("a", 10), {"v": 1}, ttl=10)
+    cache.set(("b", 10), {"v": 2}, ttl=30)
+    cache.set(("c", 10), {"v": 3}, ttl=20)
+
+    assert len(cache) == 2
+    assert cache.get(("a", 10)) is None
+    assert cache.get(("b", 10)) == {"v": 2}
+    assert cache.stats()["hits"] == 1
+
+def test_quota_is_shared_between_workers(tmp_path):
+    """Two trackers on the same store spend one daily quota together"""
+    store = SqliteStateStore(str(tmp_path / "state.sqlite3"))
+    first = QuotaTracker(daily_limit=3, today=lambda: "2026-10-18", store=store)
+    second = QuotaTracker(daily_limit=3, today=lambda: "2026-10-18", store=SqliteStateStore(store.path))
+
+    first.consume(2)
+    assert second.remaining() == 1
+    second.consume()
+    with pytest.raises(QuotaExceededError):
+        first.consume()
+    assert first.used == 3
+
+def test_external_store_factory_is_loaded(tmp_path, monkeypatch):
+    """NAVER_NEWS_STATE_STORE accepts a module:factory reference returning a StateStore"""
+    backend = types.ModuleType("fake_state_backend")
+    backend.create = lambda config: SqliteStateStore(str(tmp_path / "external.sqlite3"))
+    backend.broken = lambda config: object()
+    monkeypatch.setitem(sys.modules, "fake_state_backend", backend)
+
+    def config(state_store):
+        return NaverNewsConfig(client_id="id", client_secret="secret", state_store=state_store)
+
+    assert load_state_store(config("")) is None
+    assert load_state_store(config("fake_state_backend:create")).path.endswith("external.sqlite3")
+    with pytest.raises(ValueError):
+        load_state_store(config("fake_state_backend:broken"))
+    with pytest.raises(ValueError):
+        load_state_store(config("redis"))
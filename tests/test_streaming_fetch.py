@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from mcp_naver_news.utils import article_extractor
+from mcp_naver_news.utils.article_extractor import aextract_article_content
+from mcp_naver_news.utils.extraction_engine import (
+    DEFAULT_RULE,
+    FALLBACK_RULES,
+    ExtractionEngine,
+    StreamingExtraction,
+    default_engine,
+)
+from mcp_naver_news.utils.publisher_rules import load_publisher_registry
+
+BODY = "본문 " * 60
+PAGE_HEAD = f"<html><head><title>제목</title></head><body><div id='articletxt'>{BODY}</div>".encode()
+FILLER = b"<div class='ad'>" + b"x" * 4000 + b"</div>"
+
+
+def _serve(chunks, pulled):
+    async def body():
+        for chunk in chunks:
+            pulled.append(len(chunk))
+            yield chunk
+
+    return httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+def test_download_stops_once_article_body_closes():
+    """The remaining page is not downloaded after the target container closes"""
+    chunks = [PAGE_HEAD] + [FILLER] * 50 + [b"</body></html>"]
+    pulled = []
+
+    async def run():
+        async with httpx.AsyncClient(transport=_serve(chunks, pulled)) as client:
+            return await aextract_article_content("https://www.hankyung.com/article/1", client=client)
+
+    result = asyncio.run(run())
+
+    assert result["title"] == "제목"
+    assert result["content"] == BODY.strip()
+    assert len(pulled) < len(chunks)
+
+def test_concurrent_streams_parse_on_separate_threads(monkeypatch):
+    """Each document keeps one parser thread, while different documents parse in parallel"""
+    threads = {}
+    feed = StreamingExtraction.feed
+
+    def recording_feed(self, chunk):
+        threads.setdefault(id(self), set()).add(threading.get_ident())
+        return feed(self, chunk)
+
+    monkeypatch.setattr(StreamingExtraction, "feed", recording_feed)
+    monkeypatch.setattr(
+        article_extractor, "_STREAM_PARSE_EXECUTORS", tuple(ThreadPoolExecutor(max_workers=1) for _ in range(2))
+    )
+    chunks = [FILLER] * 5 + [PAGE_HEAD, b"</body></html>"]
+
+    async def run():
+        async with httpx.AsyncClient(transport=_serve(chunks, [])) as client:
+            return await asyncio.gather(*(
+                aextract_article_content(f"https://www.hankyung.com/article/{i}", client=client) for i in range(2)
+            ))
+
+    results = asyncio.run(run())
+
+    assert all(result["content"] == BODY.strip() for result in results)
+    assert all(len(used) == 1 for used in threads.values())
+    assert len(set.union(*threads.values())) == 2
+
+def test_byte_limit_truncates_and_extracts_partial_page():
+    """Pages larger than the byte limit are cut off and parsed from what was read"""
+    engine = ExtractionEngine(load_publisher_registry(), DEFAULT_RULE, FALLBACK_RULES, stream_max_bytes=20000)
+    html = f"<title>t</title><div id='news_content'>{BODY}</div>".encode() + FILLER * 50
+    pulled = []
+
+    async def run():
+        async with httpx.AsyncClient(transport=_serve([html[i:i + 4096] for i in range(0, len(html), 4096)], pulled)) as client:
+            return await aextract_article_content("https://unknown.example.com/1", client=client, engine=engine)
+
+    result = asyncio.run(run())
+
+    assert result["content"] == BODY.strip()
+    assert sum(pulled) < len(html)
+
+def test_empty_target_does_not_stop_early():
+    """An empty leading container keeps reading so fallbacks can see the whole page"""
+    document = default_engine.stream("https://www.hankyung.com/article/1")
+
+    done = document.feed(b"<title>t</title><div id='articletxt'></div><div>")
+
+    assert not done
+    document.feed(f"<div id='content'>{BODY}</div></div>".encode())
+    assert document.result()["content"] == BODY.strip()
+
+def test_nested_match_waits_for_outer_container():
+    """An inner element matching the selector does not stop reading while an outer match is open"""
+    document = default_engine.stream("https://unknown.example.com/1")
+
+    assert not document.feed(f"<title>t</title><article>앞<article>{BODY}</article>".encode())
+    assert document.feed("뒤</article>".encode())
+
+def test_charset_from_content_type_header():
+    """Non UTF-8 pages are decoded with the charset from the Content-Type header"""
+    html = f"<title>제목 똠</title><div id='articletxt'>{BODY}</div>".encode("cp949")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=html, headers={"Content-Type": "text/html; charset=EUC-KR"})
+    )
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await aextract_article_content("https://www.hankyung.com/article/1", client=client)
+
+    result = asyncio.run(run())
+
+    assert result["title"] == "제목 똠"
+    assert result["content"] == BODY.strip()
+
+def test_charset_from_meta_tag_and_utf8_default():
+    """Without a header charset, a <meta charset> is honoured and UTF-8 is the default"""
+    euc_kr = default_engine.stream("https://www.hankyung.com/article/1")
+    euc_kr.feed(f"<meta charset='euc-kr'><title>제목</title><div id='articletxt'>{BODY}</div>".encode("euc-kr"))
+    utf8 = default_engine.stream("https://www.hankyung.com/article/1")
+    utf8.feed(f"<title>제목</title><div id='articletxt'>{BODY}</div>".encode())
+
+    assert euc_kr.result()["title"] == "제목"
+    assert utf8.result()["title"] == "제목"
@@ -0,0 +1,185 @@
+import asyncio
+import json
+from email.utils import format_datetime
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from mcp_naver_news.config import NaverNewsConfig
+from mcp_naver_news.tools.watchlist_tools import poll_watchlist, watch_news
+from mcp_naver_news.utils.state_store import SqliteStateStore
+from mcp_naver_news.utils.watchlist import Watchlist
+
+START = 1_760_000_000.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+
+class FakeNews:
+    """Serves date-sorted results for one query and records every API call"""
+
+    def __init__(self):
+        self.articles = []
+        self.calls = []
+
+    def publish(self, count, at):
+        for _ in range(count):
+            number = len(self.articles) + 1
+            self.articles.insert(0, {
+                "title": f"기사 {number}",
+                "link": f"https://n.news.naver.com/mnews/article/001/{number}",
+                "originallink": f"https://www.example.com/article/{number}",
+                "description": "요약",
+                "pubDate": format_datetime(datetime.fromtimestamp(at, timezone.utc)),
+            })
+
+    async def asearch_news(self, query, display, start, sort, priority=None):
+        self.calls.append((query, display, start, sort))
+        return {"items": [dict(item) for item in self.articles[start - 1:start - 1 + display]]}
+
+
+def _poll(watchlist, news, **kwargs):
+    return asyncio.run(watchlist.poll(news, **kwargs))
+
+
+def _titles(results):
+    return [[item["title"] for item in items] for _, items, _ in results]
+
+
+def test_first_poll_is_a_baseline_and_later_polls_return_only_new_articles(tmp_path):
+    """Existing articles are not reported, and new ones are found by paging only until a seen article"""
+    clock, news = FakeClock(), FakeNews()
+    news.publish(300, START - 600)
+    watchlist = Watchlist(str(tmp_path / "watchlist.json"), clock=clock)
+    watchlist.add(["반도체", " 반도체 "])
+
+    assert _titles(_poll(watchlist, news)) == [[]]
+    clock.now += 600
+    news.publish(3, clock.now - 60)
+    news.calls.clear()
+
+    assert _titles(_poll(watchlist, news)) == [["기사 303", "기사 302", "기사 301"]]
+    assert news.calls == [("반도체", 10, 1, "date")]
+
+
+def test_a_burst_is_paged_with_full_pages(tmp_path):
+    """More new articles than the first page holds are collected from further pages"""
+    clock, news = FakeClock(), FakeNews()
+    news.publish(50, START - 600)
+    watchlist = Watchlist(str(tmp_path / "watchlist.json"), clock=clock)
+    watchlist.add(["반도체"])
+    _poll(watchlist, news)
+    clock.now += 600
+    news.publish(130, clock.now - 60)
+    news.calls.clear()
+
+    [(_, items, _)] = _poll(watchlist, news)
+
+    assert len(items) == 130
+    assert [call[1:3] for call in news.calls] == [(10, 1), (100, 11), (100, 111)]
+
+
+def test_intervals_follow_each_keywords_activity(tmp_path):
+    """Quiet keywords back off towards the maximum interval, busy ones are checked more often, and keywords not due are skipped"""
+    clock = FakeClock()
+    quiet, busy = FakeNews(), FakeNews()
+    quiet.publish(5, START - 600)
+    busy.publish(5, START - 600)
+    watchlist = Watchlist(str(tmp_path / "watchlist.json"), min_interval=300, max_interval=3600, clock=clock)
+    watchlist.add(["조용한"])
+    _poll(watchlist, quiet)
+    watchlist.add(["바쁜"])
+    _poll(watchlist, busy, queries=["바쁜"])
+
+    for _ in range(4):
+        clock.now += 3600
+        busy.publish(60, clock.now - 30)
+        _poll(watchlist, quiet, queries=["조용한"], force=True)
+        _poll(watchlist, busy, queries=["바쁜"], force=True)
+
+    intervals = {state.query: state.interval for state in watchlist.states()}
+    assert intervals == {"조용한": 3600, "바쁜": 300}
+
+    clock.now += 301
+    calls = len(quiet.calls)
+    assert [state.query for state, _, _ in _poll(watchlist, quiet)] == ["바쁜"]
+    assert len(quiet.calls) == calls + 1
+
+
+def test_state_persists_in_a_file_or_the_shared_store(tmp_path):
+    """A restarted server or another worker continues from the saved high-water mark"""
+    for make in (
+        lambda clock: Watchlist(str(tmp_path / "watchlist.json"), clock=clock),
+        lambda clock: Watchlist(store=SqliteStateStore(str(tmp_path / "state.sqlite3")), clock=clock),
+    ):
+        clock, news = FakeClock(), FakeNews()
+        news.publish(20, START - 600)
+        watchlist = make(clock)
+        watchlist.add(["반도체"])
+        _poll(watchlist, news)
+        clock.now += 600
+        news.publish(2, clock.now - 60)
+
+        restarted = make(clock)
+
+        assert _titles(_poll(restarted, news)) == [["기사 22", "기사 21"]]
+        assert restarted.remove(["반도체"]) == ["반도체"]
+        assert make(clock).states() == []
+
+
+def test_overlapping_polls_check_each_keyword_once(tmp_path):
+    """Concurrent poll() calls, in one process or across workers sharing a store, never poll the same keyword twice"""
+    store = SqliteStateStore(str(tmp_path / "state.sqlite3"))
+    for first, second in (
+        (Watchlist(str(tmp_path / "watchlist.json"), clock=FakeClock()),) * 2,
+        (Watchlist(store=store, clock=FakeClock()), Watchlist(store=store, clock=FakeClock())),
+    ):
+        clock, news = first.clock, FakeNews()
+        second.clock = clock
+        news.publish(20, START - 600)
+        first.add(["반도체"])
+        _poll(first, news)
+        clock.now += 600
+        news.publish(2, clock.now - 60)
+        news.calls.clear()
+
+        async def run():
+            return await asyncio.gather(first.poll(news), second.poll(news))
+
+        results = asyncio.run(run())
+
+        assert sorted(_titles(results[0]) + _titles(results[1])) == [["기사 22", "기사 21"]]
+        assert len(news.calls) == 1
+        assert [state.api_calls for state in second.states()] == [2]
+        assert _poll(second, news, force=True)[0][1] == []
+
+
+def test_tools_manage_and_poll_the_watchlist(tmp_path):
+    """watch_news edits the list and poll_watchlist groups new articles by keyword with the API calls spent"""
+    clock, news = FakeClock(), FakeNews()
+    news.publish(20, START - 600)
+    config = NaverNewsConfig(client_id="test", client_secret="test")
+    lifespan_context = SimpleNamespace(
+        client=SimpleNamespace(config=config),
+        news=news,
+        watchlist=Watchlist(str(tmp_path / "watchlist.json"), clock=clock)
+    )
+    ctx = SimpleNamespace(request_context=SimpleNamespace(lifespan_context=lifespan_context))
+
+    listed = json.loads(asyncio.run(watch_news(queries=["반도체"], ctx=ctx)).text)
+    assert listed["추가"] == ["반도체"]
+    assert listed["관심검색어"][0]["다음확인"] == "즉시"
+
+    asyncio.run(poll_watchlist(ctx=ctx))
+    clock.now += 600
+    news.publish(1, clock.now - 60)
+    result = json.loads(asyncio.run(poll_watchlist(fields=["title"], ctx=ctx)).text)
+
+    assert result["새기사"] == [{"검색어": "반도체", "기사": [{"제목": "기사 21"}]}]
+    assert result["확인한검색어"] == 1
+    assert result["API호출"] == 1